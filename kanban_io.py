@@ -12,17 +12,37 @@ Audit-driven foundation for tools.py mutations:
   sync_kanban (a root module) needs them too, and importing the
   `kanbanger` package from sync_kanban would drag the mcp SDK into a
   module that is otherwise runnable with just requests + dotenv.
+- P1: process-wide parsed-board cache (load_board) keyed on the board
+  file's stat identity, so repeated reads of an unchanged board skip
+  both the I/O and the re-split.
+- P2: Board, the single-pass board model (column order, section spans,
+  task records) every tool and sync_kanban.LocalBoard.parse work against.
+- P5: GroupCommitter — concurrent in-process mutations share one lock,
+  one board and one atomic write.
+- P6: durability modes (strict / default / fdatasync / relaxed) for the
+  atomic writers, per call, per workspace or via KANBANGER_DURABILITY.
+- P7: shared reader locks (kanban_lock(shared=True), read_board) so reads
+  take one consistent snapshot without serializing against each other.
+- P8: lock acquire timeouts (LockTimeoutError), holder records in the
+  lock file, and per-process wait / hold histograms (lock_stats).
+- P9: Board.version, a content-hash token for optimistic concurrency.
 """
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
 import os
 import re
 import sys
 import tempfile
+import threading
+import time
 import uuid
+from concurrent.futures import Future
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Iterator, Optional, Tuple
 
@@ -134,6 +154,488 @@ def insert_board_key(text: str, board_key: str) -> str:
     return "".join(lines)
 
 
+# ---------------------------------------------------------------------------
+# Task identity markers (P23)
+#
+# Sync state pairs board tasks with GitHub items by title, so a rename
+# used to cost archive + create and dropped the item's remote history.
+# Opt-in (KANBANGER_TASK_IDS=1), add_task appends a minted id to the task
+# line as a trailing HTML comment — the board-key technique, per task:
+#
+#   *   [ ] Title - description <!-- kanbanger:task-id: <id> -->
+#
+# The marker is invisible in rendered markdown. The shared parser strips
+# it before title / description extraction, so titles never carry it,
+# and it is READ whatever the env says: a board with markers keeps
+# working when the flag is off. Moves keep the raw line, so the id
+# travels with the task.
+# ---------------------------------------------------------------------------
+
+TASK_IDS_ENV = "KANBANGER_TASK_IDS"
+
+# Same tolerant alphabet as board keys; anchored to the end of the line.
+_TASK_ID_RE = re.compile(
+    r"\s*<!--\s*kanbanger:task-id:\s*([0-9A-Za-z-]{8,64})\s*-->\s*$"
+)
+
+
+def task_ids_enabled() -> bool:
+    """True when KANBANGER_TASK_IDS asks add_task to mint task ids."""
+    return os.getenv(TASK_IDS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def mint_task_id() -> str:
+    """Return a fresh task id: the first 12 hex chars of a uuid4.
+
+    Ids only need to be unique within one board; 48 random bits keep
+    the marker short on every task line.
+    """
+    return uuid.uuid4().hex[:12]
+
+
+def format_task_id_marker(task_id: str) -> str:
+    """Render the trailing HTML-comment marker carrying `task_id`."""
+    return f"<!-- kanbanger:task-id: {task_id} -->"
+
+
+def split_task_id(line: str) -> Tuple[str, Optional[str]]:
+    """Return (`line` without its task-id marker, the id or None)."""
+    match = _TASK_ID_RE.search(line)
+    if match is None:
+        return line, None
+    return line[:match.start()], match.group(1)
+
+
+# ---------------------------------------------------------------------------
+# Board model (P2)
+#
+# add/move/delete, the review-gate primitives, list_tasks, kanban://stats
+# and sync_kanban.LocalBoard.parse each used to walk the raw line list with
+# their own loop. Board is the one single-pass parse they now share: column
+# order, every `## section` span, and one TaskRecord per task line, all
+# pointing into the same `lines` list the file round-trips through.
+#
+# Parse rules are the historical ones, unchanged: a column header is a line
+# whose stripped form starts with `## `; a task is any line
+# parse_task_title_with_description accepts (stripped form starts with
+# `*`) that sits UNDER a header — lines above the first header are never
+# tasks. serialize() is `"\n".join(lines)`, so parse -> serialize is
+# byte-identical (CRLF, trailing newline and stray whitespace included).
+#
+# Edits go through the line primitives (insert_line / pop_line /
+# replace_section_body), which keep every span and record index in step
+# with the list instead of re-scanning it.
+#
+# P3: title lookups (find / find_in_column, hence _find_task_column and
+# the review-gate tools) go through a hash index title -> [TaskRecord] in
+# document order. The index holds the record OBJECTS, and a line shift
+# updates record.line in place, so an edit only patches the index for the
+# one record it adds or drops — it is never rebuilt.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ColumnSection:
+    """One `## name` section: header line index, exclusive end index."""
+
+    name: str
+    header: int
+    end: int
+
+
+@dataclass
+class TaskRecord:
+    """One task line: its column, section, line index and parsed parts."""
+
+    column: str
+    section: int
+    line: int
+    title: str
+    description: Optional[str]
+    # P23: the line's task-id marker, if any.
+    task_id: Optional[str] = None
+
+
+def _line_key(record: TaskRecord) -> int:
+    return record.line
+
+
+class Board:
+    """Single-pass parsed view of a kanban board (P2).
+
+    lines:    the file split on "\n" — the unit every edit works in.
+    columns:  `## section` names in document order, first occurrence only
+              (the discover_columns contract).
+    sections: every header in document order, duplicates included, with
+              its line span.
+    tasks:    TaskRecords in document order.
+
+    Title lookups are O(1) through the P3 index (`_by_title`); the first
+    section per column name is likewise precomputed.
+
+    Boards handed out by load_board are SHARED cache entries and frozen:
+    mutate a `copy()`.
+    """
+
+    def __init__(self, lines) -> None:
+        self.lines: list = list(lines)
+        self.columns: list = []
+        self.sections: list = []
+        self.tasks: list = []
+        self._by_title: dict = {}
+        self._first_section: dict = {}
+        self._text: Optional[str] = None
+        self._version: Optional[str] = None
+        self._frozen = False
+        self.modified = False
+        self._parse()
+        self._build_index()
+
+    @classmethod
+    def parse(cls, text: str) -> "Board":
+        board = cls(text.split("\n"))
+        board._text = text
+        return board
+
+    def _parse(self) -> None:
+        sections = self.sections
+        for i, line in enumerate(self.lines):
+            stripped = line.strip()
+            if stripped.startswith("## "):
+                name = stripped[3:].strip()
+                if sections:
+                    sections[-1].end = i
+                sections.append(ColumnSection(name, i, len(self.lines)))
+                if name not in self.columns:
+                    self.columns.append(name)
+                continue
+            if not sections:
+                continue
+            parsed = parse_task_title_with_description(line)
+            if parsed is not None:
+                self.tasks.append(TaskRecord(
+                    sections[-1].name, len(sections) - 1, i,
+                    parsed[0], parsed[1], split_task_id(line)[1],
+                ))
+
+    def _build_index(self) -> None:
+        for sec in self.sections:
+            self._first_section.setdefault(sec.name, sec)
+        for record in self.tasks:
+            self._by_title.setdefault(record.title, []).append(record)
+
+    def _index_add(self, record: TaskRecord) -> None:
+        bucket = self._by_title.setdefault(record.title, [])
+        bucket.insert(bisect.bisect_left(bucket, record.line, key=_line_key),
+                      record)
+
+    def _index_drop(self, record: TaskRecord) -> None:
+        bucket = self._by_title[record.title]
+        for n, candidate in enumerate(bucket):
+            if candidate is record:
+                del bucket[n]
+                break
+        if not bucket:
+            del self._by_title[record.title]
+
+    # -- reads ------------------------------------------------------------
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.serialize()
+        return self._text
+
+    @property
+    def version(self) -> str:
+        """P9: opaque version token — a hash of the board text.
+
+        Equal tokens mean byte-identical boards, so a client that read
+        version V can make a mutation conditional on the board still being
+        V (`if_version`). Derived from the content rather than a counter
+        stored in the file: nothing extra to write, external editors can't
+        forget to bump it, and reverting an edit restores the old token.
+        Computed once per snapshot (the cached Board keeps it).
+        """
+        if self._version is None:
+            digest = hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+            self._version = digest[:16]
+        return self._version
+
+    def serialize(self) -> str:
+        """Render the board back to file text (byte-identical round trip)."""
+        return "\n".join(self.lines)
+
+    def section(self, column: str) -> Optional[ColumnSection]:
+        """The FIRST section named `column` (where inserts land), or None."""
+        return self._first_section.get(column)
+
+    def section_tasks(self, column: str) -> list:
+        """TaskRecords in the first section named `column`, in order."""
+        sec = self.section(column)
+        if sec is None:
+            return []
+        lo = bisect.bisect_right(self.tasks, sec.header, key=_line_key)
+        hi = bisect.bisect_left(self.tasks, sec.end, key=_line_key)
+        return self.tasks[lo:hi]
+
+    def find(self, title: str) -> Optional[TaskRecord]:
+        """First task with exactly `title`, in document order."""
+        bucket = self._by_title.get(title)
+        return bucket[0] if bucket else None
+
+    def find_in_column(self, column: str, title: str) -> Optional[TaskRecord]:
+        """First task with exactly `title` in the first `column` section."""
+        sec = self._first_section.get(column)
+        if sec is None:
+            return None
+        for record in self._by_title.get(title, ()):
+            if sec.header < record.line < sec.end:
+                return record
+        return None
+
+    # -- edits ------------------------------------------------------------
+
+    def copy(self) -> "Board":
+        """Independent, mutable copy (no re-parse)."""
+        clone = Board.__new__(Board)
+        clone.lines = list(self.lines)
+        clone.columns = list(self.columns)
+        clone.sections = [ColumnSection(s.name, s.header, s.end)
+                          for s in self.sections]
+        clone.tasks = [replace(t) for t in self.tasks]
+        # P3: carry the index over, re-pointed at the clone's records,
+        # rather than re-bucketing every title on each group commit.
+        twins = {id(t): c for t, c in zip(self.tasks, clone.tasks)}
+        twins.update((id(s), c) for s, c in zip(self.sections, clone.sections))
+        clone._by_title = {title: [twins[id(r)] for r in bucket]
+                           for title, bucket in self._by_title.items()}
+        clone._first_section = {name: twins[id(sec)]
+                                for name, sec in self._first_section.items()}
+        clone._text = self._text
+        clone._version = self._version
+        clone._frozen = False
+        clone.modified = False
+        return clone
+
+    def adopt(self, other: "Board") -> None:
+        """Take over `other`'s entire content (commit a staged copy).
+
+        Lets a multi-step edit run on a `copy()` and land on this Board
+        only if every step succeeded — apply_operations' all-or-nothing
+        contract inside a group commit.
+        """
+        self._check_mutable()
+        self.lines = other.lines
+        self.columns = other.columns
+        self.sections = other.sections
+        self.tasks = other.tasks
+        self._by_title = other._by_title
+        self._first_section = other._first_section
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise RuntimeError(
+                "cached Board is shared and read-only; mutate board.copy()"
+            )
+        self._text = None
+        self._version = None
+        self.modified = True
+
+    def _section_at(self, index: int) -> Optional[int]:
+        """Index of the section whose body contains line `index`."""
+        for n in range(len(self.sections) - 1, -1, -1):
+            if self.sections[n].header < index:
+                return n
+        return None
+
+    def _record_for(self, section: Optional[int], index: int,
+                    line: str) -> Optional[TaskRecord]:
+        if section is None:
+            return None
+        parsed = parse_task_title_with_description(line)
+        if parsed is None:
+            return None
+        return TaskRecord(self.sections[section].name, section, index,
+                          parsed[0], parsed[1], split_task_id(line)[1])
+
+    def insert_line(self, index: int, line: str) -> None:
+        """Insert `line` before `lines[index]`, keeping spans in step.
+
+        Column structure is fixed for the Board's lifetime: inserting a
+        `## ` header raises ValueError (ensure_review_column rewrites the
+        text instead).
+        """
+        if line.strip().startswith("## "):
+            raise ValueError("Board.insert_line cannot insert a column header")
+        self._check_mutable()
+        self.lines.insert(index, line)
+        for sec in self.sections:
+            if sec.header >= index:
+                sec.header += 1
+                sec.end += 1
+            elif sec.end >= index:
+                sec.end += 1
+        pos = bisect.bisect_left(self.tasks, index, key=_line_key)
+        for record in self.tasks[pos:]:
+            record.line += 1
+        record = self._record_for(self._section_at(index), index, line)
+        if record is not None:
+            self.tasks.insert(pos, record)
+            self._index_add(record)
+
+    def pop_line(self, index: int) -> str:
+        """Remove and return `lines[index]` (never a header)."""
+        if self.lines[index].strip().startswith("## "):
+            raise ValueError("Board.pop_line cannot remove a column header")
+        self._check_mutable()
+        line = self.lines.pop(index)
+        for sec in self.sections:
+            if sec.header > index:
+                sec.header -= 1
+                sec.end -= 1
+            elif sec.end > index:
+                sec.end -= 1
+        pos = bisect.bisect_left(self.tasks, index, key=_line_key)
+        if pos < len(self.tasks) and self.tasks[pos].line == index:
+            self._index_drop(self.tasks.pop(pos))
+        for record in self.tasks[pos:]:
+            record.line -= 1
+        return line
+
+    def replace_section_body(self, sec: ColumnSection, body: list) -> None:
+        """Replace every line between `sec`'s header and its end."""
+        for line in body:
+            if line.strip().startswith("## "):
+                raise ValueError("section body cannot contain a column header")
+        self._check_mutable()
+        start, stop = sec.header + 1, sec.end
+        delta = len(body) - (stop - start)
+        self.lines[start:stop] = body
+        lo = bisect.bisect_left(self.tasks, start, key=_line_key)
+        hi = bisect.bisect_left(self.tasks, stop, key=_line_key)
+        for record in self.tasks[lo:hi]:
+            self._index_drop(record)
+        del self.tasks[lo:hi]
+        for record in self.tasks[lo:]:
+            record.line += delta
+        for other in self.sections:
+            if other.header >= stop:
+                other.header += delta
+                other.end += delta
+        sec.end += delta
+        section = self.sections.index(sec)
+        fresh = []
+        for offset, line in enumerate(body):
+            record = self._record_for(section, start + offset, line)
+            if record is not None:
+                fresh.append(record)
+        self.tasks[lo:lo] = fresh
+        for record in fresh:
+            self._index_add(record)
+
+    def insert_task(self, column: str, line: str) -> None:
+        """Insert a task line directly under the first `## column` header.
+
+        The move_task / review-gate placement (top of column, no padding).
+        No-op when the column is absent, matching the historical walks.
+        """
+        sec = self.section(column)
+        if sec is not None:
+            self.insert_line(sec.header + 1, line)
+
+    def append_task(self, column: str, line: str) -> None:
+        """Append a task at the bottom of `column`, canonically padded.
+
+        Bug A (add_task): rebuild the section as header -> blank -> tasks
+        (existing order, `*`/`-` lines only) -> new task -> blank. Raises
+        KeyError when the column is absent.
+        """
+        sec = self.section(column)
+        if sec is None:
+            raise KeyError(column)
+        kept = [ln for ln in self.lines[sec.header + 1:sec.end]
+                if ln.strip().startswith(("*", "-"))]
+        kept.append(line)
+        self.replace_section_body(sec, [""] + kept + [""])
+
+    def remove_task(self, record: TaskRecord) -> str:
+        """Remove `record`'s line and return it."""
+        return self.pop_line(record.line)
+
+
+# ---------------------------------------------------------------------------
+# Parsed-board cache (P1)
+#
+# Every tool and resource used to reopen `_kanban.md`, read it whole and
+# re-split it on "\n" — and add/move/delete read it a SECOND time through
+# discover_columns. Agents polling list_tasks / kanban://stats on an
+# unchanged board paid that on every call. The cache below keeps one parsed
+# Board per board path, keyed on the file's stat identity
+# (st_dev, st_ino, st_mtime_ns, st_size):
+#
+#   * in-process writes go through atomic_write_text, which drops the
+#     entry for the written path explicitly;
+#   * external edits (a human in an editor, git checkout, the sync CLI in
+#     another process) change mtime/size — and os.replace-style saves
+#     change the inode — so the stat key no longer matches and the next
+#     load re-reads.
+#
+# Cached Boards are frozen; callers that edit the board work on a copy(),
+# so a cached entry can never be corrupted by a half-finished mutation.
+# ---------------------------------------------------------------------------
+
+
+_BOARD_CACHE: dict = {}
+_BOARD_CACHE_LOCK = threading.Lock()
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def load_board(path) -> Board:
+    """Return the parsed Board at `path`, cached on the file's stat key.
+
+    A cache hit costs one os.stat(). On a miss the file is opened, its
+    stat key taken from the OPEN descriptor (so the key describes the
+    bytes actually read, not a racing replacement), then read and parsed.
+    The returned Board is shared and frozen — `copy()` it to edit.
+
+    Raises whatever open()/read() raise (FileNotFoundError, OSError,
+    UnicodeDecodeError) — callers already map those onto their own
+    structured errors.
+    """
+    cache_key = os.path.abspath(path)
+    try:
+        current = _stat_key(os.stat(cache_key))
+    except OSError:
+        invalidate_board_cache(cache_key)
+        raise
+    with _BOARD_CACHE_LOCK:
+        cached = _BOARD_CACHE.get(cache_key)
+    if cached is not None and cached[0] == current:
+        return cached[1]
+
+    with open(cache_key, "r", encoding="utf-8") as f:
+        read_key = _stat_key(os.fstat(f.fileno()))
+        text = f.read()
+    board = Board.parse(text)
+    board._frozen = True
+    with _BOARD_CACHE_LOCK:
+        _BOARD_CACHE[cache_key] = (read_key, board)
+    return board
+
+
+def invalidate_board_cache(path=None) -> None:
+    """Drop the cached snapshot for `path`, or every snapshot if None."""
+    with _BOARD_CACHE_LOCK:
+        if path is None:
+            _BOARD_CACHE.clear()
+        else:
+            _BOARD_CACHE.pop(os.path.abspath(path), None)
+
+
 def discover_columns(workspace: str) -> list:
     """Return the column names from `_kanban.md` in document order.
 
@@ -151,22 +653,16 @@ def discover_columns(workspace: str) -> list:
     coordination-primitives bundle. This helper just makes validation
     permissive in the same way the parser already is.
 
+    P1: served from the parsed-board cache, so the validation read that
+    precedes a mutation no longer costs a second file read.
+
     Returns an empty list if the file is missing; callers handle
     that by returning their own structured error.
     """
     kanban_path = os.path.join(workspace, _KANBAN_FILENAME)
     if not os.path.exists(kanban_path):
         return []
-    with open(kanban_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    columns = []
-    for line in content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("## "):
-            name = stripped[3:].strip()
-            if name and name not in columns:
-                columns.append(name)
-    return columns
+    return list(load_board(kanban_path).columns)
 
 
 def ensure_review_column(workspace) -> bool:
@@ -224,9 +720,10 @@ def parse_task_title_with_description(
     as two separate items on the sync side.
 
     Description is whatever follows the FIRST ` - ` on the line; None
-    if no separator. Returns None for non-task lines.
+    if no separator. Returns None for non-task lines. P23: a trailing
+    task-id marker is not part of either.
     """
-    stripped = line.strip()
+    stripped = split_task_id(line)[0].strip()
     if not stripped.startswith("*"):
         return None
     title = stripped[1:].strip()  # remove leading *
@@ -238,11 +735,79 @@ def parse_task_title_with_description(
     return title, None
 
 
+# ---------------------------------------------------------------------------
+# Durability policy (P6)
+#
+# How hard atomic_write_text pushes a write toward stable storage:
+#
+#   strict     fsync the tempfile, replace, then fsync the parent directory
+#              so the rename itself survives power loss.
+#   default    fsync the tempfile, then replace (the historical behaviour).
+#   fdatasync  like default but os.fdatasync (skips metadata-only flushes
+#              such as mtime; falls back to fsync where unavailable).
+#   relaxed    no fsync at all — for tmpfs-backed CI boards and throwaway
+#              agent sandboxes. The replace is still atomic against
+#              concurrent readers; only crash durability is given up.
+#
+# Resolution order: explicit `durability=` argument, then the mode set for
+# the target's directory via set_workspace_durability(), then
+# KANBANGER_DURABILITY, then "default". An unknown explicit / registered
+# mode is a caller bug (ValueError); an unknown env value falls back to
+# "default" so a typo in a client config can't take the server down.
+# ---------------------------------------------------------------------------
+
+DURABILITY_ENV = "KANBANGER_DURABILITY"
+DURABILITY_MODES = ("strict", "default", "fdatasync", "relaxed")
+
+_WORKSPACE_DURABILITY: dict = {}
+
+
+def _check_durability(mode: str) -> str:
+    if mode not in DURABILITY_MODES:
+        raise ValueError(
+            f"unknown durability mode {mode!r} "
+            f"(expected one of {', '.join(DURABILITY_MODES)})"
+        )
+    return mode
+
+
+def set_workspace_durability(workspace: str, mode: Optional[str]) -> None:
+    """Pin the durability mode for writes into `workspace` (None clears)."""
+    key = os.path.abspath(workspace)
+    if mode is None:
+        _WORKSPACE_DURABILITY.pop(key, None)
+    else:
+        _WORKSPACE_DURABILITY[key] = _check_durability(mode)
+
+
+def resolve_durability(path: str, durability: Optional[str] = None) -> str:
+    """The durability mode a write to `path` would use."""
+    if durability is not None:
+        return _check_durability(durability)
+    pinned = _WORKSPACE_DURABILITY.get(os.path.dirname(os.path.abspath(path)))
+    if pinned is not None:
+        return pinned
+    env = os.getenv(DURABILITY_ENV, "").strip().lower()
+    return env if env in DURABILITY_MODES else "default"
+
+
+def _fsync_dir(path: str) -> None:
+    """fsync a directory so a rename inside it is durable (POSIX only)."""
+    if sys.platform == "win32":
+        return  # directories can't be opened for fsync on Windows
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def atomic_write_text(
     path: str,
     content: str,
     encoding: str = "utf-8",
     newline: Optional[str] = None,
+    durability: Optional[str] = None,
 ) -> None:
     """Write text to path atomically.
 
@@ -257,7 +822,15 @@ def atomic_write_text(
     pass "" for no translation when the content's own line endings must be
     preserved byte-for-byte (e.g. the board-key mint into an existing
     board, ADR 0002).
+
+    `durability` overrides the P6 policy for this write (see
+    resolve_durability); None uses the workspace / env / default mode.
+
+    P1: the parsed-board cache entry for `path` is dropped once the
+    replace lands (and on failure), so no reader in this process can be
+    served the pre-write snapshot.
     """
+    mode = resolve_durability(path, durability)
     target_dir = os.path.dirname(os.path.abspath(path)) or "."
     fd, tmp_path = tempfile.mkstemp(
         prefix=os.path.basename(path) + ".tmp.",
@@ -267,19 +840,59 @@ def atomic_write_text(
         with os.fdopen(fd, "w", encoding=encoding, newline=newline) as f:
             f.write(content)
             f.flush()
-            os.fsync(f.fileno())
+            if mode == "fdatasync" and hasattr(os, "fdatasync"):
+                os.fdatasync(f.fileno())
+            elif mode != "relaxed":
+                os.fsync(f.fileno())
         os.replace(tmp_path, path)
+        if mode == "strict":
+            _fsync_dir(target_dir)
     except Exception:
         try:
             os.unlink(tmp_path)
         except OSError:
             pass
         raise
+    finally:
+        invalidate_board_cache(path)
 
 
-def atomic_write_json(path: str, data: object, indent: int = 2) -> None:
+def atomic_write_json(
+    path: str,
+    data: object,
+    indent: int = 2,
+    durability: Optional[str] = None,
+) -> None:
     """Atomic-write JSON. Same guarantees as atomic_write_text."""
-    atomic_write_text(path, json.dumps(data, indent=indent))
+    atomic_write_text(
+        path, json.dumps(data, indent=indent), durability=durability,
+    )
+
+
+def append_text(
+    path: str,
+    content: str,
+    encoding: str = "utf-8",
+    durability: Optional[str] = None,
+) -> None:
+    """Append text to path and make it durable per the P6 policy.
+
+    Not atomic: a crash mid-append can leave a torn final line, so
+    readers of append-only files (the P18 state journal) must tolerate
+    one. "strict" also fsyncs the directory the first time the file is
+    created.
+    """
+    mode = resolve_durability(path, durability)
+    created = not os.path.exists(path)
+    with open(path, "a", encoding=encoding, newline="") as f:
+        f.write(content)
+        f.flush()
+        if mode == "fdatasync" and hasattr(os, "fdatasync"):
+            os.fdatasync(f.fileno())
+        elif mode != "relaxed":
+            os.fsync(f.fileno())
+    if created and mode == "strict":
+        _fsync_dir(os.path.dirname(os.path.abspath(path)) or ".")
 
 
 def _lock_path(workspace: str) -> str:
@@ -290,9 +903,155 @@ def state_path(workspace: str) -> str:
     return os.path.join(workspace, _STATE_FILENAME)
 
 
+# ---------------------------------------------------------------------------
+# Lock diagnostics (P8)
+#
+# kanban_lock used to block forever with no trace of who held it. Now:
+#   - KANBANGER_LOCK_TIMEOUT_SEC (or timeout=) bounds the wait; expiry
+#     raises LockTimeoutError naming the current holder. Unset / 0 keeps
+#     the historical block-until-acquired behaviour.
+#   - an exclusive holder records {pid, operation, acquired_at} in the
+#     lock file (cleared on release), readable via lock_holder().
+#   - per-process wait / hold histograms per mode, via lock_stats().
+# ---------------------------------------------------------------------------
+
+LOCK_TIMEOUT_ENV = "KANBANGER_LOCK_TIMEOUT_SEC"
+
+# Histogram bucket upper bounds, milliseconds; the last bucket is "+inf".
+LOCK_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_LOCK_POLL_MAX_SEC = 0.1
+
+
+class LockTimeoutError(Exception):
+    """kanban_lock could not be acquired within its timeout."""
+
+    def __init__(self, workspace: str, timeout: float,
+                 holder: Optional[dict] = None):
+        self.workspace = workspace
+        self.timeout = timeout
+        self.holder = holder
+        who = ""
+        if holder:
+            who = (f" (held by pid {holder.get('pid')} for "
+                   f"{holder.get('operation') or 'unknown operation'} "
+                   f"since {holder.get('acquired_at')})")
+        super().__init__(
+            f"Timed out after {timeout:g}s waiting for {_lock_path(workspace)}"
+            f"{who}"
+        )
+
+
+class _Histogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LOCK_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect.bisect_left(LOCK_BUCKETS_MS, ms)] += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b}ms" for b in LOCK_BUCKETS_MS] + [
+            f">{LOCK_BUCKETS_MS[-1]}ms"
+        ]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+_LOCK_STATS: dict = {}
+_LOCK_STATS_LOCK = threading.Lock()
+
+
+def _record_lock(mode: str, kind: str, seconds: Optional[float]) -> None:
+    with _LOCK_STATS_LOCK:
+        entry = _LOCK_STATS.setdefault(
+            mode, {"wait": _Histogram(), "hold": _Histogram(), "timeouts": 0},
+        )
+        if seconds is None:
+            entry["timeouts"] += 1
+        else:
+            entry[kind].add(seconds)
+
+
+def lock_stats() -> dict:
+    """Per-process kanban_lock wait / hold histograms, keyed by mode."""
+    with _LOCK_STATS_LOCK:
+        return {
+            mode: {
+                "wait": entry["wait"].snapshot(),
+                "hold": entry["hold"].snapshot(),
+                "timeouts": entry["timeouts"],
+            }
+            for mode, entry in _LOCK_STATS.items()
+        }
+
+
+def reset_lock_stats() -> None:
+    with _LOCK_STATS_LOCK:
+        _LOCK_STATS.clear()
+
+
+def lock_holder(workspace: str) -> Optional[dict]:
+    """The holder record of <workspace>/.kanban.lock, or None if unheld.
+
+    Best-effort: the record is advisory, and a holder killed without
+    releasing leaves a stale one behind (the OS lock itself is freed).
+    """
+    try:
+        with open(_lock_path(workspace), "r", encoding="utf-8") as f:
+            raw = f.read().strip("\0 \n")
+    except OSError:
+        return None
+    if not raw:
+        return None
+    try:
+        holder = json.loads(raw)
+    except ValueError:
+        return None
+    return holder if isinstance(holder, dict) else None
+
+
+def _lock_timeout(timeout: Optional[float]) -> Optional[float]:
+    if timeout is None:
+        try:
+            timeout = float(os.getenv(LOCK_TIMEOUT_ENV, "0"))
+        except ValueError:
+            timeout = 0
+    return timeout if timeout > 0 else None
+
+
+def _write_holder(fd: int, operation: Optional[str]) -> None:
+    record = json.dumps({
+        "pid": os.getpid(),
+        "operation": operation,
+        "acquired_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }).encode("utf-8")
+    try:
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, record)
+    except OSError:
+        pass  # diagnostics only; never fail the lock over them
+
+
 @contextmanager
-def kanban_lock(workspace: str) -> Iterator[None]:
-    """Cross-process exclusive lock on <workspace>/.kanban.lock.
+def kanban_lock(
+    workspace: str,
+    shared: bool = False,
+    timeout: Optional[float] = None,
+    operation: Optional[str] = None,
+) -> Iterator[None]:
+    """Cross-process lock on <workspace>/.kanban.lock.
 
     Stdlib-only: msvcrt on Windows, fcntl on POSIX. Blocking acquire so
     contending mutators serialize rather than fail. The lock file is
@@ -303,39 +1062,261 @@ def kanban_lock(workspace: str) -> Iterator[None]:
     sync_kanban.py so concurrent writers can't interleave a lost-update.
     Atomic writes (R1) protect against torn writes; the lock (R2)
     protects against lost updates.
+
+    P7: `shared=True` takes a reader lock (flock LOCK_SH): any number of
+    readers hold it together, and a writer's exclusive lock excludes them
+    all. Windows has no shared mode in msvcrt, so readers fall back to the
+    exclusive lock there (correct, just serialized). If the lock file
+    cannot be created (read-only workspace) a shared acquire proceeds
+    unlocked — no writer can take the lock there either. flock is not
+    reentrant across descriptors: never take a shared lock while holding
+    the exclusive one in the same process, or it deadlocks.
+
+    P8: `timeout` (seconds; None reads KANBANGER_LOCK_TIMEOUT_SEC, <= 0
+    waits forever) bounds the acquire — LockTimeoutError on expiry. An
+    exclusive holder records `operation` and its pid in the lock file;
+    wait and hold times feed lock_stats().
     """
-    os.makedirs(workspace, exist_ok=True)
     lock_path = _lock_path(workspace)
+    mode = "shared" if shared else "exclusive"
+    limit = _lock_timeout(timeout)
     # Open r+ if it already exists, else create. Keep the descriptor for the
-    # platform lock primitive; no content is written.
+    # platform lock primitive and the P8 holder record.
     flags = os.O_RDWR | os.O_CREAT
-    fd = os.open(lock_path, flags)
+    if shared:
+        try:
+            fd = os.open(lock_path, flags)
+        except OSError:
+            yield
+            return
+    else:
+        os.makedirs(workspace, exist_ok=True)
+        fd = os.open(lock_path, flags)
     try:
+        started = time.monotonic()
+        deadline = None if limit is None else started + limit
+        delay = 0.005
         if sys.platform == "win32":
             import msvcrt
-            # Lock 1 byte at offset 0; LK_LOCK blocks until acquired.
-            # msvcrt.locking requires a non-empty file region, so write a
-            # placeholder byte if the file is empty.
+            # Lock 1 byte at offset 0; LK_LOCK blocks (~10s of retries,
+            # then raises), LK_NBLCK fails at once — poll it under a
+            # timeout. msvcrt.locking requires a non-empty file region,
+            # so write a placeholder byte if the file is empty.
             if os.fstat(fd).st_size == 0:
                 os.write(fd, b"\0")
+            while True:
                 os.lseek(fd, 0, os.SEEK_SET)
-            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
-            try:
-                yield
-            finally:
+                try:
+                    msvcrt.locking(
+                        fd, msvcrt.LK_LOCK if deadline is None else msvcrt.LK_NBLCK, 1,
+                    )
+                    break
+                except OSError:
+                    if deadline is None:
+                        raise
+                    if time.monotonic() >= deadline:
+                        _record_lock(mode, "wait", None)
+                        raise LockTimeoutError(workspace, limit, None)
+                    time.sleep(delay)
+                    delay = min(delay * 2, _LOCK_POLL_MAX_SEC)
+
+            def release():
                 os.lseek(fd, 0, os.SEEK_SET)
                 msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
         else:
             import fcntl
-            fcntl.flock(fd, fcntl.LOCK_EX)
-            try:
-                yield
-            finally:
+            op = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            if deadline is None:
+                fcntl.flock(fd, op)
+            else:
+                while True:
+                    try:
+                        fcntl.flock(fd, op | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        if time.monotonic() >= deadline:
+                            _record_lock(mode, "wait", None)
+                            raise LockTimeoutError(
+                                workspace, limit, lock_holder(workspace),
+                            )
+                        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                        delay = min(delay * 2, _LOCK_POLL_MAX_SEC)
+
+            def release():
+                if not shared:
+                    try:
+                        os.ftruncate(fd, 0)
+                    except OSError:
+                        pass
                 fcntl.flock(fd, fcntl.LOCK_UN)
+        acquired = time.monotonic()
+        _record_lock(mode, "wait", acquired - started)
+        if not shared and sys.platform != "win32":
+            # msvcrt locks are mandatory: nobody else could read the
+            # record while it is held, so Windows skips it.
+            _write_holder(fd, operation)
+        try:
+            yield
+        finally:
+            _record_lock(mode, "hold", time.monotonic() - acquired)
+            release()
     finally:
         os.close(fd)
 
 
+def read_board(path) -> Board:
+    """One consistent Board snapshot of `path`, taken under a shared lock.
+
+    P7: the read-side counterpart of the tools' locked read-modify-write.
+    Readers run in parallel with each other but never overlap a writer's
+    lock cycle, so every view (column order, sections, tasks) comes from a
+    single committed board. Served from the P1 cache when the board is
+    unchanged. Raises like load_board (FileNotFoundError for a missing
+    board or workspace).
+    """
+    workspace = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(workspace):
+        return load_board(path)
+    with kanban_lock(workspace, shared=True, operation="read_board"):
+        return load_board(path)
+
+
+# ---------------------------------------------------------------------------
+# Group commit (P5)
+#
+# Concurrent in-process mutators (several HTTP-transport clients, threaded
+# agents) each used to take the lock, re-read, rewrite the whole board and
+# fsync. GroupCommitter coalesces them: callers queue a mutation; one of
+# them becomes the LEADER, optionally waits a short window for more to
+# arrive, then applies the whole queue in order to ONE board under ONE
+# kanban_lock and flushes it with ONE atomic_write_text. Every caller's
+# result is released only after that shared write returns, so a returned
+# success always means "durable on disk" exactly as before. Leadership is
+# handed back after each flush, so no caller drives more than one commit.
+#
+# Contract for a mutation `apply(board)`: return a result, and leave the
+# board UNTOUCHED when the result is a failure (the tools' _op_* functions
+# check everything before their first edit). A mutation that RAISES is
+# treated as a bug: its caller gets the exception and the group's board is
+# rebuilt from the other mutations, so one crash cannot leak a half-edit
+# into its neighbours' commit.
+# ---------------------------------------------------------------------------
+
+GROUP_COMMIT_WINDOW_ENV = "KANBANGER_GROUP_COMMIT_WINDOW_MS"
+
+
+class BoardReadError(Exception):
+    """The group's board could not be read; nothing in the group applied."""
+
+
+class BoardWriteError(Exception):
+    """The group's flush failed; nothing in the group was persisted."""
+
+
+class GroupCommitter:
+    """Coalesce concurrent board mutations into shared lock + write cycles.
+
+    `window_sec` is how long a leader waits for followers before flushing;
+    None reads KANBANGER_GROUP_COMMIT_WINDOW_MS on every commit (default
+    0: no added latency — mutations that queue while a flush is in flight
+    still share the next one). `commits` counts flushes (board writes).
+    """
+
+    def __init__(self, workspace: str, window_sec: Optional[float] = None):
+        self.workspace = workspace
+        self.kanban_path = os.path.join(workspace, _KANBAN_FILENAME)
+        self.window_sec = window_sec
+        self.commits = 0
+        self._cond = threading.Condition()
+        self._queue: list = []
+        self._leading = False
+
+    def _window(self) -> float:
+        if self.window_sec is not None:
+            return self.window_sec
+        try:
+            return max(0.0, float(os.getenv(GROUP_COMMIT_WINDOW_ENV, "0")) / 1000)
+        except ValueError:
+            return 0.0
+
+    def submit(self, apply):
+        """Queue `apply(board)`; return its result once the group is durable.
+
+        Raises BoardReadError / BoardWriteError for group-wide failures,
+        or whatever `apply` itself raised.
+        """
+        future: Future = Future()
+        with self._cond:
+            self._queue.append((apply, future))
+            while self._leading and not future.done():
+                self._cond.wait()
+            lead = not future.done()
+            if lead:
+                self._leading = True
+        if lead:
+            try:
+                window = self._window()
+                if window > 0:
+                    time.sleep(window)
+                with self._cond:
+                    batch, self._queue = self._queue, []
+                self._commit(batch)
+            finally:
+                with self._cond:
+                    self._leading = False
+                    self._cond.notify_all()
+        return future.result()
+
+    def _commit(self, batch: list) -> None:
+        outcomes: list = []
+        try:
+            with kanban_lock(self.workspace, operation="group_commit"):
+                try:
+                    base = load_board(self.kanban_path)
+                except Exception as e:
+                    raise BoardReadError(str(e)) from e
+                board = base.copy()
+                applied: list = []
+                for apply, future in batch:
+                    try:
+                        outcomes.append((future, apply(board), None))
+                        applied.append(apply)
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+                        board = base.copy()
+                        for earlier in applied:
+                            earlier(board)
+                if board.modified:
+                    try:
+                        atomic_write_text(self.kanban_path, board.serialize())
+                    except Exception as e:
+                        raise BoardWriteError(str(e)) from e
+                    self.commits += 1
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+_COMMITTERS: dict = {}
+_COMMITTERS_LOCK = threading.Lock()
+
+
+def group_committer(workspace: str) -> GroupCommitter:
+    """The process-wide GroupCommitter for `workspace` (created on demand)."""
+    key = os.path.abspath(workspace)
+    with _COMMITTERS_LOCK:
+        committer = _COMMITTERS.get(key)
+        if committer is None:
+            committer = _COMMITTERS[key] = GroupCommitter(key)
+        return committer
+
+
 def read_state(workspace: str) -> dict:
     """Read .kanban.json if present; return default schema if absent.
 
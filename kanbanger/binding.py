@@ -32,11 +32,17 @@ parser there).
 
 `resolve_binding()` exposes the full `workspace -> board -> key` triple so
 kanban-doctor (issue #15 step 5) can print it without re-deriving anything.
+
+P10: `current_binding()` is the memoized form the MCP server uses on every
+tool / resource call. Each call is otherwise a `Path.resolve()` plus a
+stat per ancestor, which is expensive on deep trees over network
+filesystems.
 """
 
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -154,3 +160,74 @@ def resolve_binding(start_dir=None) -> Binding:
             board_key=read_board_key(board),
         )
     return Binding(workspace=str(workspace), board_path=None, board_key=None)
+
+
+# P10: memoized bindings, keyed on (env pin, start dir). Each entry holds
+# the Binding plus the (st_dev, st_ino) of its board at resolve time.
+_BINDING_CACHE: dict = {}
+_BINDING_CACHE_LOCK = threading.Lock()
+
+
+def _board_identity(board_path: Optional[str]):
+    if board_path is None:
+        return None
+    try:
+        st = os.stat(board_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def current_binding(start_dir=None) -> Binding:
+    """resolve_binding(), memoized for the life of the process (P10).
+
+    A cached binding is reused while the env pin and the start directory
+    (default: process cwd) are unchanged AND its board is still the same
+    file (same device + inode). Revalidation rules:
+
+      * env pin / cwd changed: different cache key — resolved fresh.
+      * board gone: full re-resolve (the walk may now land elsewhere).
+      * board replaced (new inode — every atomic write does this, as does
+        minting a key): workspace is kept, the key is re-read.
+      * unprovisioned (no board): never cached, so a board created by
+        setup_project is picked up on the next call.
+
+    Deliberately NOT detected: a new board appearing in a directory
+    NEARER the start dir than the cached one (monorepo sub-project
+    provisioned while the server runs). Restart the server, or call
+    invalidate_binding_cache().
+    """
+    env_value = os.getenv(WORKSPACE_ENV_VAR)
+    start = str(start_dir) if start_dir is not None else os.getcwd()
+    key = (env_value, start)
+    with _BINDING_CACHE_LOCK:
+        cached = _BINDING_CACHE.get(key)
+    if cached is not None:
+        binding, identity = cached
+        current = _board_identity(binding.board_path)
+        if current == identity:
+            return binding
+        if current is not None:
+            binding = Binding(
+                workspace=binding.workspace,
+                board_path=binding.board_path,
+                board_key=read_board_key(binding.board_path),
+            )
+            with _BINDING_CACHE_LOCK:
+                _BINDING_CACHE[key] = (binding, current)
+            return binding
+
+    binding = resolve_binding(start_dir)
+    identity = _board_identity(binding.board_path)
+    with _BINDING_CACHE_LOCK:
+        if identity is None:
+            _BINDING_CACHE.pop(key, None)
+        else:
+            _BINDING_CACHE[key] = (binding, identity)
+    return binding
+
+
+def invalidate_binding_cache() -> None:
+    """Drop every memoized binding (next call re-resolves from scratch)."""
+    with _BINDING_CACHE_LOCK:
+        _BINDING_CACHE.clear()
@@ -26,6 +26,7 @@ This project uses a kanban board (_kanban.md) for task tracking and syncs with G
 - `move_task(title, from_column, to_column)` - Move task between columns
 - `delete_task(title, column)` - Remove task from board
 - `list_tasks(column)` - View tasks (all or by column)
+- `apply_operations(ops)` - Apply many add/move/delete/review ops in one all-or-nothing write
 - `sync_to_github(dry_run)` - Sync board to GitHub Projects
 - `get_sync_status()` - Check GitHub sync state
 
@@ -34,6 +35,7 @@ This project uses a kanban board (_kanban.md) for task tracking and syncs with G
 - `kanban://stats` - Task counts and distribution
 - `kanban://sync-status` - GitHub sync information
 - `kanban://config` - Current configuration
+- `kanban://lock-stats` - Board lock contention and current holder
 
 ## Workflow Best Practices:
 1. **Before starting work:** Check current board state (kanban://current-board)
@@ -102,6 +104,11 @@ Use the `add_task()` tool to add each task to the board:
 ```
 add_task("Task title", "TODO", "Task description")
 ```
+For more than a couple of tasks, add them in one `apply_operations()` call
+(one all-or-nothing write instead of one per task):
+```
+apply_operations([{{"op": "add_task", "title": "Task title", "column": "TODO", "description": "Task description"}}, ...])
+```
 
 Now, break down the goal "{goal}" into tasks:"""
     
@@ -12,9 +12,9 @@ import urllib.request
 import urllib.error
 from mcp.server.fastmcp import FastMCP
 
-from kanban_io import discover_columns
+from kanban_io import lock_holder, lock_stats, read_board
 
-from .binding import resolve_workspace
+from .binding import current_binding
 
 
 # O3 reachability cache: maps token-suffix (last 6 chars; never the
@@ -85,12 +85,12 @@ def _check_github_reachable(token: str) -> bool:
 def get_workspace() -> str:
     """Get the current workspace directory (ADR 0002 binding precedence).
 
-    Delegates to kanbanger.binding.resolve_workspace — the same chain the
-    tools use (env pin > walk-up discovery > cwd fallback) so resources and
-    tools can never resolve different boards. S2 property preserved: always
-    an absolute canonical path.
+    Delegates to kanbanger.binding.current_binding (memoized, P10) — the
+    same chain the tools use (env pin > walk-up discovery > cwd fallback)
+    so resources and tools can never resolve different boards. S2 property
+    preserved: always an absolute canonical path.
     """
-    return str(resolve_workspace())
+    return current_binding().workspace
 
 
 def get_kanban_path() -> str:
@@ -116,8 +116,7 @@ def register_resources(server: FastMCP):
             return f"# No Kanban Board Found\n\nNo _kanban.md file exists in workspace: {get_workspace()}\n\nCreate one with:\n```\n# Project Kanban\n\n## BACKLOG\n\n## TODO\n\n## DOING\n\n## REVIEW\n\n## DONE\n```"
         
         try:
-            with open(kanban_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return read_board(kanban_path).text
         except Exception as e:
             return f"# Error Reading Kanban Board\n\nError: {str(e)}"
     
@@ -139,36 +138,28 @@ def register_resources(server: FastMCP):
             }, indent=2)
         
         try:
-            with open(kanban_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            board = read_board(kanban_path)
         except Exception as e:
             return json.dumps({"error": f"Error reading board: {str(e)}"}, indent=2)
         
         # D5: discover columns dynamically from the markdown rather
         # than the previous hardcoded {BACKLOG, TODO, DOING, DONE}
         # initializer. column-config: column discovery is hoisted to
-        # `kanban_io.discover_columns` so this resource and the
-        # validation paths in `tools.py` share a single source of
-        # truth. Convenience aliases (in_progress / completed /
-        # pending) stay for back-compat callers but tolerate missing
-        # columns via .get(..., 0).
-        columns = discover_columns(get_workspace())
-        stats: dict = {col: 0 for col in columns}
-        column_set = set(columns)
-        current_column = None
-
-        for line in content.split('\n'):
-            stripped = line.strip()
-            if stripped.startswith("## "):
-                name = stripped[3:].strip()
-                current_column = name if name in column_set else None
-            elif current_column and stripped.startswith("*"):
-                stats[current_column] += 1
+        # `kanban_io` so this resource and the validation paths in
+        # `tools.py` share a single source of truth. Convenience aliases
+        # (in_progress / completed / pending) stay for back-compat callers
+        # but tolerate missing columns via .get(..., 0). P2: columns and
+        # task records both come from the one parsed (cached) Board.
+        stats: dict = {col: 0 for col in board.columns}
+        for record in board.tasks:
+            stats[record.column] += 1
 
         stats["total"] = sum(v for v in stats.values() if isinstance(v, int))
         stats["in_progress"] = stats.get("DOING", 0)
         stats["completed"] = stats.get("DONE", 0)
         stats["pending"] = stats.get("BACKLOG", 0) + stats.get("TODO", 0)
+        # P9: version token of this snapshot, usable as `if_version`.
+        stats["version"] = board.version
 
         return json.dumps(stats, indent=2)
     
@@ -209,6 +200,27 @@ def register_resources(server: FastMCP):
                 "error": f"Error reading sync state: {str(e)}"
             }, indent=2)
     
+    @server.resource(
+        "kanban://lock-stats",
+        name="kanban_lock_statistics",
+        title="Kanban Lock Statistics",
+        description="Board lock wait/hold histograms for this server process and the current lock holder",
+        mime_type="application/json"
+    )
+    def get_lock_stats() -> str:
+        """Return P8 lock diagnostics for the current workspace.
+
+        `modes` holds this process's wait / hold histograms (milliseconds)
+        and timeout counts per lock mode since server start; `holder` is
+        the record the current exclusive holder wrote into .kanban.lock
+        (any process — e.g. a sync subprocess), or null when unheld.
+        """
+        return json.dumps({
+            "workspace": get_workspace(),
+            "holder": lock_holder(get_workspace()),
+            "modes": lock_stats(),
+        }, indent=2)
+    
     @server.resource(
         "kanban://config",
         name="kanbanger_configuration",
@@ -12,22 +12,43 @@ import json
 import difflib
 import subprocess
 import threading
+import time
 from contextlib import redirect_stdout
+from pathlib import Path
 from typing import Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 
 # Root module, like kanban_io: the shared doctor core (issue #23). It never
 # imports the mcp SDK; this package consumes its structured results.
-from kanban_doctor import render_report, run_doctor
+from kanban_doctor import (
+    build_effective_env,
+    read_env_file_values,
+    render_report,
+    run_doctor,
+)
 from kanban_io import (
-    atomic_write_text,
-    discover_columns,
-    kanban_lock,
+    DURABILITY_ENV,
+    DURABILITY_MODES,
+    Board,
+    BoardReadError,
+    BoardWriteError,
+    LockTimeoutError,
+    format_task_id_marker,
+    group_committer,
+    mint_task_id,
     parse_task_title_with_description as _parse_task_title_with_description,
+    read_board,
+    set_workspace_durability,
+    split_task_id,
+    task_ids_enabled,
 )
-from .binding import resolve_workspace
+from .binding import current_binding
 from .provision import provision_project
 
+# P19: the sync engine, also a root module. Importing it is side-effect
+# free (its .env loading only runs from the CLI's main()).
+import sync_kanban
+
 # S6: title-injection guard. Lines beginning with `* [` are kanban
 # task entries and `## ` are column headers; allowing those patterns
 # at the start of a stored title would let a malicious or careless
@@ -68,6 +89,31 @@ ERROR_GATE_VIOLATION = "gate_violation"
 # than the one on disk (classic symptom: a copied project carrying someone
 # else's sync state, or a board file swapped under an existing state).
 ERROR_BOARD_KEY_MISMATCH = "board_key_mismatch"
+# P4: apply_operations entry that names an unknown op or has missing /
+# unexpected arguments. Raised before any board I/O.
+ERROR_INVALID_OPERATION = "invalid_operation"
+# P8: .kanban.lock was not acquired within KANBANGER_LOCK_TIMEOUT_SEC.
+# Context names the holder (pid / operation / since) when it recorded one;
+# nothing was read or written, so the call is safe to retry.
+ERROR_LOCK_TIMEOUT = "lock_timeout"
+# P9: a mutation carried `if_version` and the board has moved on since the
+# caller read it. Context carries expected / current version; re-read
+# (list_tasks(include_version=True)) and retry.
+ERROR_VERSION_CONFLICT = "version_conflict"
+
+
+# P19: how sync_to_github runs a sync. "inprocess" (default) calls
+# sync_kanban.run_sync on a worker thread with a warm GitHub session;
+# "subprocess" keeps the isolated `python -m sync_kanban` child.
+SYNC_MODE_ENV = "KANBANGER_SYNC_MODE"
+
+# Grace period for a cancelled in-process sync to let in-flight batches
+# land and save state before the tool returns its timeout error.
+_SYNC_CANCEL_GRACE_SEC = 5.0
+
+# One in-process sync at a time: syncs of one board must not interleave,
+# and a timed-out run keeps the slot until it has wound down.
+_SYNC_ENGINE_LOCK = threading.Lock()
 
 
 def _error(code: str, message: str, **context) -> str:
@@ -105,7 +151,8 @@ def _classify_sync_stderr(stderr: str) -> str:
     """E2: map sync_kanban subprocess stderr to a structured error_code.
 
     The subprocess raises typed exceptions from E1 and the CLI wrapper
-    formats them as 'Error: <message>' on stderr. This mirror table
+    formats them as 'Error: <message>' on stderr. P19: the in-process
+    engine feeds its exceptions through in the same shape. This mirror table
     avoids clients parsing free-text. Append-only: add a new branch
     for any new E1 exception class introduced in sync_kanban.
     """
@@ -133,10 +180,101 @@ def _classify_sync_stderr(stderr: str) -> str:
             return ERROR_CONFIGURATION
         if "No 'Status' field" in body:
             return ERROR_GITHUB_API
+        # P11 / P12: transport timeouts, unreachable API, and per-alias
+        # failures inside a batched mutation.
+        if ("GitHub API request timed out" in body
+                or body.startswith("Could not reach GitHub API")
+                or "GitHub operation(s) failed" in body):
+            return ERROR_GITHUB_API
+        # P14: the rate-limit scheduler refused a wait over its maximum.
+        if body.startswith("GitHub rate limit"):
+            return ERROR_GITHUB_API
         return ERROR_CONFIGURATION  # generic Error: line we don't recognise
     return ERROR_SYNC_SUBPROCESS_FAILED
 
 
+def _sync_timeout_error(timeout_sec: float) -> str:
+    return _error(
+        ERROR_SYNC_TIMEOUT,
+        f"sync_to_github timed out after {timeout_sec}s "
+        f"(set KANBANGER_SYNC_TIMEOUT_SEC to override; check "
+        f"GITHUB_REPO env var and network reachability). "
+        f"Run the `doctor` tool to diagnose sync configuration.",
+        timeout_sec=timeout_sec,
+    )
+
+
+def _sync_in_process(kanban_path: str, env: dict, dry_run: bool,
+                     force: bool, timeout_sec: float,
+                     rebuild_state: bool = False) -> str:
+    """P19: run sync_kanban.run_sync on a worker thread, bounded by timeout.
+
+    Same contract as the subprocess path: "Sync <mode>:" plus the
+    progress output on success, E2 error JSON otherwise. `env` is the
+    effective config (process env overlaid with the workspace .env),
+    read without touching os.environ: the repo / token and every sync
+    tuning knob (batch size, concurrency, timeouts, rate limits, cache
+    TTL, journal size) come from it. On timeout the run is cancelled
+    cooperatively — it stops at the next batch boundary and saves what
+    landed — rather than killed.
+    """
+    deadline = time.monotonic() + timeout_sec
+    if not _SYNC_ENGINE_LOCK.acquire(timeout=timeout_sec):
+        return _sync_timeout_error(timeout_sec)
+    cancel = threading.Event()
+    out, err = io.StringIO(), io.StringIO()
+    outcome: dict = {}
+    project = (env.get("GITHUB_PROJECT_NUMBER") or "").strip()
+    token = env.get("GITHUB_TOKEN")
+
+    def work():
+        try:
+            outcome["result"] = sync_kanban.run_sync(
+                kanban_path, env.get("GITHUB_REPO"),
+                int(project) if project.isdigit() else None,
+                token=token,
+                client=None if dry_run
+                else sync_kanban.github_client_for(token, env=env),
+                dry_run=dry_run, force=force, cancel=cancel, out=out, err=err,
+                rebuild_state=rebuild_state, env=env,
+            )
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            _SYNC_ENGINE_LOCK.release()
+
+    worker = threading.Thread(target=work, name="kanbanger-sync", daemon=True)
+    worker.start()
+    worker.join(max(0.0, deadline - time.monotonic()))
+    if worker.is_alive():
+        cancel.set()
+        worker.join(_SYNC_CANCEL_GRACE_SEC)
+        return _sync_timeout_error(timeout_sec)
+
+    error = outcome.get("error")
+    if error is None:
+        if dry_run:
+            return _ok(dry_run=True, plan=outcome["result"].plan.to_dict())
+        return f"Sync complete:\n\n{out.getvalue()}"
+    if isinstance(error, LockTimeoutError):
+        return _lock_timeout_error(error)
+    if isinstance(error, sync_kanban.KanbangerError):
+        return _error(
+            _classify_sync_stderr(f"Error: {error}"),
+            f"sync_to_github failed: {error}. "
+            f"Run the `doctor` tool to diagnose sync configuration.",
+            stderr=err.getvalue(),
+            stdout=out.getvalue(),
+        )
+    return _error(
+        ERROR_SYNC_SUBPROCESS_FAILED,
+        f"sync_to_github failed unexpectedly: {error!r}. "
+        f"Set {SYNC_MODE_ENV}=subprocess to run sync isolated.",
+        stderr=err.getvalue(),
+        stdout=out.getvalue(),
+    )
+
+
 def _parse_task_title(line: str) -> Optional[str]:
     """Extract the title portion of a markdown task line, or None.
 
@@ -179,19 +317,20 @@ def _format_rework_entries(title: str, reason: str) -> Tuple[str, str]:
 
 
 def _find_task_column(
-    lines: list,
+    lines,
     title: str,
 ) -> Tuple[Optional[str], Optional[int], Optional[str]]:
-    """Walk the board and locate the task by exact-title equality.
+    """Locate the task by exact-title equality.
 
-    Iterates `lines` looking for `## <column>` headers and task entries.
-    For each task line, parses the title via `_parse_task_title` and
-    compares for equality. Returns the first match in document order
-    (BACKLOG -> TODO -> DOING -> REVIEW -> DONE per the canonical
-    5-column schema).
+    Accepts either a parsed `kanban_io.Board` (what the tools hold) or the
+    raw line list (kanban file split on '\n'); a line list is parsed into
+    a Board first. Titles are compared via the shared
+    `parse_task_title_with_description` parse. Returns the first match in
+    document order (BACKLOG -> TODO -> DOING -> REVIEW -> DONE per the
+    canonical 5-column schema).
 
     Args:
-        lines: kanban file split on '\n' (typical caller pattern).
+        lines: a Board, or the kanban file split on '\n'.
         title: exact title to locate.
 
     Returns:
@@ -204,18 +343,35 @@ def _find_task_column(
     (in section order) is returned. Duplicate detection / dedup is a
     separate concern (D4); this helper does not warn or reject.
     """
-    current_column: Optional[str] = None
-    for i, line in enumerate(lines):
-        s = line.strip()
-        if s.startswith("## "):
-            current_column = s[3:].strip()
-            continue
-        if current_column is None:
-            continue
-        parsed = _parse_task_title(line)
-        if parsed is not None and parsed == title:
-            return current_column, i, line
-    return None, None, None
+    board = lines if isinstance(lines, Board) else Board(lines)
+    record = board.find(title)
+    if record is None:
+        return None, None, None
+    return record.column, record.line, board.lines[record.line]
+
+
+def _task_not_found(title: str, column: str, board: Board) -> str:
+    """R5: task_not_found for a column-scoped lookup, with near-match hints."""
+    seen_titles = [r.title for r in board.section_tasks(column)]
+    suggestions = difflib.get_close_matches(title, seen_titles, n=3, cutoff=0.6)
+    if suggestions:
+        hint = ", ".join(repr(s) for s in suggestions)
+        return _error(
+            ERROR_TASK_NOT_FOUND,
+            f"Task '{title}' not found in {column}. "
+            f"Did you mean: {hint}?",
+            title=title,
+            column=column,
+            available_titles=seen_titles,
+            suggestions=suggestions,
+        )
+    return _error(
+        ERROR_TASK_NOT_FOUND,
+        f"Task '{title}' not found in {column}",
+        title=title,
+        column=column,
+        available_titles=seen_titles,
+    )
 
 
 def validate_task_title(title: str) -> Tuple[bool, Optional[str]]:
@@ -257,7 +413,8 @@ def validate_task_title(title: str) -> Tuple[bool, Optional[str]]:
 def get_workspace() -> str:
     """Get the current workspace directory (ADR 0002 binding precedence).
 
-    Delegates to kanbanger.binding.resolve_workspace:
+    Delegates to kanbanger.binding.current_binding (P10: the memoized
+    resolve_binding, revalidated on env / cwd / board-inode change):
       KANBANGER_WORKSPACE env (explicit pin, back-compat with every
       provisioned .mcp.json) > walk-up discovery from the server cwd to
       the nearest ancestor containing `_kanban.md` > cwd fallback
@@ -267,7 +424,51 @@ def get_workspace() -> str:
     segments and symlinks collapsed) so resolution is predictable
     regardless of the process cwd.
     """
-    return str(resolve_workspace())
+    binding = current_binding()
+    _apply_workspace_durability(binding)
+    return binding.workspace
+
+
+# P6: workspace -> (Binding, .env (st_mtime_ns, st_size) or None) last
+# applied. Guarded by _DURABILITY_ENV_LOCK.
+_DURABILITY_ENV_SEEN: dict = {}
+_DURABILITY_ENV_LOCK = threading.Lock()
+
+
+def _apply_workspace_durability(binding) -> None:
+    """P6: pin the workspace .env's KANBANGER_DURABILITY for its writes.
+
+    Precedence matches build_effective_env: the workspace .env wins over
+    the server's process env, which still applies when the .env does not
+    set it. An unknown value is ignored, like an unknown env value.
+
+    The check rides on current_binding()'s revalidation: while the
+    memoized Binding is unchanged this is a dict lookup, not a stat. A
+    fresh Binding (first call, or the board was replaced, as every write
+    does) stats the .env and re-reads it if it changed, so an edit takes
+    effect from the board's next write on. The mode is pinned before the
+    binding is recorded as seen, under the lock, so a concurrent call
+    never skips ahead of a pin still in progress.
+    """
+    workspace = binding.workspace
+    with _DURABILITY_ENV_LOCK:
+        seen = _DURABILITY_ENV_SEEN.get(workspace)
+        if seen is not None and seen[0] is binding:
+            return
+        try:
+            st = os.stat(os.path.join(workspace, ".env"))
+            identity = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            identity = None
+        if seen is None or seen[1] != identity:
+            mode = ""
+            if identity is not None:
+                mode = read_env_file_values(Path(workspace)).get(
+                    DURABILITY_ENV, "")
+                mode = mode.strip().lower()
+            set_workspace_durability(
+                workspace, mode if mode in DURABILITY_MODES else None)
+        _DURABILITY_ENV_SEEN[workspace] = (binding, identity)
 
 
 def get_kanban_path() -> str:
@@ -275,11 +476,526 @@ def get_kanban_path() -> str:
     return os.path.join(get_workspace(), "_kanban.md")
 
 
+# ---------------------------------------------------------------------------
+# Board operations (P4)
+#
+# The body of every mutating tool, factored out so the single-op tools and
+# apply_operations share one implementation. Each `_op_*` edits the Board
+# it is given and returns the success payload dict (the `_ok` fields), or
+# an `_error` JSON string. On error the board is untouched: every check
+# runs before the first edit, so a failed op inside a batch leaves nothing
+# half-applied.
+# ---------------------------------------------------------------------------
+
+
+def _op_add_task(board: Board, title: str, column: str = "TODO",
+                 description: str = ""):
+    # column-config: validate against the board's actual columns,
+    # not a hardcoded whitelist. A board with REVIEW (or any custom
+    # column) is fully operable via the MCP tools; the parser was
+    # already permissive here, this aligns the validator with it.
+    valid_columns = list(board.columns)
+    if column not in valid_columns:
+        return _error(
+            ERROR_INVALID_COLUMN,
+            f"Invalid column '{column}'. Must be one of: {', '.join(valid_columns)}",
+            column=column,
+            valid_columns=valid_columns,
+        )
+
+    # S6: normalize tabs to spaces before validation so a tab-only
+    # title isn't accepted as 'non-empty' but also isn't rejected
+    # for containing a tab. Validation rejects empty, markdown-
+    # injecting, and over-long titles.
+    title = title.replace("\t", " ")
+    ok, err = validate_task_title(title)
+    if not ok:
+        return _error(ERROR_INVALID_TITLE, err)
+
+    # Build task line
+    task_line = f"*   [ ] {title}"
+    if description:
+        task_line += f" - {description}"
+    if split_task_id(task_line)[1] is not None:
+        # P23: a pasted marker would be read back as this task's id.
+        return _error(
+            ERROR_INVALID_TITLE,
+            "title/description ends with a kanbanger task-id marker",
+        )
+    task = {"title": title, "column": column}
+    if task_ids_enabled():
+        task["task_id"] = mint_task_id()
+        task_line += " " + format_task_id_marker(task["task_id"])
+
+    # Bug A: canonical-rebuild the target column. Append (not prepend),
+    # always pad header -> blank -> tasks -> blank. Existing tasks are
+    # preserved in order; stray blank lines inside the section are
+    # normalized away (Board.append_task).
+    board.append_task(column, task_line)
+    return {"task": task}
+
+
+def _op_move_task(board: Board, title: str, from_column: str,
+                  to_column: str):
+    # column-config: validate both columns against the board's
+    # actual columns rather than a hardcoded whitelist.
+    valid_columns = list(board.columns)
+    if from_column not in valid_columns:
+        return _error(
+            ERROR_INVALID_COLUMN,
+            f"Invalid from_column '{from_column}'",
+            column=from_column,
+            valid_columns=valid_columns,
+        )
+    if to_column not in valid_columns:
+        return _error(
+            ERROR_INVALID_COLUMN,
+            f"Invalid to_column '{to_column}'",
+            column=to_column,
+            valid_columns=valid_columns,
+        )
+
+    # Bundle 1b: REVIEW-gate enforcement. The only legitimate path to
+    # DONE is REVIEW -> DONE (via approve_done or reject_review's
+    # Pattern C). Any other from_column -> DONE transition bypasses
+    # the gate and is rejected with a structured error pointing the
+    # caller at the canonical primitives. The context names the task's
+    # actual current column (D9 lookup), not only the one claimed.
+    if to_column == "DONE" and from_column != "REVIEW":
+        actual_column, _, _ = _find_task_column(board, title)
+        return _error(
+            ERROR_GATE_VIOLATION,
+            f"Direct move_task to DONE from {from_column} bypasses the "
+            f"REVIEW gate. The canonical path is propose_done(title) "
+            f"to move DOING -> REVIEW, then approve_done(title) to "
+            f"land in DONE. Use reject_review(title, reason) if the "
+            f"work needs rework.",
+            title=title,
+            from_column=from_column,
+            to_column=to_column,
+            actual_column=actual_column,
+            canonical_path=["propose_done", "approve_done"],
+        )
+
+    # R5: find the task in from_column by exact title equality; a
+    # miss offers near-match hints from that column's titles.
+    record = board.find_in_column(from_column, title)
+    if record is None:
+        return _task_not_found(title, from_column, board)
+
+    # Remove from source column
+    task_line = board.remove_task(record)
+
+    # Update checkbox based on destination
+    if to_column == "DONE":
+        task_line = task_line.replace("[ ]", "[x]")
+    else:
+        task_line = task_line.replace("[x]", "[ ]")
+
+    # Insert directly under the destination column header
+    board.insert_task(to_column, task_line)
+    return {"task": {"title": title, "from_column": from_column,
+                     "to_column": to_column}}
+
+
+def _op_delete_task(board: Board, title: str, column: str):
+    # column-config: fail fast with a structured invalid_column
+    # error if the caller asks for a column not on the board, rather
+    # than silently returning task_not_found from the lookup.
+    valid_columns = list(board.columns)
+    if column not in valid_columns:
+        return _error(
+            ERROR_INVALID_COLUMN,
+            f"Invalid column '{column}'",
+            column=column,
+            valid_columns=valid_columns,
+        )
+
+    # R5: find by exact title equality; near-match hints on a miss.
+    record = board.find_in_column(column, title)
+    if record is None:
+        return _task_not_found(title, column, board)
+
+    task_index = record.line
+    board.remove_task(record)
+    # Bug A round-trip: compact any consecutive blank lines created
+    # at the deletion point so add_task -> delete_task is a no-op
+    # on the markdown shape.
+    lines = board.lines
+    while (
+        0 < task_index < len(lines)
+        and lines[task_index].strip() == ""
+        and lines[task_index - 1].strip() == ""
+    ):
+        board.pop_line(task_index)
+    return {"task": {"title": title, "column": column}}
+
+
+def _op_propose_done(board: Board, title: str):
+    # D9: hoisted state-lookup helper (Bundle 1b item 1).
+    found_in_column, found_index, found_line = _find_task_column(board, title)
+
+    if found_in_column is None:
+        return _error(
+            ERROR_TASK_NOT_FOUND,
+            f"Task '{title}' not found in any column",
+            title=title,
+        )
+    if found_in_column != "DOING":
+        return _error(
+            ERROR_INVALID_STATE,
+            f"Task '{title}' is in {found_in_column}, not DOING. "
+            f"propose_done moves DOING -> REVIEW only.",
+            title=title,
+            current_column=found_in_column,
+            expected_column="DOING",
+        )
+
+    # Move from DOING to REVIEW (insert immediately after the
+    # `## REVIEW` header). Item 1.5's auto-migration guarantees
+    # REVIEW is on the board.
+    board.pop_line(found_index)
+    board.insert_task("REVIEW", found_line)
+    return {"task": {"title": title, "from_column": "DOING",
+                     "to_column": "REVIEW"}}
+
+
+def _op_approve_done(board: Board, title: str):
+    # D9: hoisted state-lookup helper (Bundle 1b item 1).
+    found_in_column, found_index, found_line = _find_task_column(board, title)
+
+    if found_in_column is None:
+        return _error(
+            ERROR_TASK_NOT_FOUND,
+            f"Task '{title}' not found in any column",
+            title=title,
+        )
+    if found_in_column != "REVIEW":
+        return _error(
+            ERROR_INVALID_STATE,
+            f"Task '{title}' is in {found_in_column}, not REVIEW. "
+            f"approve_done moves REVIEW -> DONE only.",
+            title=title,
+            current_column=found_in_column,
+            expected_column="REVIEW",
+        )
+
+    # Flip checkbox to [x] (move_task convention for DONE) and
+    # insert after the `## DONE` header.
+    board.pop_line(found_index)
+    board.insert_task("DONE", found_line.replace("[ ]", "[x]"))
+    return {"task": {"title": title, "from_column": "REVIEW",
+                     "to_column": "DONE"}}
+
+
+def _op_reject_review(board: Board, title: str, reason: str):
+    # Reason validation BEFORE any lookup — caller error.
+    if reason is None or not str(reason).strip():
+        return _error(
+            ERROR_MISSING_REASON,
+            "reject_review requires a non-empty reason. A rejection "
+            "without context would create a Rework task with no "
+            "actionable description.",
+            title=title,
+        )
+
+    # D9: hoisted state-lookup helper (Bundle 1b item 1). reject_review
+    # discards the line text -- _format_rework_entries generates fresh
+    # lines from the title rather than reusing the source line (P23:
+    # only its task-id marker is carried over).
+    found_in_column, found_index, found_line = _find_task_column(board, title)
+
+    if found_in_column is None:
+        return _error(
+            ERROR_TASK_NOT_FOUND,
+            f"Task '{title}' not found in any column",
+            title=title,
+        )
+    if found_in_column != "REVIEW":
+        return _error(
+            ERROR_INVALID_STATE,
+            f"Task '{title}' is in {found_in_column}, not REVIEW. "
+            f"reject_review moves REVIEW -> DONE (with REJECTED "
+            f"annotation) only.",
+            title=title,
+            current_column=found_in_column,
+            expected_column="REVIEW",
+        )
+
+    # S7: Re-validate the Rework title against the same rules add_task
+    # applies. Without this, an original title near the 500-char cap
+    # can produce a Rework title that exceeds the cap (or otherwise
+    # violates the title-validation rules) once the "Rework: " prefix
+    # is prepended. Defense-in-depth against future rule changes too.
+    # Atomic property preserved -- no board edit has run yet, so the
+    # board is untouched and the original stays in REVIEW.
+    rework_title = f"Rework: {title}"
+    ok, err = validate_task_title(rework_title)
+    if not ok:
+        return _error(
+            ERROR_INVALID_TITLE,
+            f"Rework task title would be invalid: {err}. The original "
+            f"title is too long (or contains a forbidden pattern) for "
+            f"the 'Rework: ' prefix to be appended. Original title "
+            f"length: {len(title)}; rework title length: "
+            f"{len(rework_title)}; cap: {TITLE_MAX_LEN}.",
+            title=title,
+            rework_title=rework_title,
+            original_title_length=len(title),
+            rework_title_length=len(rework_title),
+            max_length=TITLE_MAX_LEN,
+            underlying_error=err,
+        )
+
+    # Pattern C: two-entry atomic move.
+    # 1. Remove the original line from REVIEW.
+    # 2. Insert the REJECTED-annotated line at top of DONE.
+    # 3. Insert the new Rework line at top of TODO.
+    # All on one Board, written once, so the kanban is never in a
+    # half-rejected state. Board keeps header positions in step across
+    # edits, so the two inserts are order-independent.
+    done_line, rework_line = _format_rework_entries(title, reason)
+    # P23: the original keeps its task id; the rework task is a new task.
+    task_id = split_task_id(found_line)[1]
+    if task_id is not None:
+        done_line += " " + format_task_id_marker(task_id)
+    if task_ids_enabled():
+        rework_line += " " + format_task_id_marker(mint_task_id())
+    board.pop_line(found_index)
+    board.insert_task("DONE", done_line)
+    board.insert_task("TODO", rework_line)
+
+    annotation = f"REJECTED: {reason}; rework: Rework: {title}"
+    return {
+        "original": {
+            "title": title,
+            "from_column": "REVIEW",
+            "to_column": "DONE",
+            "annotation": annotation,
+        },
+        "rework": {
+            "title": rework_title,
+            "column": "TODO",
+            "reason": reason,
+        },
+    }
+
+
+# apply_operations: op name -> (handler, required args, optional args).
+# Op names are the single-op tool names, so a batch entry reads exactly
+# like the tool call it replaces.
+_BATCH_OPS = {
+    "add_task": (_op_add_task, ("title",), ("column", "description")),
+    "move_task": (_op_move_task, ("title", "from_column", "to_column"), ()),
+    "delete_task": (_op_delete_task, ("title", "column"), ()),
+    "propose_done": (_op_propose_done, ("title",), ()),
+    "approve_done": (_op_approve_done, ("title",), ()),
+    "reject_review": (_op_reject_review, ("title", "reason"), ()),
+}
+
+
+def _lock_timeout_error(e: LockTimeoutError) -> str:
+    return _error(
+        ERROR_LOCK_TIMEOUT,
+        str(e),
+        timeout_sec=e.timeout,
+        holder=e.holder,
+    )
+
+
+def _version_conflict(expected: str, current: str) -> str:
+    return _error(
+        ERROR_VERSION_CONFLICT,
+        f"Board changed since version {expected} (now {current}). "
+        f"Re-read the board and retry.",
+        expected_version=expected,
+        current_version=current,
+    )
+
+
+def _mutate_board(workspace: str, kanban_path: str, apply,
+                  if_version: Optional[str] = None) -> object:
+    """Run `apply(board)` as one locked read-modify-write.
+
+    P5: submitted through the workspace's kanban_io.GroupCommitter, so
+    mutations racing in from other threads share one R2 lock cycle and
+    one R1 atomic write with this one; the call returns only after that
+    write lands. `apply` returns a payload dict, or an `_error` string
+    with the board untouched (nothing of its own is written). Returns the
+    payload dict, or an `_error` string for apply / read / write failures.
+
+    P9: with `if_version`, `apply` only runs if the board it would edit
+    (inside the lock, after any mutations ahead of it in the group) still
+    has that version; otherwise a version_conflict error, nothing written.
+    """
+    if if_version is not None:
+        unconditional = apply
+
+        def apply(board):
+            if board.version != if_version:
+                return _version_conflict(if_version, board.version)
+            return unconditional(board)
+
+    try:
+        return group_committer(workspace).submit(apply)
+    except LockTimeoutError as e:
+        return _lock_timeout_error(e)
+    except BoardReadError as e:
+        return _error(
+            ERROR_READ_FAILED,
+            f"Error reading kanban board: {str(e)}",
+        )
+    except BoardWriteError as e:
+        return _error(
+            ERROR_WRITE_FAILED,
+            f"Error writing kanban board: {str(e)}",
+        )
+
+
+def _validate_operation(index: int, op) -> Optional[str]:
+    """Shape-check one apply_operations entry; `_error` string or None."""
+    if not isinstance(op, dict) or op.get("op") not in _BATCH_OPS:
+        name = op.get("op") if isinstance(op, dict) else None
+        return _error(
+            ERROR_INVALID_OPERATION,
+            f"Operation {index}: unknown op {name!r}. Must be one of: "
+            f"{', '.join(_BATCH_OPS)}",
+            index=index,
+            op=name,
+            valid_ops=list(_BATCH_OPS),
+        )
+    _, required, optional = _BATCH_OPS[op["op"]]
+    args = set(op) - {"op"}
+    missing = [name for name in required if name not in args]
+    unexpected = sorted(args - set(required) - set(optional))
+    if missing or unexpected:
+        return _error(
+            ERROR_INVALID_OPERATION,
+            f"Operation {index} ({op['op']}): "
+            + "; ".join(filter(None, [
+                f"missing {', '.join(missing)}" if missing else "",
+                f"unexpected {', '.join(unexpected)}" if unexpected else "",
+            ])),
+            index=index,
+            op=op["op"],
+            missing=missing,
+            unexpected=unexpected,
+        )
+    # Every argument is text; None only stands for an omitted optional one.
+    wrong_type = sorted(
+        name for name, value in op.items()
+        if name != "op" and not isinstance(value, str)
+        and not (value is None and name in optional)
+    )
+    if wrong_type:
+        return _error(
+            ERROR_INVALID_OPERATION,
+            f"Operation {index} ({op['op']}): {', '.join(wrong_type)} "
+            f"must be a string",
+            index=index,
+            op=op["op"],
+            wrong_type=wrong_type,
+        )
+    return None
+
+
+def apply_operations(ops: list, workspace: Optional[str] = None,
+                     if_version: Optional[str] = None) -> str:
+    """Apply a list of board operations all-or-nothing, with one write (P4).
+
+    Python API behind the `apply_operations` MCP tool. Each entry is a
+    dict naming a mutating tool in "op" plus that tool's arguments:
+
+        {"op": "add_task", "title": ..., "column"?: ..., "description"?: ...}
+        {"op": "move_task", "title": ..., "from_column": ..., "to_column": ...}
+        {"op": "delete_task", "title": ..., "column": ...}
+        {"op": "propose_done", "title": ...}
+        {"op": "approve_done", "title": ...}
+        {"op": "reject_review", "title": ..., "reason": ...}
+
+    Every op is validated and applied in order against ONE parsed board
+    under ONE kanban_lock, with the same rules as the single-op tool
+    (including the REVIEW gate); later ops see earlier ops' effects. If
+    all succeed the board is written with a single atomic_write_text —
+    one fsync for the whole batch. If any op fails nothing is written.
+
+    Returns `_ok(applied=N, results=[...])`, one `{"success": true, "op":
+    ..., ...}` entry per op; or, on failure, an `_error` whose error_code
+    is the failing op's, with `failed_index` and `results` (successful
+    entries so far plus the failing op's own `_error` body) in context.
+    With `if_version` (P9) the batch applies only to that board version.
+    """
+    if not isinstance(ops, list):
+        return _error(
+            ERROR_INVALID_OPERATION,
+            "ops must be a list of operation objects",
+        )
+    for index, op in enumerate(ops):
+        err = _validate_operation(index, op)
+        if err is not None:
+            return err
+
+    workspace = workspace if workspace is not None else get_workspace()
+    kanban_path = os.path.join(workspace, "_kanban.md")
+    if not os.path.exists(kanban_path):
+        return _error(
+            ERROR_KANBAN_NOT_FOUND,
+            f"Kanban board not found at {kanban_path}",
+            kanban_path=kanban_path,
+        )
+    if not ops:
+        return _ok(applied=0, results=[])
+
+    failure: dict = {}
+
+    def _apply_all(board: Board):
+        # Stage on a copy and adopt only on full success: the board may be
+        # shared with other callers' mutations in the same group commit,
+        # so a failed batch must not leave its first ops behind.
+        staged = board.copy()
+        results = []
+        for index, op in enumerate(ops):
+            handler = _BATCH_OPS[op["op"]][0]
+            args = {k: v for k, v in op.items()
+                    if k != "op" and v is not None}
+            result = handler(staged, **args)
+            if isinstance(result, str):
+                body = json.loads(result)
+                results.append({"op": op["op"], **body})
+                failure.update(index=index, op=op["op"], body=body,
+                               results=results)
+                return result
+            results.append({"success": True, "op": op["op"], **result})
+        board.adopt(staged)
+        return results
+
+    outcome = _mutate_board(workspace, kanban_path, _apply_all, if_version)
+    if failure:
+        body = failure["body"]
+        return _error(
+            body["error_code"],
+            f"Operation {failure['index']} ({failure['op']}) failed: "
+            f"{body['message']} No operations were applied.",
+            failed_index=failure["index"],
+            results=failure["results"],
+        )
+    if isinstance(outcome, str):
+        return outcome
+    return _ok(applied=len(outcome), results=outcome)
+
+
+# The MCP tool registered in register_tools shares the public name, which
+# shadows this function inside register_tools' scope; the tool delegates
+# through this alias.
+_apply_operations = apply_operations
+
+
 def register_tools(server: FastMCP):
     """Register all tools with the MCP server."""
     
     @server.tool()
-    def add_task(title: str, column: str = "TODO", description: str = "") -> str:
+    def add_task(title: str, column: str = "TODO", description: str = "",
+                 if_version: Optional[str] = None) -> str:
         """
         Add a new task to the kanban board.
 
@@ -290,6 +1006,10 @@ def register_tools(server: FastMCP):
                 the board declares; common values are BACKLOG, TODO, DOING,
                 REVIEW, DONE.
             description: Optional task description for additional context
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             Success message or error description
@@ -306,95 +1026,21 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        # column-config: validate against the board's actual columns,
-        # not a hardcoded whitelist. A board with REVIEW (or any custom
-        # column) is fully operable via the MCP tools; the parser was
-        # already permissive here, this aligns the validator with it.
-        valid_columns = discover_columns(get_workspace())
-        if column not in valid_columns:
-            return _error(
-                ERROR_INVALID_COLUMN,
-                f"Invalid column '{column}'. Must be one of: {', '.join(valid_columns)}",
-                column=column,
-                valid_columns=valid_columns,
-            )
-
-        # S6: normalize tabs to spaces before validation so a tab-only
-        # title isn't accepted as 'non-empty' but also isn't rejected
-        # for containing a tab. Validation rejects empty, markdown-
-        # injecting, and over-long titles.
-        title = title.replace("\t", " ")
-        ok, err = validate_task_title(title)
-        if not ok:
-            return _error(ERROR_INVALID_TITLE, err)
-
-        # R2: serialize mutations cross-process so concurrent writers can't lost-update.
-        with kanban_lock(get_workspace()):
-            # Read current board
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
-
-            # Find column section
-            column_header = f"## {column}"
-            if column_header not in content:
-                return _error(
-                    ERROR_COLUMN_NOT_IN_BOARD,
-                    f"Column '{column}' not found in kanban board",
-                    column=column,
-                )
-
-            # Build task line
-            task_line = f"*   [ ] {title}"
-            if description:
-                task_line += f" - {description}"
-
-            # Bug A: canonical-rebuild the target column. Append (not prepend),
-            # always pad header -> blank -> tasks -> blank. Existing tasks are
-            # preserved in order; stray blank lines inside the section are
-            # normalized away.
-            lines = content.split('\n')
-            col_start_idx = next(
-                (i for i, line in enumerate(lines) if line.strip() == column_header),
-                None,
-            )
-            if col_start_idx is None:
-                return _error(
-                    ERROR_COLUMN_NOT_IN_BOARD,
-                    f"Column '{column}' not found in kanban board",
-                    column=column,
-                )
-            col_end_idx = next(
-                (i for i in range(col_start_idx + 1, len(lines))
-                 if lines[i].strip().startswith("## ")),
-                len(lines),
-            )
-            existing_tasks = [
-                ln for ln in lines[col_start_idx + 1:col_end_idx]
-                if ln.strip().startswith(("*", "-"))
-            ]
-            existing_tasks.append(task_line)
-            new_section = [""] + existing_tasks + [""]
-            lines = lines[:col_start_idx + 1] + new_section + lines[col_end_idx:]
-
-            # R1: atomic markdown write (temp + fsync + os.replace).
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
-
-        return f"Successfully added task '{title}' to {column}"
+        # R2: serialize mutations cross-process so concurrent writers can't
+        # lost-update; validation and the edit share one locked read.
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_add_task(board, title, column, description),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
+        task = result["task"]
+        return f"Successfully added task '{task['title']}' to {task['column']}"
     
     @server.tool()
-    def move_task(title: str, from_column: str, to_column: str) -> str:
+    def move_task(title: str, from_column: str, to_column: str,
+                  if_version: Optional[str] = None) -> str:
         """
         Move a task from one column to another.
 
@@ -402,6 +1048,10 @@ def register_tools(server: FastMCP):
             title: Exact title of the task to move
             from_column: Source column — any column present in the board
             to_column: Destination column — any column present in the board
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             Success message or error description
@@ -432,150 +1082,29 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        # column-config: validate both columns against the board's
-        # actual columns rather than a hardcoded whitelist.
-        valid_columns = discover_columns(get_workspace())
-        if from_column not in valid_columns:
-            return _error(
-                ERROR_INVALID_COLUMN,
-                f"Invalid from_column '{from_column}'",
-                column=from_column,
-                valid_columns=valid_columns,
-            )
-        if to_column not in valid_columns:
-            return _error(
-                ERROR_INVALID_COLUMN,
-                f"Invalid to_column '{to_column}'",
-                column=to_column,
-                valid_columns=valid_columns,
-            )
-
-        # Bundle 1b: REVIEW-gate enforcement. The only legitimate path to
-        # DONE is REVIEW -> DONE (via approve_done or reject_review's
-        # Pattern C). Any other from_column -> DONE transition bypasses
-        # the gate and is rejected with a structured error pointing the
-        # caller at the canonical primitives.
-        if to_column == "DONE" and from_column != "REVIEW":
-            # Best-effort state peek using _find_task_column (D9 helper) so
-            # the error context can name the actual current column rather
-            # than only the column the caller claimed. Outside the lock --
-            # this is a diagnostic-only read; the gate-violation is
-            # determined by the (from_column, to_column) pair, not by
-            # board state, so a racy read doesn't affect correctness.
-            actual_column = None
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    _peek_content = f.read()
-                _peek_lines = _peek_content.split('\n')
-                actual_column, _, _ = _find_task_column(_peek_lines, title)
-            except Exception:
-                actual_column = None
-            return _error(
-                ERROR_GATE_VIOLATION,
-                f"Direct move_task to DONE from {from_column} bypasses the "
-                f"REVIEW gate. The canonical path is propose_done(title) "
-                f"to move DOING -> REVIEW, then approve_done(title) to "
-                f"land in DONE. Use reject_review(title, reason) if the "
-                f"work needs rework.",
-                title=title,
-                from_column=from_column,
-                to_column=to_column,
-                actual_column=actual_column,
-                canonical_path=["propose_done", "approve_done"],
-            )
-
         # R2: serialize mutations cross-process so concurrent writers can't lost-update.
-        with kanban_lock(get_workspace()):
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
-
-            lines = content.split('\n')
-
-            # R5: find the task in from_column by exact title equality;
-            # collect titles along the way so a miss can offer near-match hints.
-            task_line = None
-            task_index = None
-            in_from_column = False
-            seen_titles: list = []
-
-            for i, line in enumerate(lines):
-                s = line.strip()
-                if s == f"## {from_column}":
-                    in_from_column = True
-                    continue
-                if s.startswith("## ") and in_from_column:
-                    break  # Entered next column
-
-                if in_from_column:
-                    parsed = _parse_task_title(line)
-                    if parsed is not None:
-                        seen_titles.append(parsed)
-                        if parsed == title:
-                            task_line = line
-                            task_index = i
-                            break
-
-            if task_line is None:
-                suggestions = difflib.get_close_matches(title, seen_titles, n=3, cutoff=0.6)
-                if suggestions:
-                    hint = ", ".join(repr(s) for s in suggestions)
-                    return _error(
-                        ERROR_TASK_NOT_FOUND,
-                        f"Task '{title}' not found in {from_column}. "
-                        f"Did you mean: {hint}?",
-                        title=title,
-                        column=from_column,
-                        available_titles=seen_titles,
-                        suggestions=suggestions,
-                    )
-                return _error(
-                    ERROR_TASK_NOT_FOUND,
-                    f"Task '{title}' not found in {from_column}",
-                    title=title,
-                    column=from_column,
-                    available_titles=seen_titles,
-                )
-
-            # Remove from source column
-            lines.pop(task_index)
-
-            # Update checkbox based on destination
-            if to_column == "DONE":
-                task_line = task_line.replace("[ ]", "[x]")
-            else:
-                task_line = task_line.replace("[x]", "[ ]")
-
-            # Find destination column and insert
-            for i, line in enumerate(lines):
-                if line.strip() == f"## {to_column}":
-                    lines.insert(i + 1, task_line)
-                    break
-
-            # R1: atomic markdown write (temp + fsync + os.replace).
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
-
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_move_task(board, title, from_column, to_column),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
         return f"Successfully moved '{title}' from {from_column} to {to_column}"
     
     @server.tool()
-    def delete_task(title: str, column: str) -> str:
+    def delete_task(title: str, column: str,
+                    if_version: Optional[str] = None) -> str:
         """
         Delete a task from the kanban board.
 
         Args:
             title: Exact title of the task to delete
             column: Column containing the task — any column present in the board
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             Success message or error description
@@ -596,98 +1125,19 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        # column-config: fail fast with a structured invalid_column
-        # error if the caller asks for a column not on the board, rather
-        # than silently returning task_not_found from the search loop.
-        valid_columns = discover_columns(get_workspace())
-        if column not in valid_columns:
-            return _error(
-                ERROR_INVALID_COLUMN,
-                f"Invalid column '{column}'",
-                column=column,
-                valid_columns=valid_columns,
-            )
-
         # R2: serialize mutations cross-process so concurrent writers can't lost-update.
-        with kanban_lock(get_workspace()):
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
-
-            lines = content.split('\n')
-
-            # R5: find by exact title equality; collect titles for near-match
-            # hints if the lookup misses.
-            task_index = None
-            in_column = False
-            seen_titles: list = []
-
-            for i, line in enumerate(lines):
-                s = line.strip()
-                if s == f"## {column}":
-                    in_column = True
-                    continue
-                if s.startswith("## ") and in_column:
-                    break
-
-                if in_column:
-                    parsed = _parse_task_title(line)
-                    if parsed is not None:
-                        seen_titles.append(parsed)
-                        if parsed == title:
-                            task_index = i
-                            break
-
-            if task_index is None:
-                suggestions = difflib.get_close_matches(title, seen_titles, n=3, cutoff=0.6)
-                if suggestions:
-                    hint = ", ".join(repr(s) for s in suggestions)
-                    return _error(
-                        ERROR_TASK_NOT_FOUND,
-                        f"Task '{title}' not found in {column}. "
-                        f"Did you mean: {hint}?",
-                        title=title,
-                        column=column,
-                        available_titles=seen_titles,
-                        suggestions=suggestions,
-                    )
-                return _error(
-                    ERROR_TASK_NOT_FOUND,
-                    f"Task '{title}' not found in {column}",
-                    title=title,
-                    column=column,
-                    available_titles=seen_titles,
-                )
-
-            lines.pop(task_index)
-            # Bug A round-trip: compact any consecutive blank lines created
-            # at the deletion point so add_task -> delete_task is a no-op
-            # on the markdown shape.
-            while (
-                0 < task_index < len(lines)
-                and lines[task_index].strip() == ""
-                and lines[task_index - 1].strip() == ""
-            ):
-                lines.pop(task_index)
-
-            # R1: atomic markdown write (temp + fsync + os.replace).
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
-
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_delete_task(board, title, column),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
         return f"Successfully deleted task '{title}' from {column}"
     
     @server.tool()
-    def list_tasks(column: Optional[str] = None, verbose: bool = False) -> str:
+    def list_tasks(column: Optional[str] = None, verbose: bool = False,
+                   include_version: bool = False) -> str:
         """
         List tasks from the kanban board.
 
@@ -698,6 +1148,10 @@ def register_tools(server: FastMCP):
                    of titles-only. Description is the text after ` - ` on the
                    task line, or null if no separator. Default False keeps
                    the existing titles-only shape for back-compat.
+            include_version: If True, wrap the result as {"version": str,
+                   "tasks": {...}} so a follow-up mutation can pass
+                   if_version=version and fail fast (version_conflict)
+                   if the board changed in between.
 
         Returns:
             JSON string with task information
@@ -712,6 +1166,9 @@ def register_tools(server: FastMCP):
 
         Output format (verbose=True):
             {"BACKLOG": [{"title": "Task 1", "description": "details"}], ...}
+
+        Output format (include_version=True):
+            {"version": "3f1c...", "tasks": {"BACKLOG": [...], ...}}
         """
         kanban_path = get_kanban_path()
 
@@ -723,77 +1180,89 @@ def register_tools(server: FastMCP):
             )
 
         try:
-            with open(kanban_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            board = read_board(kanban_path)
+        except LockTimeoutError as e:
+            return _lock_timeout_error(e)
         except Exception as e:
             return _error(
                 ERROR_READ_FAILED,
                 f"Error reading kanban board: {str(e)}",
             )
 
-        lines = content.split('\n')
-        tasks: dict = {}
+        # Every column on the board appears, even when empty.
+        tasks: dict = {name: [] for name in board.columns}
         # D4: per-column set of titles already added on this parse,
         # used to detect and dedupe same-title rows. Audit recommends
         # dedupe over keep-both because the sync path otherwise creates
         # duplicate GitHub items. First occurrence wins.
-        seen_per_column: dict = {}
-        current_column = None
-
-        for line in lines:
-            if line.strip().startswith("## "):
-                current_column = line.strip()[3:].strip()
-                tasks.setdefault(current_column, [])
-                seen_per_column.setdefault(current_column, set())
-            elif current_column:
-                parsed = _parse_task_title_with_description(line)
-                if parsed is not None:
-                    title, description = parsed
-                    if title in seen_per_column[current_column]:
-                        print(
-                            f"Warning: duplicate task title in column "
-                            f"'{current_column}': '{title}'. Keeping first "
-                            f"occurrence; dropping subsequent duplicate.",
-                            file=sys.stderr,
-                        )
-                        continue
-                    seen_per_column[current_column].add(title)
-                    if verbose:
-                        tasks[current_column].append(
-                            {"title": title, "description": description}
-                        )
-                    else:
-                        tasks[current_column].append(title)
+        seen_per_column: dict = {name: set() for name in board.columns}
+
+        for record in board.tasks:
+            current_column = record.column
+            title = record.title
+            if title in seen_per_column[current_column]:
+                print(
+                    f"Warning: duplicate task title in column "
+                    f"'{current_column}': '{title}'. Keeping first "
+                    f"occurrence; dropping subsequent duplicate.",
+                    file=sys.stderr,
+                )
+                continue
+            seen_per_column[current_column].add(title)
+            if verbose:
+                tasks[current_column].append(
+                    {"title": title, "description": record.description}
+                )
+            else:
+                tasks[current_column].append(title)
 
         # Filter by column if specified. column-config: validate
         # against the columns actually present on the board (the
         # parser's source of truth) rather than silently returning an
         # empty list for typos / made-up names.
         if column:
-            if column in tasks:
-                return json.dumps({column: tasks[column]}, indent=2)
-            return _error(
-                ERROR_INVALID_COLUMN,
-                f"Invalid column '{column}'",
-                column=column,
-                valid_columns=list(tasks.keys()),
-            )
+            if column not in tasks:
+                return _error(
+                    ERROR_INVALID_COLUMN,
+                    f"Invalid column '{column}'",
+                    column=column,
+                    valid_columns=list(tasks.keys()),
+                )
+            tasks = {column: tasks[column]}
 
+        if include_version:
+            # P9: the version of the exact snapshot these tasks came from.
+            return json.dumps({"version": board.version, "tasks": tasks},
+                              indent=2)
         return json.dumps(tasks, indent=2)
     
     @server.tool()
-    def sync_to_github(dry_run: bool = False) -> str:
+    def sync_to_github(dry_run: bool = False, force: bool = False,
+                       rebuild_state: bool = False) -> str:
         """
         Sync the kanban board to GitHub Projects V2.
         
         Args:
-            dry_run: If True, shows what would be synced without making changes (default: False)
+            dry_run: If True, make no changes and return the sync plan as
+                JSON: {"success": true, "dry_run": true, "plan": {...}}
+                with typed operations (create / update / archive / noop),
+                per-kind counts and an "estimate" of GitHub requests and
+                rate-limit points under the current batching settings
+                (default: False)
+            force: If True, sync even when the board is unchanged since the
+                last complete sync (which otherwise returns "Up to date"
+                without contacting GitHub). Use after editing or deleting
+                items directly on the GitHub Project.
+            rebuild_state: If True, first re-derive the .kanban.json sync
+                state from the GitHub Project's items (matched by task id
+                or title), so a lost state file doesn't duplicate every
+                item. Happens automatically after a corrupt state reset.
         
         Returns:
-            Sync results or error message
+            Sync results, the dry-run plan, or error message
         
         Example:
-            sync_to_github(dry_run=True)  # Preview changes
+            sync_to_github(dry_run=True)  # Preview changes and cost
             sync_to_github()  # Actually sync
         
         Requirements:
@@ -815,27 +1284,38 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        # Check for required environment variables
-        if not os.getenv("GITHUB_TOKEN"):
+        # Check for required environment variables. P19: as the sync will
+        # see them — the workspace .env overrides the process env, the
+        # precedence the sync CLI has always applied.
+        env = build_effective_env(read_env_file_values(Path(workspace)))
+        if not env.get("GITHUB_TOKEN"):
             return _error(
                 ERROR_MISSING_GITHUB_TOKEN,
                 "GITHUB_TOKEN environment variable not set. "
                 "Run the `doctor` tool to diagnose sync configuration.",
             )
-        if not os.getenv("GITHUB_REPO"):
+        if not env.get("GITHUB_REPO"):
             return _error(
                 ERROR_MISSING_GITHUB_REPO,
                 "GITHUB_REPO environment variable not set. "
                 "Run the `doctor` tool to diagnose sync configuration.",
             )
         
-        TIMEOUT_SEC = int(os.getenv("KANBANGER_SYNC_TIMEOUT_SEC", "60"))
+        TIMEOUT_SEC = int(env.get("KANBANGER_SYNC_TIMEOUT_SEC", "60"))
+
+        if env.get(SYNC_MODE_ENV, "").strip().lower() != "subprocess":
+            return _sync_in_process(kanban_path, env, dry_run, force,
+                                    TIMEOUT_SEC, rebuild_state)
 
         # Audit R4: use sys.executable instead of bare "python" so the
         # subprocess always runs under the same interpreter as the MCP server.
         cmd = [sys.executable, "-m", "sync_kanban", kanban_path]
         if dry_run:
-            cmd.append("--dry-run")
+            cmd.extend(["--dry-run", "--json"])
+        if force:
+            cmd.append("--force")
+        if rebuild_state:
+            cmd.append("--rebuild-state")
 
         def _drain(stream, sink):
             try:
@@ -870,22 +1350,16 @@ def register_tools(server: FastMCP):
             proc.wait()
             t_out.join(timeout=2)
             t_err.join(timeout=2)
-            return _error(
-                ERROR_SYNC_TIMEOUT,
-                f"sync_to_github timed out after {TIMEOUT_SEC}s "
-                f"(set KANBANGER_SYNC_TIMEOUT_SEC to override; check "
-                f"GITHUB_REPO env var and network reachability). "
-                f"Run the `doctor` tool to diagnose sync configuration.",
-                timeout_sec=TIMEOUT_SEC,
-            )
+            return _sync_timeout_error(TIMEOUT_SEC)
         t_out.join(timeout=5)
         t_err.join(timeout=5)
         stdout = ''.join(stdout_chunks)
         stderr = ''.join(stderr_chunks)
 
         if rc == 0:
-            mode = "preview" if dry_run else "complete"
-            return f"Sync {mode}:\n\n{stdout}"
+            if dry_run:
+                return _ok(dry_run=True, plan=json.loads(stdout))
+            return f"Sync complete:\n\n{stdout}"
 
         # E2: subprocess failed. Translate the E1-prefixed stderr
         # ("Error: <msg>") back to a structured code so callers don't
@@ -949,12 +1423,16 @@ def register_tools(server: FastMCP):
             }, indent=2)
 
     @server.tool()
-    def propose_done(title: str) -> str:
+    def propose_done(title: str, if_version: Optional[str] = None) -> str:
         """
         Propose a task as done, moving it from DOING to REVIEW.
 
         Args:
             title: Exact title of the task currently in DOING.
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             JSON string. On success:
@@ -981,9 +1459,11 @@ def register_tools(server: FastMCP):
             - task_not_found: title doesn't match any task
             - invalid_state: task exists but is not in DOING (current
               column reported in context)
+            - version_conflict: if_version given and the board has changed
             - write_failed: atomic write failed
         """
         kanban_path = get_kanban_path()
+
         if not os.path.exists(kanban_path):
             return _error(
                 ERROR_KANBAN_NOT_FOUND,
@@ -991,64 +1471,26 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        with kanban_lock(get_workspace()):
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
-
-            lines = content.split('\n')
-
-            # D9: hoisted state-lookup helper (Bundle 1b item 1).
-            found_in_column, found_index, found_line = _find_task_column(lines, title)
-
-            if found_in_column is None:
-                return _error(
-                    ERROR_TASK_NOT_FOUND,
-                    f"Task '{title}' not found in any column",
-                    title=title,
-                )
-            if found_in_column != "DOING":
-                return _error(
-                    ERROR_INVALID_STATE,
-                    f"Task '{title}' is in {found_in_column}, not DOING. "
-                    f"propose_done moves DOING -> REVIEW only.",
-                    title=title,
-                    current_column=found_in_column,
-                    expected_column="DOING",
-                )
-
-            # Move from DOING to REVIEW (insert immediately after the
-            # `## REVIEW` header). Item 1.5's auto-migration guarantees
-            # REVIEW is on the board.
-            lines.pop(found_index)
-            for i, line in enumerate(lines):
-                if line.strip() == "## REVIEW":
-                    lines.insert(i + 1, found_line)
-                    break
-
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
-
-        return _ok(task={"title": title, "from_column": "DOING",
-                         "to_column": "REVIEW"})
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_propose_done(board, title),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
+        return _ok(**result)
 
     @server.tool()
-    def approve_done(title: str) -> str:
+    def approve_done(title: str, if_version: Optional[str] = None) -> str:
         """
         Approve a task in REVIEW, moving it to DONE.
 
         Args:
             title: Exact title of the task currently in REVIEW.
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             JSON string. On success:
@@ -1074,9 +1516,11 @@ def register_tools(server: FastMCP):
             - kanban_not_found: _kanban.md missing in workspace
             - task_not_found: title doesn't match any task
             - invalid_state: task exists but is not in REVIEW
+            - version_conflict: if_version given and the board has changed
             - write_failed: atomic write failed
         """
         kanban_path = get_kanban_path()
+
         if not os.path.exists(kanban_path):
             return _error(
                 ERROR_KANBAN_NOT_FOUND,
@@ -1084,59 +1528,18 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        with kanban_lock(get_workspace()):
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
-
-            lines = content.split('\n')
-
-            # D9: hoisted state-lookup helper (Bundle 1b item 1).
-            found_in_column, found_index, found_line = _find_task_column(lines, title)
-
-            if found_in_column is None:
-                return _error(
-                    ERROR_TASK_NOT_FOUND,
-                    f"Task '{title}' not found in any column",
-                    title=title,
-                )
-            if found_in_column != "REVIEW":
-                return _error(
-                    ERROR_INVALID_STATE,
-                    f"Task '{title}' is in {found_in_column}, not REVIEW. "
-                    f"approve_done moves REVIEW -> DONE only.",
-                    title=title,
-                    current_column=found_in_column,
-                    expected_column="REVIEW",
-                )
-
-            # Flip checkbox to [x] (move_task convention for DONE) and
-            # insert after the `## DONE` header.
-            lines.pop(found_index)
-            done_line = found_line.replace("[ ]", "[x]")
-            for i, line in enumerate(lines):
-                if line.strip() == "## DONE":
-                    lines.insert(i + 1, done_line)
-                    break
-
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
-
-        return _ok(task={"title": title, "from_column": "REVIEW",
-                         "to_column": "DONE"})
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_approve_done(board, title),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
+        return _ok(**result)
 
     @server.tool()
-    def reject_review(title: str, reason: str) -> str:
+    def reject_review(title: str, reason: str,
+                      if_version: Optional[str] = None) -> str:
         """
         Reject work in REVIEW, recording the rejection and creating a new
         Rework task.
@@ -1146,6 +1549,10 @@ def register_tools(server: FastMCP):
             reason: Required human-readable reason for the rejection.
                 Cannot be None or empty/whitespace; the reason is the
                 context the Rework task carries forward.
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the call fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
         Returns:
             JSON string. On success:
@@ -1178,9 +1585,11 @@ def register_tools(server: FastMCP):
             - task_not_found: title doesn't match any task
             - invalid_state: task exists but is not in REVIEW (current
               column reported in context)
+            - version_conflict: if_version given and the board has changed
             - write_failed: atomic write failed
         """
         kanban_path = get_kanban_path()
+
         if not os.path.exists(kanban_path):
             return _error(
                 ERROR_KANBAN_NOT_FOUND,
@@ -1188,118 +1597,68 @@ def register_tools(server: FastMCP):
                 kanban_path=kanban_path,
             )
 
-        # Reason validation BEFORE board I/O — caller error, no lock needed.
-        if reason is None or not str(reason).strip():
-            return _error(
-                ERROR_MISSING_REASON,
-                "reject_review requires a non-empty reason. A rejection "
-                "without context would create a Rework task with no "
-                "actionable description.",
-                title=title,
-            )
-
-        with kanban_lock(get_workspace()):
-            try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                return _error(
-                    ERROR_READ_FAILED,
-                    f"Error reading kanban board: {str(e)}",
-                )
+        result = _mutate_board(
+            get_workspace(), kanban_path,
+            lambda board: _op_reject_review(board, title, reason),
+            if_version,
+        )
+        if isinstance(result, str):
+            return result
+        return _ok(**result)
 
-            lines = content.split('\n')
+    @server.tool()
+    def apply_operations(ops: list[dict],
+                         if_version: Optional[str] = None) -> str:
+        """
+        Apply several board mutations at once: all-or-nothing, one write.
 
-            # D9: hoisted state-lookup helper (Bundle 1b item 1). reject_review
-            # discards the line text -- _format_rework_entries generates fresh
-            # lines from the title rather than reusing the source line.
-            found_in_column, found_index, _ = _find_task_column(lines, title)
+        Use this instead of a run of add_task / move_task / ... calls (e.g.
+        planning a backlog): the whole list is validated and applied
+        against one board under one lock and written once.
 
-            if found_in_column is None:
-                return _error(
-                    ERROR_TASK_NOT_FOUND,
-                    f"Task '{title}' not found in any column",
-                    title=title,
-                )
-            if found_in_column != "REVIEW":
-                return _error(
-                    ERROR_INVALID_STATE,
-                    f"Task '{title}' is in {found_in_column}, not REVIEW. "
-                    f"reject_review moves REVIEW -> DONE (with REJECTED "
-                    f"annotation) only.",
-                    title=title,
-                    current_column=found_in_column,
-                    expected_column="REVIEW",
-                )
+        Args:
+            ops: List of operations, applied in order. Each is an object
+                whose "op" names a mutating tool, plus that tool's
+                arguments:
+                  {"op": "add_task", "title": ..., "column"?: ..., "description"?: ...}
+                  {"op": "move_task", "title": ..., "from_column": ..., "to_column": ...}
+                  {"op": "delete_task", "title": ..., "column": ...}
+                  {"op": "propose_done", "title": ...}
+                  {"op": "approve_done", "title": ...}
+                  {"op": "reject_review", "title": ..., "reason": ...}
+            if_version: Optional board version token (from
+                list_tasks(include_version=True) or kanban://stats). When
+                given, the batch fails with "version_conflict" and changes
+                nothing unless the board is still at that version.
 
-            # S7: Re-validate the Rework title against the same rules add_task
-            # applies. Without this, an original title near the 500-char cap
-            # can produce a Rework title that exceeds the cap (or otherwise
-            # violates the title-validation rules) once the "Rework: " prefix
-            # is prepended. Defense-in-depth against future rule changes too.
-            # Atomic property preserved -- no lines.pop / lines.insert has run
-            # yet, so the board is untouched and the original stays in REVIEW.
-            rework_title = f"Rework: {title}"
-            ok, err = validate_task_title(rework_title)
-            if not ok:
-                return _error(
-                    ERROR_INVALID_TITLE,
-                    f"Rework task title would be invalid: {err}. The original "
-                    f"title is too long (or contains a forbidden pattern) for "
-                    f"the 'Rework: ' prefix to be appended. Original title "
-                    f"length: {len(title)}; rework title length: "
-                    f"{len(rework_title)}; cap: {TITLE_MAX_LEN}.",
-                    title=title,
-                    rework_title=rework_title,
-                    original_title_length=len(title),
-                    rework_title_length=len(rework_title),
-                    max_length=TITLE_MAX_LEN,
-                    underlying_error=err,
-                )
+        Returns:
+            JSON string. On success:
+                {"success": true, "applied": N,
+                 "results": [{"success": true, "op": "add_task",
+                              "task": {...}}, ...]}
+            On error nothing is written: {"success": false, "error_code":
+            <the failing op's code>, "message": str, "context":
+            {"failed_index": i, "results": [...]}}
 
-            # Pattern C: two-entry atomic move.
-            # 1. Remove the original line from REVIEW.
-            # 2. Insert the REJECTED-annotated line at top of DONE.
-            # 3. Insert the new Rework line at top of TODO.
-            # All inside one lock + one atomic_write_text so the kanban
-            # is never in a half-rejected state.
-            done_line, rework_line = _format_rework_entries(title, reason)
-            lines.pop(found_index)
-
-            # Insert into DONE first. Since DONE comes after TODO in
-            # canonical column order, inserting into DONE first does
-            # not perturb the TODO header index for the second insert.
-            for i, line in enumerate(lines):
-                if line.strip() == "## DONE":
-                    lines.insert(i + 1, done_line)
-                    break
-            for i, line in enumerate(lines):
-                if line.strip() == "## TODO":
-                    lines.insert(i + 1, rework_line)
-                    break
+        Example:
+            apply_operations([
+                {"op": "add_task", "title": "Design schema", "column": "TODO"},
+                {"op": "add_task", "title": "Write migrations", "column": "TODO"},
+                {"op": "move_task", "title": "Design schema",
+                 "from_column": "TODO", "to_column": "DOING"},
+            ])
 
-            try:
-                atomic_write_text(kanban_path, '\n'.join(lines))
-            except Exception as e:
-                return _error(
-                    ERROR_WRITE_FAILED,
-                    f"Error writing kanban board: {str(e)}",
-                )
+        Note:
+            Every single-op rule still applies per entry, including the
+            REVIEW gate: move_task to DONE is rejected unless from REVIEW.
 
-        annotation = f"REJECTED: {reason}; rework: Rework: {title}"
-        return _ok(
-            original={
-                "title": title,
-                "from_column": "REVIEW",
-                "to_column": "DONE",
-                "annotation": annotation,
-            },
-            rework={
-                "title": f"Rework: {title}",
-                "column": "TODO",
-                "reason": reason,
-            },
-        )
+        Errors:
+            - invalid_operation: unknown op, or missing/unexpected arguments
+            - version_conflict: if_version given and the board has changed
+            - kanban_not_found: _kanban.md missing in workspace
+            - any single-op error code, from the first op that failed
+        """
+        return _apply_operations(ops, if_version=if_version)
 
     @server.tool()
     def setup_project() -> str:
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+bench_durability.py — time kanban_io.atomic_write_text under each durability mode.
+
+Writes a board-sized payload N times per mode into DIR (default: a fresh
+temp directory) and prints per-write latency. Point DIR at the filesystem
+you actually deploy on — tmpfs, a laptop SSD and a network volume give
+very different answers, which is the point of making the mode selectable.
+
+Usage:
+    python scripts/bench_durability.py [--writes N] [--size BYTES] [DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from kanban_io import DURABILITY_MODES, atomic_write_text  # noqa: E402
+
+
+def bench(directory: str, mode: str, writes: int, payload: str) -> list[float]:
+    path = os.path.join(directory, f"_bench_{mode}.md")
+    samples = []
+    for _ in range(writes):
+        start = time.perf_counter()
+        atomic_write_text(path, payload, durability=mode)
+        samples.append(time.perf_counter() - start)
+    os.unlink(path)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("dir", nargs="?", help="directory to write into")
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--size", type=int, default=8192,
+                        help="payload size in bytes (default 8192)")
+    args = parser.parse_args()
+
+    payload = ("*   [ ] task line\n" * (args.size // 18 + 1))[: args.size]
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        print(f"{args.writes} writes of {args.size} bytes in {directory}")
+        print(f"{'mode':<10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+        for mode in DURABILITY_MODES:
+            samples = sorted(bench(directory, mode, args.writes, payload))
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(
+                f"{mode:<10} {statistics.mean(samples) * 1000:>9.3f} "
+                f"{statistics.median(samples) * 1000:>9.3f} {p95 * 1000:>9.3f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+bench_sync.py — time sync_kanban.run_sync against the local fake GitHub API.
+
+For each board size, syncs a synthetic board through the real GitHubClient
+and Syncer to scripts/fake_github.py in three phases — `create` (cold sync
+of every task), `move` (every task changes column), `noop` (nothing
+changed) — and prints GitHub requests, wall time, p50/p99 request latency,
+milliseconds per task operation and bytes on the wire. Use --latency-ms /
+--jitter-ms to approximate api.github.com round trips; the client's own
+rate limiter is opened wide so the numbers show the engine, not the pacing.
+
+Usage:
+    python scripts/bench_sync.py [--sizes 10,1000,10000] [--latency-ms MS]
+        [--jitter-ms MS] [--batch-size N] [--concurrency N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_github import start_fake_github  # noqa: E402
+from sync_kanban import GitHubClient, RateLimiter, run_sync  # noqa: E402
+
+PHASES = (("create", "TODO"), ("move", "DOING"), ("noop", "DOING"))
+
+
+def write_board(path: str, size: int, column: str) -> None:
+    lines = [f"# Bench\n\n## {column}\n"]
+    lines.extend(f"*   [ ] Task {n:05d}\n" for n in range(size))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+def pct(samples: list[float], p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0.0
+
+
+def bench(size: int, args) -> list[dict]:
+    server = start_fake_github(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                               rate_limit=10 ** 9, seed=size)
+    client = GitHubClient(
+        "bench", api_url=server.url, pool_size=args.concurrency,
+        limiter=RateLimiter(rate=10 ** 6, burst=10 ** 6, reserve=0),
+    )
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "_kanban.md")
+            for phase, column in PHASES:
+                write_board(path, size, column)
+                server.reset_stats()
+                start = time.perf_counter()
+                result = run_sync(path, "o/r", 1, client=client,
+                                  batch_size=args.batch_size,
+                                  concurrency=args.concurrency,
+                                  out=io.StringIO(), err=io.StringIO())
+                wall = time.perf_counter() - start
+                samples = sorted(client.latencies)
+                ops = result.created + result.updated + result.archived
+                stats = server.stats()
+                rows.append({
+                    "size": size, "phase": phase, "ops": ops,
+                    "requests": stats["requests"], "wall_s": wall,
+                    "p50_ms": pct(samples, 0.5) * 1000,
+                    "p99_ms": pct(samples, 0.99) * 1000,
+                    "ms_per_op": wall * 1000 / ops if ops else 0.0,
+                    "kib_out": stats["bytes_in"] / 1024,
+                    "kib_in": stats["bytes_out"] / 1024,
+                })
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,1000,10000",
+                        help="comma-separated board sizes (default 10,1000,10000)")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="server-side delay per request (default 0)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0,
+                        help="extra uniform random delay per request (default 0)")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>6} {'phase':<7} {'ops':>6} {'reqs':>5} {'wall s':>8} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'ms/op':>7} {'KiB sent':>9} {'KiB recv':>9}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        for row in bench(size, args):
+            print(
+                f"{row['size']:>6} {row['phase']:<7} {row['ops']:>6} "
+                f"{row['requests']:>5} {row['wall_s']:>8.3f} {row['p50_ms']:>8.2f} "
+                f"{row['p99_ms']:>8.2f} {row['ms_per_op']:>7.3f} "
+                f"{row['kib_out']:>9.1f} {row['kib_in']:>9.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
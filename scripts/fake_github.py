@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+fake_github.py — local stand-in for the GitHub Projects V2 GraphQL API.
+
+Serves the documents sync_kanban.GitHubClient sends, offline: the
+repository/project metadata query, paginated project items, and the
+draft-id lookups by item id, and the (aliased) addProjectV2DraftIssue /
+updateProjectV2ItemFieldValue / archiveProjectV2Item /
+updateProjectV2DraftIssue mutations. Requests are routed by the fields they
+contain — this is not a general GraphQL engine, so a new document shape
+in GitHubClient needs a matching branch here.
+
+It also answers like GitHub does around the edges the client handles:
+X-RateLimit-* headers and a `rateLimit { cost remaining resetAt }`
+object, per-alias mutation errors, throttling (429 + Retry-After) and
+transport failures (502), with configurable latency and jitter. Counts
+requests and bytes in both directions for benchmarks
+(scripts/bench_sync.py).
+
+Usage:
+    python scripts/fake_github.py [--port 8765] [--latency-ms 50] ...
+
+The served repository is o/r with project #1; point a GitHubClient at
+the printed URL with api_url= (any token is accepted). From tests, use
+start_fake_github(...) and .shutdown() the returned server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+STATUS_OPTIONS = ("Backlog", "Todo", "InProgress", "Review", "Done")
+
+# `alias: field(input: {arg: $var, nested: {arg: $var}})` in a mutation.
+_MUTATION_FIELD_RE = re.compile(r"(?:(\w+)\s*:\s*)?(\w+)\(input:\s*\{(.*?)\}\s*\)\s*\{",
+                                re.S)
+_ARGUMENT_RE = re.compile(r"(\w+):\s*\$(\w+)")
+_PAGE_SIZE_RE = re.compile(r"items\(first:\s*(\d+)")
+
+
+class FakeProject:
+    """In-memory project: one repo, one project, one Status field."""
+
+    def __init__(self, owner: str = "o", repo: str = "r", number: int = 1):
+        self.owner, self.repo, self.number = owner, repo, number
+        self.repo_id = "R_fake"
+        self.project_id = "PVT_fake"
+        self.field_id = "PVTSSF_status"
+        self.options = {name: f"opt_{name}" for name in STATUS_OPTIONS}
+        self.items: Dict[str, Dict] = {}
+        self._order: List[str] = []
+        self._next = 0
+        self.lock = threading.Lock()
+
+    def add_item(self, title: str, body: str = "") -> str:
+        self._next += 1
+        item_id = f"PVTI_{self._next}"
+        self.items[item_id] = {"title": title, "body": body, "option": None,
+                               "archived": False, "draft_id": f"DI_{self._next}"}
+        self._order.append(item_id)
+        return item_id
+
+    def live_items(self) -> List[Tuple[str, Dict]]:
+        return [(i, self.items[i]) for i in self._order
+                if not self.items[i]["archived"]]
+
+
+class FakeGitHubServer(ThreadingHTTPServer):
+    """HTTP/1.1 keep-alive server holding a FakeProject and the knobs.
+
+    latency_ms / jitter_ms: added before every response.
+    error_rate: share of requests answered 502 (transport failure).
+    throttle_rate: share answered 429 with Retry-After: retry_after.
+    alias_error_rate: share of mutation fields failing with a GraphQL
+        error on their alias only.
+    rate_limit: points per window; every request costs one.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 0.0,
+                 alias_error_rate: float = 0.0, rate_limit: int = 5000,
+                 seed: Optional[int] = None):
+        super().__init__(address, _Handler)
+        self.project = FakeProject()
+        self.latency_ms, self.jitter_ms = latency_ms, jitter_ms
+        self.error_rate, self.throttle_rate = error_rate, throttle_rate
+        self.retry_after = retry_after
+        self.alias_error_rate = alias_error_rate
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_at = int(time.time()) + 3600
+        self.random = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/graphql"
+
+    def reset_stats(self) -> None:
+        with self.stats_lock:
+            self.requests = 0
+            self.mutations = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+
+    def stats(self) -> Dict:
+        with self.stats_lock:
+            return {"requests": self.requests, "mutations": self.mutations,
+                    "bytes_in": self.bytes_in, "bytes_out": self.bytes_out}
+
+    # -- GraphQL ---------------------------------------------------------
+
+    def execute(self, query: str, variables: Dict) -> Dict:
+        if query.lstrip().startswith("mutation"):
+            return self._mutation(query, variables)
+        data: Dict = {}
+        if "rateLimit" in query:
+            data["rateLimit"] = {
+                "cost": 1, "remaining": self.remaining,
+                "resetAt": time.strftime("%Y-%m-%dT%H:%M:%SZ",
+                                         time.gmtime(self.reset_at)),
+            }
+        if "repository(" in query:
+            data["repository"] = self._repository(variables)
+        elif "nodes(ids" in query:
+            data["nodes"] = self._nodes(variables.get("ids") or [])
+        elif "items(" in query:
+            match = _PAGE_SIZE_RE.search(query)
+            data["node"] = self._items(variables, int(match.group(1)) if match else 100)
+        else:
+            return {"errors": [{"message": "fake_github: unsupported query"}]}
+        return {"data": data}
+
+    def _repository(self, variables: Dict) -> Optional[Dict]:
+        project = self.project
+        if (variables.get("owner"), variables.get("repo")) != (project.owner, project.repo):
+            return None
+        return {
+            "id": project.repo_id,
+            "projectsV2": {"nodes": [{
+                "id": project.project_id,
+                "number": project.number,
+                "title": "Fake project",
+                "fields": {"nodes": [
+                    {"id": "PVTF_title", "name": "Title"},
+                    {"id": project.field_id, "name": "Status", "options": [
+                        {"id": option_id, "name": name}
+                        for name, option_id in project.options.items()
+                    ]},
+                ]},
+            }]},
+        }
+
+    def _items(self, variables: Dict, page_size: int) -> Dict:
+        project = self.project
+        with project.lock:
+            live = project.live_items()
+        start = int(variables.get("cursor") or 0)
+        page = live[start:start + page_size]
+        names = {option_id: name for name, option_id in project.options.items()}
+        nodes = []
+        for item_id, item in page:
+            values = []
+            if item["option"]:
+                values.append({"name": names[item["option"]],
+                               "field": {"name": "Status"}})
+            nodes.append({"id": item_id,
+                          "content": {"title": item["title"], "body": item["body"]},
+                          "fieldValues": {"nodes": values}})
+        end = start + len(page)
+        return {"items": {
+            "pageInfo": {"hasNextPage": end < len(live), "endCursor": str(end)},
+            "nodes": nodes,
+        }}
+
+    def _nodes(self, ids: List[str]) -> List[Optional[Dict]]:
+        with self.project.lock:
+            items = [self.project.items.get(item_id) for item_id in ids]
+        return [{"id": item_id, "content": {"id": item["draft_id"]}} if item else None
+                for item_id, item in zip(ids, items)]
+
+    def _mutation(self, query: str, variables: Dict) -> Dict:
+        data: Dict = {}
+        errors: List[Dict] = []
+        project = self.project
+        for match in _MUTATION_FIELD_RE.finditer(query):
+            alias, name, arguments = match.group(1) or match.group(2), \
+                match.group(2), match.group(3)
+            args = {key: variables.get(var) for key, var in _ARGUMENT_RE.findall(arguments)}
+            with self.stats_lock:
+                self.mutations += 1
+            if self.alias_error_rate and self.random.random() < self.alias_error_rate:
+                data[alias] = None
+                errors.append({"path": [alias], "message": "fake_github: injected error"})
+                continue
+            with project.lock:
+                result, error = self._apply(name, args)
+            if error:
+                data[alias] = None
+                errors.append({"path": [alias], "message": error})
+            else:
+                data[alias] = result
+        body: Dict = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return body
+
+    def _apply(self, name: str, args: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+        project = self.project
+        if name == "updateProjectV2DraftIssue":
+            for item in project.items.values():
+                if item["draft_id"] == args.get("draftIssueId"):
+                    item["title"] = args.get("title") or item["title"]
+                    if args.get("body") is not None:
+                        item["body"] = args["body"]
+                    return {"draftIssue": {"id": item["draft_id"]}}, None
+            return None, f"Could not resolve to a node with the global id of '{args.get('draftIssueId')}'"
+        if args.get("projectId") != project.project_id:
+            return None, f"Could not resolve to a node with the global id of '{args.get('projectId')}'"
+        if name == "addProjectV2DraftIssue":
+            item_id = project.add_item(args.get("title") or "", args.get("body") or "")
+            return {"projectItem": {"id": item_id}}, None
+        item = project.items.get(args.get("itemId"))
+        if item is None:
+            return None, f"Could not resolve to a node with the global id of '{args.get('itemId')}'"
+        if name == "updateProjectV2ItemFieldValue":
+            if args.get("fieldId") != project.field_id:
+                return None, "The field does not belong to the project"
+            if args.get("singleSelectOptionId") not in project.options.values():
+                return None, "The single select option Id does not belong to the field"
+            item["option"] = args["singleSelectOptionId"]
+            return {"projectV2Item": {"id": args["itemId"]}}, None
+        if name == "archiveProjectV2Item":
+            item["archived"] = True
+            return {"item": {"id": args["itemId"]}}, None
+        return None, f"fake_github: unsupported mutation {name}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like api.github.com
+    # Headers and body go out as separate writes; without TCP_NODELAY
+    # delayed ACKs add ~40 ms to every loopback response.
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        server: FakeGitHubServer = self.server
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        delay = server.latency_ms
+        if server.jitter_ms:
+            delay += server.random.uniform(0, server.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        with server.stats_lock:
+            server.requests += 1
+            server.bytes_in += len(raw)
+            server.remaining = max(0, server.remaining - 1)
+        headers = {
+            "X-RateLimit-Limit": str(server.rate_limit),
+            "X-RateLimit-Remaining": str(server.remaining),
+            "X-RateLimit-Reset": str(server.reset_at),
+        }
+        roll = server.random.random()
+        if roll < server.error_rate:
+            return self._send(502, b'{"message": "Bad Gateway"}', headers)
+        if roll < server.error_rate + server.throttle_rate:
+            headers["Retry-After"] = f"{server.retry_after:g}"
+            return self._send(
+                429, b'{"message": "You have exceeded a secondary rate limit."}',
+                headers)
+        try:
+            request = json.loads(raw)
+            body = server.execute(request.get("query", ""),
+                                  request.get("variables") or {})
+        except ValueError:
+            return self._send(400, b'{"message": "Problems parsing JSON"}', headers)
+        self._send(200, json.dumps(body).encode("utf-8"), headers)
+
+    def _send(self, status: int, payload: bytes, headers: Dict) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        with self.server.stats_lock:
+            self.server.bytes_out += len(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fake_github(**options) -> FakeGitHubServer:
+    """Start a FakeGitHubServer on a background thread; .shutdown() stops it."""
+    server = FakeGitHubServer(**options)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05},
+                     daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--alias-error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeGitHubServer(
+        ("127.0.0.1", args.port), latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        alias_error_rate=args.alias_error_rate,
+    )
+    print(f"fake GitHub GraphQL API for repo o/r (project #1) at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,48 +8,112 @@ import os
 import sys
 import json
 import shutil
+import hashlib
+import math
+import tempfile
+import threading
+import time
+import uuid
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from string import Template
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from kanban_io import (
+    append_text,
     atomic_write_json,
+    format_task_id_marker,
     kanban_lock,
     parse_task_title_with_description,
+    read_board,
     read_board_key,
+    split_task_id,
 )
 
-# Load environment variables from .env file if it exists.
-# override=True: the project's `.env` is the authoritative target for
-# this sync run. Without it, a shell-level export (e.g. a stale
-# GITHUB_REPO=owner/other-project from another workspace's profile
-# script) silently shadows the `.env` value and routes the sync to
-# the wrong project — items get written into another repo's Project
-# instead of the intended one, with no error surfaced.
-# find_dotenv(usecwd=True): the default `find_dotenv()` walks upward
-# from the *caller module's file location* (i.e. this file's
-# directory), not from the user's CWD. When kanban-sync is invoked
-# from a target project, that lookup can latch onto a rogue
-# parent-of-source-directory `.env` (e.g. ~/Desktop/AI/.env) and the
-# target project's `.env` is never considered. usecwd=True makes the
-# search start at os.getcwd() so the CWD-closest `.env` wins.
-try:
-    from dotenv import load_dotenv, find_dotenv
-    load_dotenv(find_dotenv(usecwd=True), override=True)
-except ImportError:
-    pass  # python-dotenv not installed, skip
-
 
 # GitHub GraphQL endpoint
 GITHUB_API = "https://api.github.com/graphql"
 
+# P11: HTTP timeouts (seconds) for every GraphQL call. The connect timeout
+# bounds the TCP+TLS handshake; the read timeout bounds each wait for
+# response bytes. Without them a hung socket blocked until the MCP-side
+# KANBANGER_SYNC_TIMEOUT_SEC killed the whole subprocess.
+HTTP_CONNECT_TIMEOUT_ENV = "KANBANGER_HTTP_CONNECT_TIMEOUT_SEC"
+HTTP_READ_TIMEOUT_ENV = "KANBANGER_HTTP_READ_TIMEOUT_SEC"
+DEFAULT_CONNECT_TIMEOUT_SEC = 10.0
+DEFAULT_READ_TIMEOUT_SEC = 30.0
+
+
+def _env_seconds(name: str, default: float, env=None) -> float:
+    """Positive float from env `name`, else `default` (bad values ignored).
+
+    P19: `env` is the mapping to read (None: os.environ), so an in-process
+    sync can honour a workspace .env without touching os.environ.
+    """
+    try:
+        value = float((os.environ if env is None else env).get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
 # R8: state file schema version. Persisted in .kanban.json so future
 # kanbanger versions can detect and migrate older state shapes.
 # v0 = pre-R8 (no field present); v1 = current. v0 and v1 are
 # structurally identical, so v0 files self-upgrade on next save.
 SCHEMA_VERSION = 1
 
+# P20: idempotency marker for draft-issue creates. Before a create is
+# sent, its title and a fresh op id are journaled as "in flight"; the
+# draft's body carries the same id. If the run dies before the create's
+# result is recorded, the next run finds the draft by its marker and
+# adopts it instead of creating a duplicate. Same comment namespace as
+# the board-id marker (kanban_io).
+_OP_ID_RE = re.compile(r"<!--\s*kanbanger:op-id:\s*([0-9a-f]{32})\s*-->")
+
+
+def format_op_marker(op_id: str) -> str:
+    """Render the HTML-comment marker carrying a create's op id."""
+    return f"<!-- kanbanger:op-id: {op_id} -->"
+
+
+def _body_task_id(body: str) -> Optional[str]:
+    """P24: the P23 task id a draft body carries (see _create_body)."""
+    for line in body.splitlines():
+        task_id = split_task_id(line)[1]
+        if task_id is not None:
+            return task_id
+    return None
+
+
+def _content_hash(text: str) -> str:
+    """P25: short digest of a draft's title or body text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _content_hashes(title: str, description: Optional[str]) -> Dict[str, str]:
+    """P25: the `title_hash` / `body_hash` state fields for a task."""
+    return {"title_hash": _content_hash(title),
+            "body_hash": _content_hash(description or "")}
+
+
+def _remote_hashes(item: Dict) -> Dict[str, str]:
+    """P25: content hashes of an iter_project_items item, ignoring the
+    markers sync adds to draft bodies (see Syncer._draft_body)."""
+    lines = [split_task_id(_OP_ID_RE.sub("", line))[0]
+             for line in (item.get("body") or "").splitlines()]
+    return _content_hashes(item["title"], "\n".join(lines).strip())
+
+# P18: sync records each task change as one JSON line in this journal
+# next to .kanban.json, instead of rewriting the whole state file after
+# every batch. StateManager.load replays it; save() compacts it away (at
+# the end of a run, or once it grows past the byte threshold below).
+STATE_JOURNAL_SUFFIX = ".log"
+STATE_JOURNAL_MAX_BYTES_ENV = "KANBANGER_STATE_JOURNAL_MAX_BYTES"
+DEFAULT_STATE_JOURNAL_MAX_BYTES = 1024 * 1024
+
 
 # E1: typed exceptions raised by the sync_kanban library so callers
 # (CLI entry-point, MCP subprocess wrapper, future direct importers)
@@ -74,6 +138,11 @@ class ConfigurationError(KanbangerError):
     path, or runtime dependency."""
 
 
+class SyncCancelled(KanbangerError):
+    """A sync was cancelled through its cancel event (P19). State for
+    everything that landed before the cancel is saved."""
+
+
 class LocalBoard:
     """Handles parsing of markdown kanban files."""
     
@@ -95,79 +164,102 @@ class LocalBoard:
         semantics as the MCP-tools side. Without the shared helper the
         two parsers drifted and `* [ ] X` + `* [ ] X - extra` pushed
         as two separate GH items even though MCP-tools dedup'd them.
-        The pushed `title` field still carries the full post-checkbox
-        text so the description survives to GitHub on the first
-        occurrence; only the dedup key is the stripped form.
+
+        P25: the pushed `title` is that stripped form too, and the text
+        after the separator is the task's `description` (the draft
+        body), so editing a description no longer looks like a new task.
         """
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        board = read_board(self.file_path)
 
         tasks = {}
         seen_per_section: Dict[str, set] = {}
-        current_section = None
 
-        # Detect section headers (## N. TITLE or ## TITLE)
-        section_pattern = re.compile(r'^##\s+(?:\d+\.\s+)?(.+)', re.IGNORECASE)
+        # P2: walk the shared single-pass Board instead of re-scanning the
+        # lines. Section names (## N. TITLE or ## TITLE) are normalized
+        # onto GitHub Status names; a Board section's index lets each task
+        # record look its normalized section up directly.
+        number_prefix = re.compile(r'^(?:\d+\.\s+)')
         task_pattern = re.compile(r'^\*\s+\[([ xX])\]\s+(.+)')
 
-        for line in content.split('\n'):
-            # Check for section header
-            section_match = section_pattern.match(line.strip())
-            if section_match:
-                section_name = section_match.group(1).strip()
-                # Normalize common section names
-                normalized = section_name.upper()
-                if 'BACKLOG' in normalized:
-                    current_section = 'Backlog'
-                elif 'TO DO' in normalized or 'TODO' in normalized:
-                    current_section = 'Todo'
-                elif 'DOING' in normalized or 'IN PROGRESS' in normalized:
-                    current_section = 'InProgress'
-                elif 'REVIEW' in normalized:
-                    current_section = 'Review'
-                elif 'DONE' in normalized or 'COMPLETE' in normalized:
-                    current_section = 'Done'
-                else:
-                    current_section = section_name
+        section_names = []
+        for section in board.sections:
+            section_name = number_prefix.sub('', section.name, count=1).strip()
+            # Normalize common section names
+            normalized = section_name.upper()
+            if 'BACKLOG' in normalized:
+                current_section = 'Backlog'
+            elif 'TO DO' in normalized or 'TODO' in normalized:
+                current_section = 'Todo'
+            elif 'DOING' in normalized or 'IN PROGRESS' in normalized:
+                current_section = 'InProgress'
+            elif 'REVIEW' in normalized:
+                current_section = 'Review'
+            elif 'DONE' in normalized or 'COMPLETE' in normalized:
+                current_section = 'Done'
+            else:
+                current_section = section_name
 
-                tasks.setdefault(current_section, [])
-                seen_per_section.setdefault(current_section, set())
-                continue
+            section_names.append(current_section)
+            tasks.setdefault(current_section, [])
+            seen_per_section.setdefault(current_section, set())
 
-            # Check for task item
-            if current_section:
-                task_match = task_pattern.match(line.strip())
-                if task_match:
-                    is_done = task_match.group(1).lower() == 'x'
-                    title = task_match.group(2).strip()
-                    parsed = parse_task_title_with_description(line)
-                    dedup_key = parsed[0] if parsed is not None else title
-                    if dedup_key in seen_per_section[current_section]:
-                        print(
-                            f"Warning: duplicate task title in section "
-                            f"'{current_section}': '{dedup_key}'. Keeping "
-                            f"first occurrence; dropping subsequent "
-                            f"duplicate to prevent duplicate GitHub items "
-                            f"on sync.",
-                            file=sys.stderr,
-                        )
-                        continue
-                    seen_per_section[current_section].add(dedup_key)
-                    tasks[current_section].append({
-                        'title': title,
-                        'done': is_done
-                    })
+        for record in board.tasks:
+            current_section = section_names[record.section]
+            # Sync is stricter than the board parser: only checkbox
+            # lines become GitHub items.
+            task_match = task_pattern.match(
+                split_task_id(board.lines[record.line])[0].strip())
+            if not task_match:
+                continue
+            is_done = task_match.group(1).lower() == 'x'
+            title, description = parse_task_title_with_description(
+                f"* {task_match.group(2)}")
+            dedup_key = title
+            if dedup_key in seen_per_section[current_section]:
+                print(
+                    f"Warning: duplicate task title in section "
+                    f"'{current_section}': '{dedup_key}'. Keeping "
+                    f"first occurrence; dropping subsequent "
+                    f"duplicate to prevent duplicate GitHub items "
+                    f"on sync.",
+                    file=sys.stderr,
+                )
+                continue
+            seen_per_section[current_section].add(dedup_key)
+            tasks[current_section].append({
+                'title': title,
+                'description': description,
+                'done': is_done,
+                'task_id': record.task_id,
+            })
 
         self.tasks = tasks
         return tasks
 
 
+# P23: optional per-task state fields besides item_id / status: the
+# board's task-id marker and the DraftIssue node id a title update needs.
+# P25: plus content hashes of the title and description last pushed to
+# the draft. Entries synced before P25 lack them: their draft's title is
+# the entry's key and its body carries no description.
+TASK_EXTRA_FIELDS = ("task_id", "draft_id", "title_hash", "body_hash")
+# Fields describing the item itself, dropped when an entry's item changes.
+_ITEM_FIELDS = ("draft_id", "title_hash", "body_hash")
+
+
 class StateManager:
     """Manages the .kanban.json sidecar file for state tracking."""
     
-    def __init__(self, kanban_file_path: str):
+    def __init__(self, kanban_file_path: str, env=None):
         self.kanban_file = Path(kanban_file_path)
+        # P19: where KANBANGER_* knobs are read (None: os.environ).
+        self.env = env
         self.state_file = self.kanban_file.parent / ".kanban.json"
+        self.journal_file = self.state_file.with_name(
+            self.state_file.name + STATE_JOURNAL_SUFFIX
+        )
+        # P18: task changes made since the last flush()/save().
+        self._pending: List[Dict] = []
         self.state = {
             "schema_version": SCHEMA_VERSION,
             "repo_node_id": None,
@@ -184,10 +276,18 @@ class StateManager:
         R7: on a corrupt JSON parse, copy the bad file aside (preserving
         it for postmortem) and reset to an empty default state. Lets the
         tool keep running rather than crashing on a partial write or
-        manual edit; the user loses sync history but no further damage
-        accumulates. Recovery via markdown-rebuild is deferred (would
-        warrant its own audit item).
+        manual edit. P24: the reset state is flagged `needs_rebuild`, so
+        the next sync recovers the task entries from the GitHub project
+        (Syncer._rebuild_state) instead of duplicating every item.
+
+        P18: any journal left by an interrupted run is replayed on top.
         """
+        self._pending = []
+        self._load_state_file()
+        self._replay_journal()
+        return self.state
+
+    def _load_state_file(self) -> None:
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r', encoding='utf-8') as f:
@@ -220,8 +320,11 @@ class StateManager:
                     "project_id": None,
                     "board_key": None,
                     "tasks": {},
+                    # P24: the next sync re-derives tasks from the project
+                    # instead of re-creating every one of them.
+                    "needs_rebuild": True,
                 }
-                return self.state
+                return
             # R8: backwards-compat. Pre-R8 state files have no
             # schema_version; v0 and v1 are structurally identical, so
             # silently upgrade in-memory (next save persists the field).
@@ -236,7 +339,75 @@ class StateManager:
                     f"recognised; unknown fields are preserved on save.",
                     file=sys.stderr,
                 )
-        return self.state
+
+    def _replay_journal(self) -> None:
+        """P18: apply journal records left behind by an unfinished run.
+
+        Records are idempotent, so replaying ones already compacted into
+        .kanban.json (a crash between the rewrite and the journal unlink)
+        is harmless. A torn final line from a crash mid-append ends the
+        replay; everything before it is applied.
+        """
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        tasks = self.state.setdefault("tasks", {})
+        in_flight = self.state.setdefault("in_flight", {})
+        applied = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+                title = record["title"]
+                if record["op"] == "set":
+                    tasks[title] = {"item_id": record["item_id"],
+                                    "status": record["status"]}
+                    for field in TASK_EXTRA_FIELDS:
+                        if field in record:
+                            tasks[title][field] = record[field]
+                    in_flight.pop(title, None)
+                elif record["op"] == "intent":
+                    in_flight[title] = record["op_id"]
+                elif record["op"] == "clear":
+                    in_flight.pop(title, None)
+                else:
+                    tasks.pop(title, None)
+            except (ValueError, KeyError, TypeError):
+                print(
+                    f"Warning: ignoring torn record at the end of "
+                    f"{self.journal_file} (interrupted sync).",
+                    file=sys.stderr,
+                )
+                break
+            applied += 1
+        if not in_flight:
+            self.state.pop("in_flight", None)
+        if applied:
+            # The recorded no-op digest predates these changes.
+            self.state.pop("last_synced_digest", None)
+
+    def flush(self):
+        """P18: append task changes since the last flush to the journal.
+
+        One compact line per change under the cross-process lock, instead
+        of rewriting the whole state file. Past
+        KANBANGER_STATE_JOURNAL_MAX_BYTES of journal, compacts via save().
+        """
+        if not self._pending:
+            return
+        records = "".join(
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            for record in self._pending
+        )
+        workspace = str(self.kanban_file.parent)
+        with kanban_lock(workspace, operation="sync_state_journal"):
+            append_text(str(self.journal_file), records)
+        self._pending = []
+        limit = _env_int(STATE_JOURNAL_MAX_BYTES_ENV,
+                         DEFAULT_STATE_JOURNAL_MAX_BYTES, self.env)
+        if self.journal_file.stat().st_size > limit:
+            self.save()
     
     def save(self):
         """Save state to .kanban.json. D1: atomic write under cross-process lock.
@@ -247,10 +418,20 @@ class StateManager:
         concurrent sync writer. Together they form D1's transactional pair —
         both kanban_io.atomic_write_text (markdown, in tools.py) and
         atomic_write_json (state, here) write under the same lock file.
+
+        P18: the full state supersedes the journal, which is removed
+        (compaction) once the rewrite has landed.
         """
+        if not self.state.get("in_flight"):
+            self.state.pop("in_flight", None)
         workspace = str(self.kanban_file.parent)
-        with kanban_lock(workspace):
+        with kanban_lock(workspace, operation="sync_state_save"):
             atomic_write_json(str(self.state_file), self.state)
+            try:
+                self.journal_file.unlink()
+            except FileNotFoundError:
+                pass
+        self._pending = []
     
     def verify_board_key(self, board_key: Optional[str]) -> None:
         """Guard the sync state against a copied / swapped board (ADR 0002).
@@ -305,29 +486,541 @@ class StateManager:
         """Get the stored status for a task title."""
         return self.state["tasks"].get(task_title, {}).get("status")
     
-    def update_task(self, task_title: str, item_id: str, status: str):
-        """Update or add a task in the state."""
-        self.state["tasks"][task_title] = {
-            "item_id": item_id,
-            "status": status
-        }
+    def update_task(self, task_title: str, item_id: str, status: str,
+                    task_id: Optional[str] = None, **fields):
+        """Update or add a task in the state.
+
+        P23: the entry keeps its task id (and, for the same item, its
+        draft id); `task_id` records one. P25: for the same item it keeps
+        its content hashes too; `fields` records new ones.
+        """
+        previous = self.state["tasks"].get(task_title) or {}
+        entry = {"item_id": item_id, "status": status}
+        if previous.get("task_id"):
+            entry["task_id"] = previous["task_id"]
+        if previous.get("item_id") == item_id:
+            entry.update((field, previous[field]) for field in _ITEM_FIELDS
+                         if previous.get(field))
+        if task_id:
+            entry["task_id"] = task_id
+        entry.update(fields)
+        self._set_entry(task_title, entry)
+
+    def _set_entry(self, task_title: str, entry: Dict) -> None:
+        self.state["tasks"][task_title] = entry
+        self.state.get("in_flight", {}).pop(task_title, None)
+        self._pending.append({"op": "set", "title": task_title, **entry})
+
+    def set_task_fields(self, task_title: str, **fields) -> None:
+        """P23: record task_id / draft_id (P25: or hashes) on an entry."""
+        entry = dict(self.state["tasks"][task_title])
+        entry.update(fields)
+        self._set_entry(task_title, entry)
+
+    def rename_task(self, old_title: str, new_title: str) -> None:
+        """P23: move an entry (same GitHub item) to its new title."""
+        entry = self.state["tasks"].pop(old_title)
+        self._pending.append({"op": "remove", "title": old_title})
+        self._set_entry(new_title, entry)
     
+    def content_hashes(self, task_title: str) -> Dict[str, str]:
+        """P25: hashes of the content last pushed for an entry.
+
+        Entries without recorded hashes predate P25: their draft was
+        created with the key as its title and no description.
+        """
+        entry = self.state["tasks"][task_title]
+        hashes = _content_hashes(task_title, None)
+        hashes.update((field, entry[field]) for field in hashes
+                      if entry.get(field))
+        return hashes
+
     def remove_task(self, task_title: str):
         """Remove a task from the state."""
         if task_title in self.state["tasks"]:
             del self.state["tasks"][task_title]
+            self._pending.append({"op": "remove", "title": task_title})
+
+    def in_flight(self) -> Dict[str, str]:
+        """P20: titles whose create was sent but never confirmed -> op id."""
+        return dict(self.state.get("in_flight") or {})
+
+    def mark_in_flight(self, task_title: str, op_id: str) -> None:
+        """P20: checkpoint a create about to be sent (flush() before sending)."""
+        self.state.setdefault("in_flight", {})[task_title] = op_id
+        self._pending.append({"op": "intent", "title": task_title,
+                              "op_id": op_id})
+
+    def clear_in_flight(self, task_title: str) -> None:
+        """P20: the create is known not to have happened; forget it."""
+        if self.state.get("in_flight", {}).pop(task_title, None) is not None:
+            self._pending.append({"op": "clear", "title": task_title})
     
     def set_project_info(self, repo_node_id: str, project_id: str):
         """Set the repository and project IDs."""
         self.state["repo_node_id"] = repo_node_id
         self.state["project_id"] = project_id
 
+    def get_project_cache(self, fingerprint: str,
+                          ttl: float) -> Optional[Tuple[str, str, str, Dict]]:
+        """P16: cached get_repo_project() result, or None when absent/stale.
+
+        Only an entry recorded for the same target (`fingerprint`) within
+        the last `ttl` seconds counts.
+        """
+        cache = self.state.get("project_cache")
+        if not isinstance(cache, dict) or cache.get("fingerprint") != fingerprint:
+            return None
+        try:
+            age = time.time() - float(cache["fetched_at"])
+            metadata = (cache["repo_node_id"], cache["project_id"],
+                        cache["status_field_id"], dict(cache["status_options"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not 0 <= age < ttl:
+            return None
+        return metadata
+
+    def set_project_cache(self, fingerprint: str, repo_node_id: str,
+                          project_id: str, status_field_id: str,
+                          status_options: Dict) -> None:
+        """P16: record a fresh get_repo_project() result."""
+        self.state["project_cache"] = {
+            "fingerprint": fingerprint,
+            "fetched_at": time.time(),
+            "repo_node_id": repo_node_id,
+            "project_id": project_id,
+            "status_field_id": status_field_id,
+            "status_options": status_options,
+        }
+
+    def invalidate_project_cache(self) -> None:
+        """P16: forget cached project metadata; the next sync re-fetches it."""
+        self.state.pop("project_cache", None)
+
+
+def _project_fingerprint(api_url: str, repo: str,
+                         project_number: Optional[int]) -> str:
+    """P16: identifies the target a project_cache entry was fetched for."""
+    return hashlib.sha256(
+        f"{api_url}\n{repo}\n{project_number}".encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def _sync_digest(repo: str, project_number: Optional[int],
+                 local_flat: Dict[str, str],
+                 task_ids: Optional[Dict[str, str]] = None,
+                 descriptions: Optional[Dict[str, str]] = None) -> str:
+    """P15: digest of what a sync pushes — target plus (title, status) pairs.
+
+    Recorded in .kanban.json as `last_synced_digest` after a sync that
+    left GitHub matching the board; an equal digest on the next run means
+    there is nothing to push. Task order, blank lines and the checkbox
+    are not synced, so they are deliberately not part of it. P23: task
+    ids are, when the board has any — a newly added marker must reach
+    state — and boards without them keep their old digest. P25: likewise
+    task descriptions, which are pushed as draft bodies.
+    """
+    body = {"repo": repo, "project": project_number,
+            "tasks": sorted(local_flat.items())}
+    if task_ids:
+        body["ids"] = sorted(task_ids.items())
+    if descriptions:
+        body["descriptions"] = sorted(descriptions.items())
+    payload = json.dumps(body, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _format_graphql_errors(errors: List[Dict]) -> str:
+    details = "\n".join(
+        f"  - {error.get('message', str(error))}" for error in errors
+    )
+    return f"GraphQL errors:\n{details}"
+
+
+# P12: mutations GitHubClient.mutate_batch can alias into one document.
+# kind -> (mutation field, {input variable: GraphQL type}, input arguments
+# as a string.Template over those variable names, result field whose `id`
+# is returned).
+BATCH_MUTATIONS = {
+    "create": (
+        "addProjectV2DraftIssue",
+        {"projectId": "ID!", "title": "String!", "body": "String"},
+        "projectId: $projectId, title: $title, body: $body",
+        "projectItem",
+    ),
+    "status": (
+        "updateProjectV2ItemFieldValue",
+        {"projectId": "ID!", "itemId": "ID!", "fieldId": "ID!",
+         "optionId": "String!"},
+        "projectId: $projectId, itemId: $itemId, fieldId: $fieldId, "
+        "value: {singleSelectOptionId: $optionId}",
+        "projectV2Item",
+    ),
+    "archive": (
+        "archiveProjectV2Item",
+        {"projectId": "ID!", "itemId": "ID!"},
+        "projectId: $projectId, itemId: $itemId",
+        "item",
+    ),
+    # P23: rename in place (returns the draft's id, not the item's).
+    # P25: sets the body (the task's description) in the same call.
+    "title": (
+        "updateProjectV2DraftIssue",
+        {"draftIssueId": "ID!", "title": "String!", "body": "String"},
+        "draftIssueId: $draftIssueId, title: $title, body: $body",
+        "draftIssue",
+    ),
+}
+
+# P12: how many aliased mutations Syncer packs into one request.
+SYNC_BATCH_SIZE_ENV = "KANBANGER_SYNC_BATCH_SIZE"
+DEFAULT_SYNC_BATCH_SIZE = 25
+
+# P13: how many of those requests Syncer keeps in flight at once.
+SYNC_CONCURRENCY_ENV = "KANBANGER_SYNC_CONCURRENCY"
+DEFAULT_SYNC_CONCURRENCY = 4
+
+# P16: how long the project metadata (repo/project ids, Status field id
+# and option map) cached in .kanban.json is trusted before it is
+# re-fetched. The ids practically never change; a stale entry is also
+# dropped as soon as a mutation rejects one of them.
+PROJECT_CACHE_TTL_ENV = "KANBANGER_PROJECT_CACHE_TTL_SEC"
+DEFAULT_PROJECT_CACHE_TTL_SEC = 24 * 3600.0
+
+# Mutation errors that mean a cached id no longer exists on GitHub (a
+# renamed/recreated Status option or field, a deleted project). Only
+# GitHub's stale-id messages: a validation error that merely mentions a
+# "field" must not throw the cache away.
+_STALE_METADATA_ERROR = re.compile(
+    r"could not resolve to a node with the global id"
+    r"|single select option id does not belong to the field"
+    r"|field id .*(?:does not exist|is not a field of)",
+    re.IGNORECASE,
+)
+
+
+def _env_int(name: str, default: int, env=None) -> int:
+    """Integer >= 1 from env `name`, else `default` (bad values ignored;
+    `env` as for _env_seconds)."""
+    try:
+        value = int((os.environ if env is None else env).get(name, ""))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+# ---------------------------------------------------------------------------
+# Rate-limit scheduling (P14)
+#
+# GitHub meters GraphQL by points per token (X-RateLimit-* headers, the
+# `rateLimit { cost remaining resetAt }` query object) and additionally
+# throttles bursts with secondary limits (403/429 + Retry-After). Every
+# GitHubClient request passes through a RateLimiter that:
+#   - paces requests with a token bucket (KANBANGER_GITHUB_MAX_RPS, burst
+#     KANBANGER_GITHUB_BURST),
+#   - tracks the remaining points budget and, once it drops to the reserve
+#     (KANBANGER_GITHUB_POINTS_RESERVE), waits for the reset,
+#   - backs off on secondary limits, honouring Retry-After,
+#   - refuses (GitHubAPIError) any wait longer than
+#     KANBANGER_GITHUB_MAX_WAIT_SEC rather than sleeping past the MCP-side
+#     sync timeout,
+#   - accounts consumed cost for the sync summary.
+# One limiter per token per process (rate_limiter_for), and the budget and
+# any back-off pause are mirrored to a small per-token file in the temp
+# dir, so several boards syncing under one token — separate sync
+# processes — see each other's budget and back-off.
+# ---------------------------------------------------------------------------
+
+RATE_LIMIT_RPS_ENV = "KANBANGER_GITHUB_MAX_RPS"
+RATE_LIMIT_BURST_ENV = "KANBANGER_GITHUB_BURST"
+RATE_LIMIT_RESERVE_ENV = "KANBANGER_GITHUB_POINTS_RESERVE"
+RATE_LIMIT_MAX_WAIT_ENV = "KANBANGER_GITHUB_MAX_WAIT_SEC"
+DEFAULT_MAX_RPS = 5.0
+DEFAULT_BURST = 10
+DEFAULT_POINTS_RESERVE = 50
+DEFAULT_MAX_WAIT_SEC = 60.0
+RATE_LIMIT_RETRIES = 3
+
+
+def _parse_reset(value) -> Optional[float]:
+    """Epoch seconds from an X-RateLimit-Reset header or an ISO resetAt."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket + points budget + shared back-off for one GitHub token."""
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None,
+                 reserve: Optional[int] = None, max_wait: Optional[float] = None,
+                 shared_path: Optional[str] = None, sleep=time.sleep,
+                 env=None):
+        self.configure(env)
+        if rate is not None:
+            self.rate = rate
+        if burst is not None:
+            self.burst = burst
+        if reserve is not None:
+            self.reserve = reserve
+        if max_wait is not None:
+            self.max_wait = max_wait
+        self.shared_path = shared_path
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.pause_until = 0.0
+        self.cost = 0
+        self.retries = 0
+        self.throttled = 0.0
+        self._first_remaining: Optional[int] = None
+        self._first_reset: Optional[float] = None
+
+    def configure(self, env=None) -> None:
+        """Read the pacing knobs from `env` (None: os.environ).
+
+        P19: rate_limiter_for re-applies them on every call, so a limiter
+        kept warm across syncs follows each run's effective env.
+        """
+        self.rate = _env_seconds(RATE_LIMIT_RPS_ENV, DEFAULT_MAX_RPS, env)
+        self.burst = _env_int(RATE_LIMIT_BURST_ENV, DEFAULT_BURST, env)
+        self.reserve = _env_int(RATE_LIMIT_RESERVE_ENV,
+                                DEFAULT_POINTS_RESERVE, env)
+        self.max_wait = _env_seconds(RATE_LIMIT_MAX_WAIT_ENV,
+                                     DEFAULT_MAX_WAIT_SEC, env)
+
+    # -- shared state ------------------------------------------------------
+
+    def _load_shared(self) -> None:
+        """Merge the shared budget file into this limiter.
+
+        The file is advisory: one owned by another user, or holding
+        anything but the fields _store_shared writes, is ignored.
+        """
+        if not self.shared_path:
+            return
+        try:
+            with open(self.shared_path, "r", encoding="utf-8") as f:
+                if hasattr(os, "getuid") and \
+                        os.fstat(f.fileno()).st_uid != os.getuid():
+                    return
+                shared = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(shared, dict):
+            return
+        pause_until = _shared_number(shared.get("pause_until"))
+        remaining = _shared_number(shared.get("remaining"))
+        reset = _shared_number(shared.get("reset_at"))
+        if pause_until is not None:
+            self.pause_until = max(self.pause_until, pause_until)
+        if remaining is not None and reset and (
+                self.reset_at is None or reset >= self.reset_at):
+            if reset != self.reset_at or self.remaining is None \
+                    or remaining < self.remaining:
+                self.remaining, self.reset_at = int(remaining), reset
+
+    def _store_shared(self) -> None:
+        if not self.shared_path:
+            return
+        try:
+            atomic_write_json(self.shared_path, {
+                "remaining": self.remaining,
+                "reset_at": self.reset_at,
+                "pause_until": self.pause_until,
+            }, durability="relaxed")
+        except OSError:
+            pass  # best effort: sharing is an optimisation
+
+    # -- scheduling --------------------------------------------------------
+
+    def acquire(self) -> None:
+        """Block until the next request may go out (or raise if too long)."""
+        with self._lock:
+            self._load_shared()
+            now = time.time()
+            wait = max(0.0, self.pause_until - now)
+            reason = "secondary rate limit back-off"
+            if (self.remaining is not None and self.remaining <= self.reserve
+                    and self.reset_at and self.reset_at > now):
+                if self.reset_at - now > wait:
+                    wait = self.reset_at - now
+                    reason = (f"points budget at {self.remaining} "
+                              f"(reserve {self.reserve})")
+            if wait > self.max_wait:
+                raise GitHubAPIError(
+                    f"GitHub rate limit: {reason}; next request allowed in "
+                    f"{wait:.0f}s, over the {self.max_wait:g}s limit "
+                    f"({RATE_LIMIT_MAX_WAIT_ENV}). Re-run the sync later."
+                )
+            mono = time.monotonic()
+            self._tokens = min(float(self.burst),
+                               self._tokens + (mono - self._refilled) * self.rate)
+            self._refilled = mono
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            self.throttled += wait
+        if wait > 0:
+            self._sleep(wait)
+
+    def observe(self, headers=None, rate_limit: Optional[Dict] = None) -> None:
+        """Record budget info from response headers / a GraphQL rateLimit."""
+        remaining = reset = None
+        if headers is not None and headers.get("X-RateLimit-Remaining") is not None:
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+            except ValueError:
+                remaining = None
+            reset = _parse_reset(headers.get("X-RateLimit-Reset"))
+        if rate_limit:
+            self.cost += int(rate_limit.get("cost") or 0)
+            if rate_limit.get("remaining") is not None:
+                remaining = int(rate_limit["remaining"])
+                reset = _parse_reset(rate_limit.get("resetAt")) or reset
+        if remaining is None:
+            return
+        with self._lock:
+            self.remaining, self.reset_at = remaining, reset
+            if self._first_remaining is None:
+                self._first_remaining, self._first_reset = remaining, reset
+            self._store_shared()
+
+    def backoff(self, seconds: float) -> None:
+        """Pause every request through this limiter (and its peers)."""
+        with self._lock:
+            self.retries += 1
+            self.pause_until = max(self.pause_until, time.time() + seconds)
+            self._store_shared()
+
+    def reset_run_stats(self) -> None:
+        """P19: start a new report window on a limiter reused across syncs.
+
+        Budget tracking (remaining / reset / pauses) is kept; only the
+        per-run counters behind summary() restart.
+        """
+        with self._lock:
+            self.cost = 0
+            self.retries = 0
+            self.throttled = 0.0
+            self._first_remaining = None
+            self._first_reset = None
+
+    def summary(self) -> Dict:
+        """Points consumed / remaining, for the end-of-sync report."""
+        used = None
+        if (self._first_remaining is not None and self.remaining is not None
+                and self._first_reset == self.reset_at):
+            used = self._first_remaining - self.remaining
+        return {
+            "query_cost": self.cost,
+            "points_used": used,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "retries": self.retries,
+            "throttled_sec": round(self.throttled, 3),
+        }
+
+
+def _shared_number(value) -> Optional[float]:
+    """A finite number from the shared budget file, else None."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+def _shared_budget_path(digest: str) -> str:
+    """Per-user budget file for a token digest.
+
+    The file is written 0600 (atomic_write_text uses mkstemp), and
+    _load_shared ignores it when another user owns it. On Windows the
+    temp dir is already per-user, so the name carries no uid.
+    """
+    owner = f"{os.getuid()}-" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(),
+                        f"kanbanger-ratelimit-{owner}{digest}.json")
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def rate_limiter_for(token: str, env=None) -> RateLimiter:
+    """The process-wide RateLimiter for `token` (budget shared via tmp),
+    paced by the knobs in `env` (None: os.environ)."""
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(digest)
+        if limiter is None:
+            limiter = _LIMITERS[digest] = RateLimiter(
+                shared_path=_shared_budget_path(digest), env=env)
+        else:
+            with limiter._lock:
+                limiter.configure(env)
+        return limiter
+
+
+def _retry_delay(response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a throttled response, or None.
+
+    None means "not a rate-limit response". 429s, and 403s that carry
+    Retry-After, an exhausted X-RateLimit-Remaining or a rate-limit
+    message, are throttles. Retry-After wins; an exhausted budget waits
+    for X-RateLimit-Reset; otherwise exponential back-off (1, 2, 4s).
+    """
+    if response.status_code not in (403, 429):
+        return None
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    exhausted = headers.get("X-RateLimit-Remaining") == "0"
+    if response.status_code == 403 and not (
+            retry_after or exhausted or "rate limit" in response.text.lower()):
+        return None
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    reset = _parse_reset(headers.get("X-RateLimit-Reset"))
+    if exhausted and reset:
+        return max(0.0, reset - time.time())
+    return float(2 ** attempt)
+
 
 class GitHubClient:
-    """Handles GitHub GraphQL API interactions."""
+    """Handles GitHub GraphQL API interactions.
+
+    P11: every call goes through ONE pooled keep-alive requests.Session,
+    so a sync pays the TCP+TLS handshake once instead of per call, with
+    (connect, read) timeouts from the constructor or the
+    KANBANGER_HTTP_*_TIMEOUT_SEC env vars. Per-request wall times are
+    kept in `latencies` (seconds) and summarized by latency_summary().
+    Call close() (or use as a context manager) to release the pool.
+    `pool_size` caps the keep-alive connections kept per host — size it
+    to the sync concurrency (P13) so workers don't churn handshakes.
+    P14: every request is scheduled through `limiter` (default: the
+    shared per-token rate_limiter_for(token)).
+    """
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, api_url: str = GITHUB_API,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None,
+                 pool_size: int = 10,
+                 limiter: Optional[RateLimiter] = None,
+                 env=None):
         self.token = token
+        self.api_url = api_url
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
@@ -339,14 +1032,122 @@ class GitHubClient:
             raise ConfigurationError(
                 "requests not installed. Run: pip install requests"
             )
-    
-    def _query(self, query: str, variables: Dict) -> Dict:
-        """Execute a GraphQL query."""
-        response = self.requests.post(
-            GITHUB_API,
-            headers=self.headers,
-            json={"query": query, "variables": variables}
+        self.configure(env)
+        self.timeout = (
+            connect_timeout if connect_timeout is not None else self.timeout[0],
+            read_timeout if read_timeout is not None else self.timeout[1],
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # P13: one keep-alive connection per concurrent sync worker.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=max(1, pool_size),
         )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.latencies: List[float] = []
+        self.limiter = (limiter if limiter is not None
+                        else rate_limiter_for(token, env))
+        # Stream for informational messages; None means sys.stdout.
+        self.out = None
+        # Stream for warnings (rate-limit retries); None means sys.stderr.
+        self.err = None
+
+    def configure(self, env=None) -> None:
+        """P19: read the HTTP timeouts from `env` (None: os.environ)."""
+        self.timeout = (
+            _env_seconds(HTTP_CONNECT_TIMEOUT_ENV, DEFAULT_CONNECT_TIMEOUT_SEC,
+                         env),
+            _env_seconds(HTTP_READ_TIMEOUT_ENV, DEFAULT_READ_TIMEOUT_SEC, env),
+        )
+
+    def close(self) -> None:
+        """Close the pooled connection(s)."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def reset_stats(self) -> None:
+        """P19: forget latency samples and per-run rate-limit counters, so
+        a client kept warm across syncs reports each run on its own."""
+        self.latencies = []
+        self.limiter.reset_run_stats()
+
+    def latency_summary(self) -> Dict:
+        """Count / total / mean / p50 / p95 / max of request wall times (ms)."""
+        samples = sorted(self.latencies)
+        if not samples:
+            return {"requests": 0}
+
+        def pct(p: float) -> float:
+            return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+        return {
+            "requests": len(samples),
+            "total_ms": round(sum(samples) * 1000, 1),
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "p50_ms": round(pct(0.5) * 1000, 1),
+            "p95_ms": round(pct(0.95) * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1),
+        }
+    
+    def _post(self, query: str, variables: Dict) -> Dict:
+        """POST one GraphQL document; return the decoded body as-is.
+
+        Transport and HTTP-status failures raise GitHubAPIError; GraphQL
+        `errors` are left in the body for the caller (_query raises on
+        them, mutate_batch attributes them per alias).
+
+        P14: paced by self.limiter; throttled responses (429 / rate-limit
+        403 / GraphQL RATE_LIMITED) pause the limiter and are retried up
+        to RATE_LIMIT_RETRIES times.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    json={"query": query, "variables": variables},
+                    timeout=self.timeout,
+                )
+            except self.requests.Timeout as e:
+                raise GitHubAPIError(
+                    f"GitHub API request timed out (connect/read timeouts "
+                    f"{self.timeout[0]:g}s/{self.timeout[1]:g}s; set "
+                    f"{HTTP_CONNECT_TIMEOUT_ENV} / {HTTP_READ_TIMEOUT_ENV} to "
+                    f"override): {e}"
+                ) from e
+            except self.requests.ConnectionError as e:
+                raise GitHubAPIError(f"Could not reach GitHub API: {e}") from e
+            finally:
+                self.latencies.append(time.perf_counter() - started)
+
+            self.limiter.observe(response.headers)
+            delay = _retry_delay(response, attempt)
+            data = None
+            if delay is None and response.status_code == 200:
+                data = response.json()
+                if any(error.get("type") == "RATE_LIMITED"
+                       for error in data.get("errors") or []):
+                    reset = _parse_reset(
+                        response.headers.get("X-RateLimit-Reset"))
+                    delay = max(1.0, reset - time.time()) if reset else float(2 ** attempt)
+            if delay is None:
+                break
+            if attempt == RATE_LIMIT_RETRIES or delay > self.limiter.max_wait:
+                raise GitHubAPIError(
+                    f"GitHub API returned status {response.status_code}: "
+                    f"rate limited (retry in {delay:.0f}s; gave up after "
+                    f"{attempt + 1} attempt(s)): {response.text[:200]}"
+                )
+            print(f"  Rate limited by GitHub; retrying in {delay:.1f}s",
+                  file=self.err if self.err is not None else sys.stderr)
+            self.limiter.backoff(delay)
         
         if response.status_code != 200:
             raise GitHubAPIError(
@@ -354,15 +1155,77 @@ class GitHubClient:
                 f"{response.text}"
             )
 
-        data = response.json()
+        payload = data.get("data")
+        if isinstance(payload, dict) and payload.get("rateLimit"):
+            self.limiter.observe(rate_limit=payload["rateLimit"])
+        return data
+
+    def _query(self, query: str, variables: Dict) -> Dict:
+        """Execute a GraphQL query."""
+        data = self._post(query, variables)
         if "errors" in data:
-            details = "\n".join(
-                f"  - {error.get('message', str(error))}"
-                for error in data["errors"]
-            )
-            raise GitHubAPIError(f"GraphQL errors:\n{details}")
+            raise GitHubAPIError(_format_graphql_errors(data["errors"]))
         
         return data
+
+    def mutate_batch(self, ops: List[Tuple[str, Dict]]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Run several mutations as ONE aliased GraphQL document (P12).
+
+        `ops` is a list of (kind, variables) with kind one of
+        BATCH_MUTATIONS: "create" {projectId, title, body?}, "status"
+        {projectId, itemId, fieldId, optionId}, "archive" {projectId,
+        itemId}, "title" {draftIssueId, title, body?}. Each op becomes an
+        aliased field (m0, m1, ...) with its own variables; GitHub runs
+        them in order and a failing field only nulls its own alias.
+
+        Returns one (item_id, error_message) per op, in order: exactly
+        one of the two is None. Raises GitHubAPIError only when the
+        document as a whole failed (transport, HTTP status, or an error
+        not attributable to an alias).
+        """
+        if not ops:
+            return []
+        declarations, fields, variables = [], [], {}
+        for n, (kind, values) in enumerate(ops):
+            field, types, arguments, result = BATCH_MUTATIONS[kind]
+            alias = f"m{n}"
+            refs = {}
+            for name, gql_type in types.items():
+                declarations.append(f"${alias}_{name}: {gql_type}")
+                variables[f"{alias}_{name}"] = values.get(name)
+                refs[name] = f"${alias}_{name}"
+            fields.append(
+                f"{alias}: {field}(input: {{{Template(arguments).substitute(refs)}}}) "
+                f"{{ {result} {{ id }} }}"
+            )
+        document = (
+            f"mutation({', '.join(declarations)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}"
+        )
+
+        data = self._post(document, variables)
+        aliases = {f"m{n}" for n in range(len(ops))}
+        alias_errors: Dict[str, str] = {}
+        for error in data.get("errors") or []:
+            path = error.get("path") or []
+            if not path or path[0] not in aliases:
+                raise GitHubAPIError(_format_graphql_errors(data["errors"]))
+            alias_errors.setdefault(path[0], error.get("message", str(error)))
+
+        payload = data.get("data") or {}
+        outcomes: List[Tuple[Optional[str], Optional[str]]] = []
+        for n, (kind, _) in enumerate(ops):
+            alias = f"m{n}"
+            node = payload.get(alias)
+            result = BATCH_MUTATIONS[kind][3]
+            if alias in alias_errors or not node or not node.get(result):
+                outcomes.append(
+                    (None, alias_errors.get(alias, "no result returned"))
+                )
+            else:
+                outcomes.append((node[result]["id"], None))
+        return outcomes
     
     def get_repo_project(self, owner: str, repo_name: str, project_number: Optional[int] = None) -> Tuple[str, str, str, Dict]:
         """
@@ -371,6 +1234,7 @@ class GitHubClient:
         """
         query = """
         query($owner: String!, $repo: String!) {
+            rateLimit { cost remaining resetAt }
             repository(owner: $owner, name: $repo) {
                 id
                 projectsV2(first: 10) {
@@ -419,7 +1283,8 @@ class GitHubClient:
                 )
         else:
             project = projects[0]
-            print(f"Info: Using project #{project['number']}: {project['title']}")
+            print(f"Info: Using project #{project['number']}: {project['title']}",
+                  file=self.out)
 
         project_id = project["id"]
 
@@ -440,8 +1305,18 @@ class GitHubClient:
     
     def get_project_items(self, project_id: str) -> List[Dict]:
         """Get all items from a project."""
+        return list(self.iter_project_items(project_id))
+
+    def iter_project_items(self, project_id: str) -> Iterator[Dict]:
+        """Yield a project's draft items, fetching one page at a time.
+
+        P17: the next page is only requested once the consumer has taken
+        every item of the current one, so a consumer that stops early
+        never pays for the rest of a large project's history.
+        """
         query = """
         query($projectId: ID!, $cursor: String) {
+            rateLimit { cost remaining resetAt }
             node(id: $projectId) {
                 ... on ProjectV2 {
                     items(first: 100, after: $cursor) {
@@ -476,7 +1351,6 @@ class GitHubClient:
         }
         """
         
-        items = []
         cursor = None
         
         while True:
@@ -495,18 +1369,17 @@ class GitHubClient:
                             status = field_value.get("name")
                             break
                     
-                    items.append({
+                    yield {
                         "id": item["id"],
                         "title": item["content"]["title"],
+                        "body": item["content"].get("body") or "",
                         "status": status
-                    })
+                    }
             
             page_info = project["items"]["pageInfo"]
             if not page_info["hasNextPage"]:
                 break
             cursor = page_info["endCursor"]
-        
-        return items
     
     def create_draft_issue(self, project_id: str, title: str, body: str = "") -> str:
         """Create a draft issue in the project. Returns the item ID."""
@@ -574,147 +1447,1078 @@ class GitHubClient:
         
         self._query(mutation, variables)
 
+    def get_draft_issue_ids(self, item_ids: List[str]) -> Dict[str, str]:
+        """P23: item id -> id of the DraftIssue behind it (100 per query).
+
+        updateProjectV2DraftIssue addresses the draft, not the project
+        item. Items that are gone, or no longer drafts (converted to
+        issues), are left out rather than failing the lookup.
+        """
+        query = """
+        query($ids: [ID!]!) {
+            nodes(ids: $ids) {
+                ... on ProjectV2Item {
+                    id
+                    content {
+                        ... on DraftIssue {
+                            id
+                        }
+                    }
+                }
+            }
+        }
+        """
+        draft_ids: Dict[str, str] = {}
+        for start in range(0, len(item_ids), 100):
+            data = self._post(query, {"ids": item_ids[start:start + 100]})
+            nodes = (data.get("data") or {}).get("nodes")
+            if nodes is None:
+                raise GitHubAPIError(_format_graphql_errors(data.get("errors") or []))
+            for node in nodes:
+                if node and (node.get("content") or {}).get("id"):
+                    draft_ids[node["id"]] = node["content"]["id"]
+        return draft_ids
+
+
+_CLIENTS: Dict[Tuple[str, str], GitHubClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def github_client_for(token: str, api_url: str = GITHUB_API,
+                      pool_size: Optional[int] = None,
+                      env=None) -> GitHubClient:
+    """P19: a process-wide GitHubClient per (token, endpoint), kept warm.
+
+    Long-lived callers (the MCP server's in-process sync) reuse its
+    keep-alive session across syncs, so repeat syncs skip the TCP+TLS
+    handshake. The first call's `pool_size` (default: the sync
+    concurrency) sizes the pool. Timeouts and rate-limit knobs are
+    re-read from `env` (None: os.environ) on every call.
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get((digest, api_url))
+        if client is None:
+            if pool_size is None:
+                pool_size = _env_int(SYNC_CONCURRENCY_ENV,
+                                     DEFAULT_SYNC_CONCURRENCY, env)
+            client = _CLIENTS[(digest, api_url)] = GitHubClient(
+                token, api_url=api_url, pool_size=pool_size, env=env)
+        else:
+            client.configure(env)
+            with client.limiter._lock:
+                client.limiter.configure(env)
+        return client
+
+
+# P19: how often a waiting sync re-checks its cancel event (seconds).
+_CANCEL_POLL_SEC = 0.1
+
+
+@dataclass
+class SyncResult:
+    """P19: outcome of one sync run, for in-process callers.
+
+    Counts are of planned operations; a run with per-item failures
+    raises GitHubAPIError instead of returning.
+    """
+
+    repo: str
+    dry_run: bool = False
+    up_to_date: bool = False
+    created: int = 0
+    updated: int = 0
+    archived: int = 0
+    unchanged: int = 0
+    elapsed_ms: float = 0.0
+    # P23: in-place title updates of items matched by task id.
+    renamed: int = 0
+    # P25: in-place draft edits after a title or description change.
+    edited: int = 0
+    # P21: the plan a dry run produced.
+    plan: Optional["SyncPlan"] = None
+
+
+# P21: GitHub's documented secondary rate-limit weights for GraphQL
+# (points per request, budgeted per minute): a plain query costs 1, a
+# request containing mutations costs 5. Every request also costs at
+# least one primary-limit point (the hourly budget).
+SECONDARY_POINTS_QUERY = 1
+SECONDARY_POINTS_MUTATION = 5
+
+SYNC_OP_KINDS = ("create", "update", "rename", "edit", "archive", "noop")
+
+
+@dataclass
+class SyncOperation:
+    """P21: one planned change for one task.
+
+    `status` is the desired Status option (create / update / rename /
+    noop), `previous_status` what state last recorded (update /
+    rename), `item_id` the existing GitHub item (update / rename /
+    archive / noop). `status_available` is False when the project has
+    no option for `status`: the status write is skipped with a warning
+    (audit D11) and retried next run.
+
+    P23: a rename is a task whose title changed but whose task-id marker
+    matches a state entry: `previous_title` is that entry's title and
+    `draft_id` its cached DraftIssue id (None: looked up first).
+
+    P25: an edit is a tracked task whose title or description no longer
+    matches the content hashes state recorded for its item: the draft is
+    updated in place like a rename (status chained after it the same
+    way). `previous_title` stays None.
+    """
+
+    kind: str
+    title: str
+    status: Optional[str] = None
+    previous_status: Optional[str] = None
+    item_id: Optional[str] = None
+    status_available: bool = True
+    previous_title: Optional[str] = None
+    draft_id: Optional[str] = None
+
+
+@dataclass
+class SyncPlan:
+    """P21: the typed operation list a sync executes or a dry run reports.
+
+    `up_to_date` means the P15 fast path would skip GitHub entirely;
+    `metadata_cached` that no project-metadata query is needed (P16);
+    `resume_scan` that in-flight creates must be looked up first (P20);
+    `rebuild_scan` that state is first re-derived from the project's
+    items (P24), so any create may turn out to be an adoption.
+    """
+
+    repo: str
+    project_number: Optional[int]
+    operations: List[SyncOperation]
+    batch_size: int
+    concurrency: int
+    up_to_date: bool = False
+    metadata_cached: bool = False
+    resume_scan: bool = False
+    rebuild_scan: bool = False
+
+    def of_kind(self, kind: str) -> List[SyncOperation]:
+        return [op for op in self.operations if op.kind == kind]
+
+    @property
+    def creates(self) -> List[SyncOperation]:
+        return self.of_kind("create")
+
+    @property
+    def updates(self) -> List[SyncOperation]:
+        return self.of_kind("update")
+
+    @property
+    def renames(self) -> List[SyncOperation]:
+        return self.of_kind("rename")
+
+    @property
+    def edits(self) -> List[SyncOperation]:
+        return self.of_kind("edit")
+
+    @property
+    def archives(self) -> List[SyncOperation]:
+        return self.of_kind("archive")
+
+    def estimate(self) -> Dict:
+        """Requests and rate-limit points the plan should cost.
+
+        Mirrors Syncer._execute: each kind is sent in batches of
+        `batch_size`, and every create batch is followed by one batch
+        setting its items' statuses. A resume or rebuild scan is counted
+        as one page; larger projects may need more. P23: renames are title
+        batches, chained like creates when the column changed too, after
+        one draft-id query per 100 renames without a cached id. P25:
+        edits are sent in the same title batches as renames.
+        """
+        if self.up_to_date:
+            mutation_requests = query_requests = mutations = 0
+        else:
+            size = self.batch_size
+
+            def batches(count: int) -> int:
+                return -(-count // size)
+
+            def chained(ops: List[SyncOperation], moved) -> Tuple[int, int]:
+                # (status mutations, status batches) following `ops`.
+                moving = [moved(op) for op in ops]
+                return sum(moving), sum(
+                    1 for start in range(0, len(ops), size)
+                    if any(moving[start:start + size])
+                )
+
+            creates, renames = self.creates, self.renames + self.edits
+            create_statuses, create_followups = chained(
+                creates, lambda op: op.status_available)
+            rename_statuses, rename_followups = chained(
+                renames, lambda op: op.status_available
+                and op.status != op.previous_status)
+            updates = [op for op in self.updates if op.status_available]
+            mutation_requests = (batches(len(creates)) + create_followups
+                                 + batches(len(renames)) + rename_followups
+                                 + batches(len(updates))
+                                 + batches(len(self.archives)))
+            mutations = (len(creates) + create_statuses + len(renames)
+                         + rename_statuses + len(updates)
+                         + len(self.archives))
+            lookups = sum(1 for op in renames if op.draft_id is None)
+            query_requests = ((0 if self.metadata_cached else 1)
+                              + (1 if self.resume_scan or self.rebuild_scan
+                                 else 0)
+                              + -(-lookups // 100))
+        return {
+            "requests": query_requests + mutation_requests,
+            "query_requests": query_requests,
+            "mutation_requests": mutation_requests,
+            "mutations": mutations,
+            "rounds": -(-mutation_requests // self.concurrency),
+            "primary_points": query_requests + mutation_requests,
+            "secondary_points": (query_requests * SECONDARY_POINTS_QUERY
+                                 + mutation_requests * SECONDARY_POINTS_MUTATION),
+        }
+
+    def to_dict(self) -> Dict:
+        counts = {kind: len(self.of_kind(kind)) for kind in SYNC_OP_KINDS}
+        return {
+            "repo": self.repo,
+            "project_number": self.project_number,
+            "up_to_date": self.up_to_date,
+            "metadata_cached": self.metadata_cached,
+            "resume_scan": self.resume_scan,
+            "rebuild_scan": self.rebuild_scan,
+            "batch_size": self.batch_size,
+            "concurrency": self.concurrency,
+            "counts": counts,
+            "estimate": self.estimate(),
+            "operations": [asdict(op) for op in self.operations],
+        }
+
+
+def build_plan(repo: str, project_number: Optional[int],
+               local_flat: Dict[str, str], state: "StateManager",
+               status_options: Optional[Dict], batch_size: int,
+               concurrency: int,
+               task_ids: Optional[Dict[str, str]] = None,
+               descriptions: Optional[Dict[str, str]] = None) -> SyncPlan:
+    """P21: diff the board ({title: column}) against sync state.
+
+    Board order for creates / updates / renames / no-ops, then archives
+    for state entries no longer on the board. `status_options` None means
+    unknown (dry run without cached metadata): every status counts as
+    available.
+
+    P23: `task_ids` ({title: task id} from the board's markers) turns a
+    would-be create into a rename when a state entry that left the board
+    carries the same id — that entry's item is retitled, not archived.
+
+    P25: `descriptions` ({title: description}) with the title gives a
+    task's content hashes; a tracked task whose hashes differ from its
+    entry's becomes an edit (carrying any status change along).
+    """
+    tasks = state.state["tasks"]
+    departed = {entry["task_id"]: title for title, entry in tasks.items()
+                if title not in local_flat and entry.get("task_id")
+                and entry.get("item_id")}
+    operations: List[SyncOperation] = []
+    for title, desired_status in local_flat.items():
+        item_id = state.get_item_id(title)
+        stored_status = state.get_status(title)
+        available = status_options is None or desired_status in status_options
+        old_title = None
+        if not item_id:
+            old_title = departed.pop((task_ids or {}).get(title), None)
+        if old_title is not None:
+            entry = tasks[old_title]
+            operations.append(SyncOperation(
+                "rename", title, desired_status, entry.get("status"),
+                entry["item_id"], available, old_title, entry.get("draft_id")))
+        elif not item_id:
+            operations.append(SyncOperation(
+                "create", title, desired_status, status_available=available))
+        elif state.content_hashes(title) != _content_hashes(
+                title, (descriptions or {}).get(title)):
+            operations.append(SyncOperation(
+                "edit", title, desired_status, stored_status, item_id,
+                available, draft_id=tasks[title].get("draft_id")))
+        elif stored_status != desired_status:
+            # Status changed (or first status set after a previous
+            # failed attempt — see D12)
+            operations.append(SyncOperation(
+                "update", title, desired_status, stored_status, item_id,
+                available))
+        else:
+            operations.append(SyncOperation(
+                "noop", title, desired_status, stored_status, item_id))
+    renamed = {op.previous_title for op in operations if op.kind == "rename"}
+    for title in tasks:
+        if title not in local_flat and title not in renamed:
+            operations.append(SyncOperation(
+                "archive", title, item_id=state.get_item_id(title)))
+    return SyncPlan(repo, project_number, operations, batch_size, concurrency)
+
 
 class Syncer:
-    """Orchestrates the synchronization between local kanban and GitHub project."""
+    """Orchestrates the synchronization between local kanban and GitHub project.
+
+    P19: `out` / `err` receive the progress and warning lines (None means
+    sys.stdout / sys.stderr), so an in-process caller can capture them.
+    Setting the `cancel` event stops the run at the next stage or batch
+    boundary with SyncCancelled; in-flight batches land and are saved.
+    """
     
-    def __init__(self, board: LocalBoard, state: StateManager, client: GitHubClient):
+    def __init__(self, board: LocalBoard, state: StateManager, client: GitHubClient,
+                 batch_size: Optional[int] = None,
+                 concurrency: Optional[int] = None,
+                 cancel: Optional[threading.Event] = None,
+                 out=None, err=None, env=None):
         self.board = board
         self.state = state
         self.client = client
+        self.cancel = cancel
+        self.out = out
+        self._err = err
+        self._key_adopted = False
+        # P23: {title: task id} for board tasks carrying a marker.
+        self.task_ids: Dict[str, str] = {}
+        # P25: {title: description} for board tasks that have one.
+        self.descriptions: Dict[str, str] = {}
         self.status_field_id = None
         self.status_options = {}
-    
-    def sync(self, repo: str, project_number: Optional[int] = None):
-        """Perform the full synchronization."""
-        owner, repo_name = repo.split('/')
-        
-        print(f"Parsing {self.board.file_path}...")
+        # P19: where KANBANGER_* knobs are read (None: os.environ).
+        self.env = env
+        if batch_size is None:
+            batch_size = _env_int(SYNC_BATCH_SIZE_ENV, DEFAULT_SYNC_BATCH_SIZE,
+                                  env)
+        self.batch_size = max(1, batch_size)
+        if concurrency is None:
+            concurrency = _env_int(SYNC_CONCURRENCY_ENV,
+                                   DEFAULT_SYNC_CONCURRENCY, env)
+        self.concurrency = max(1, concurrency)
+
+    @property
+    def err(self):
+        # Resolved per use: print(file=None) would mean stdout.
+        return self._err if self._err is not None else sys.stderr
+
+    def _check_cancel(self) -> None:
+        if self.cancel is not None and self.cancel.is_set():
+            raise SyncCancelled("sync cancelled")
+
+    def _execute(self, project_id: str, status_field_id: str,
+                 plan: "SyncPlan") -> List[str]:
+        """Run `plan`'s operations; return per-item failure messages.
+
+        P12: operations go to GitHubClient.mutate_batch `self.batch_size`
+        at a time. P13: batches run on a pool of `self.concurrency`
+        worker threads — creates, status updates of existing items and
+        archives touch distinct items, so they are all in flight at once.
+        The one ordering that matters is kept by chaining: a created
+        item's status update is only submitted once its create batch has
+        returned (D12: state records the item with status=None first).
+
+        Workers only talk to GitHub. All state edits and saves happen
+        here on the calling thread as batches complete, so StateManager
+        needs no locking and state is persisted after every batch (D7) —
+        P18: as appended journal records, not a full rewrite.
+
+        A per-alias failure is recorded and the rest carries on. A
+        document-level GitHubAPIError — or P19 cancellation — stops new
+        submissions and drops queued batches, lets the in-flight ones land
+        (and be recorded), then raises.
+        """
+        failures: List[str] = []
+        fatal: Optional[Exception] = None
+        pending: Dict = {}
+        desired = {op.title: op.status for op in plan.creates}
+        creates = list(desired)
+        # Updates to a status the project lacks were warned about when
+        # the plan was printed; state keeps the old status (retry later).
+        updates = [(op.title, op.item_id, op.status)
+                   for op in plan.updates if op.status_available]
+        archives = [(op.title, op.item_id) for op in plan.archives]
+        retitles, moved = self._retitles(plan.renames + plan.edits)
+        updates += moved
+
+        def status_vars(update):
+            return {
+                "projectId": project_id, "itemId": update[1],
+                "fieldId": status_field_id,
+                "optionId": self.status_options[update[2]],
+            }
+
+        # P20: checkpoint every create before any is sent; the journal
+        # must be durable before GitHub can hold an item we don't know of.
+        op_ids = {}
+        for title in creates:
+            op_ids[title] = uuid.uuid4().hex
+            self.state.mark_in_flight(title, op_ids[title])
+        self.state.flush()
+
+        variables = {
+            "create": lambda title: {"projectId": project_id, "title": title,
+                                     "body": self._draft_body(title, op_ids[title])},
+            "status": status_vars,
+            "archive": lambda archive: {"projectId": project_id,
+                                        "itemId": archive[1]},
+            "title": lambda retitle: {"draftIssueId": retitle[3],
+                                      "title": retitle[0],
+                                      "body": self._draft_body(retitle[0])},
+        }
+
+        def submit(kind: str, entries: List) -> None:
+            for start in range(0, len(entries), self.batch_size):
+                chunk = entries[start:start + self.batch_size]
+                ops = [(kind, variables[kind](entry)) for entry in chunk]
+                pending[pool.submit(run_batch, ops)] = (kind, chunk)
+
+        def run_batch(ops):
+            self._check_cancel()
+            return self.client.mutate_batch(ops)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            submit("create", creates)
+            submit("status", updates)
+            submit("title", retitles)
+            submit("archive", archives)
+            while pending:
+                done, _ = wait(pending, timeout=_CANCEL_POLL_SEC,
+                               return_when=FIRST_COMPLETED)
+                if fatal is None and self.cancel is not None \
+                        and self.cancel.is_set():
+                    fatal = SyncCancelled("sync cancelled")
+                if fatal is not None:
+                    for future in pending:
+                        future.cancel()
+                # Handle completions in submission order so state edits
+                # and follow-up batches are deterministic.
+                for future in [f for f in pending if f in done or f.cancelled()]:
+                    kind, chunk = pending.pop(future)
+                    if future.cancelled():
+                        if kind == "create":
+                            # Never sent: nothing to adopt next run.
+                            for title in chunk:
+                                self.state.clear_in_flight(title)
+                        continue
+                    try:
+                        outcomes = future.result()
+                    except SyncCancelled as e:
+                        if kind == "create":
+                            for title in chunk:  # cancelled before sending
+                                self.state.clear_in_flight(title)
+                        fatal = fatal or e
+                        continue
+                    except GitHubAPIError as e:
+                        if _STALE_METADATA_ERROR.search(str(e)):
+                            self.state.invalidate_project_cache()
+                        fatal = fatal or e
+                        continue
+                    followups = []
+                    for entry, (item_id, error) in zip(chunk, outcomes):
+                        if error is not None:
+                            if _STALE_METADATA_ERROR.search(error):
+                                # P16: a cached id was rejected; re-fetch
+                                # the project metadata next run.
+                                self.state.invalidate_project_cache()
+                            label = entry if isinstance(entry, str) else entry[0]
+                            if kind == "create":
+                                # GitHub rejected it: nothing was created.
+                                self.state.clear_in_flight(entry)
+                            failures.append(f"{kind} '{label}': {error}")
+                            print(f"  ERROR: {kind} '{label}' failed: {error}",
+                                  file=self.err)
+                        elif kind == "create":
+                            self.state.update_task(entry, item_id, None,
+                                                   self.task_ids.get(entry),
+                                                   **self._hashes(entry))
+                            desired_status = desired[entry]
+                            if desired_status in self.status_options:
+                                followups.append((entry, item_id, desired_status))
+                            else:
+                                # No matching Status option on the Project.
+                                # Item is created with no Status; state
+                                # stays at None so the next sync will
+                                # [UPDATE]-retry. Loud + persistent: the
+                                # user must add the option or remove the
+                                # kanban entry. (Closes the partymix
+                                # REVIEW-sync gap class — audit D11.)
+                                print(
+                                    f"  WARNING: '{desired_status}' has no matching "
+                                    f"Status option on the GitHub Project; item "
+                                    f"created with no Status. Sync will retry next "
+                                    f"run.",
+                                    file=self.err,
+                                )
+                        elif kind == "status":
+                            # Confirmed — persist status
+                            title, item_id, desired_status = entry
+                            self.state.update_task(title, item_id, desired_status)
+                        elif kind == "title":
+                            title, old_title, item_id, _, desired_status = entry
+                            if old_title != title:
+                                self.state.rename_task(old_title, title)
+                            self.state.set_task_fields(title,
+                                                       **self._hashes(title))
+                            if desired_status is not None:
+                                followups.append((title, item_id, desired_status))
+                        else:
+                            self.state.remove_task(entry[0])
+                    self.state.flush()
+                    if followups and fatal is None:
+                        submit("status", followups)
+
+        if fatal is not None:
+            raise fatal
+        return failures
+
+    def _retitles(self, renames: List[SyncOperation]) -> Tuple[List, List]:
+        """P23: split renames into title updates and plain status updates.
+
+        Title updates are (title, old title, item id, draft id, status to
+        set afterwards or None); draft ids state has not cached are looked
+        up first. An item that is no longer a draft (converted to an
+        issue) cannot be retitled through the project: its state entry
+        just moves to the new title, with a warning, and only a changed
+        status is sent. P25: edits are handled the same way, with the old
+        title equal to the title; an edit that cannot be sent records the
+        new hashes so it is not retried every run.
+        """
+        missing = [op.item_id for op in renames if op.draft_id is None]
+        draft_ids = self.client.get_draft_issue_ids(missing) if missing else {}
+        retitles, updates = [], []
+        for op in renames:
+            moved = op.status != op.previous_status and op.status_available
+            old_title = op.previous_title or op.title
+            draft_id = op.draft_id or draft_ids.get(op.item_id)
+            if draft_id is None:
+                if old_title != op.title:
+                    print(f"  WARNING: '{old_title}' is no longer a draft "
+                          f"issue; rename it on GitHub. Tracking it as "
+                          f"'{op.title}'.", file=self.err)
+                    self.state.rename_task(old_title, op.title)
+                else:
+                    print(f"  WARNING: '{op.title}' is no longer a draft "
+                          f"issue; edit it on GitHub.", file=self.err)
+                self.state.set_task_fields(op.title, **self._hashes(op.title))
+                if moved:
+                    updates.append((op.title, op.item_id, op.status))
+                continue
+            if op.draft_id is None:
+                self.state.set_task_fields(old_title, draft_id=draft_id)
+            retitles.append((op.title, old_title, op.item_id,
+                             draft_id, op.status if moved else None))
+        return retitles, updates
+
+    def _load_local(self) -> Dict[str, str]:
+        """Parse the board and load state; return {title: column}."""
+        print(f"Parsing {self.board.file_path}...", file=self.out)
         local_tasks = self.board.parse()
         
-        print(f"Loading state from {self.state.state_file}...")
+        print(f"Loading state from {self.state.state_file}...", file=self.out)
         self.state.load()
 
         # ADR 0002 copied-board guard: refuse BEFORE any network call if
         # this state file belongs to a different board than the one on
         # disk (raises ConfigurationError). Unkeyed legacy boards skip the
         # check; a keyed board's key is adopted into state on first sync.
+        recorded_key = self.state.state.get("board_key")
         self.state.verify_board_key(read_board_key(self.board.file_path))
+        self._key_adopted = self.state.state.get("board_key") != recorded_key
 
-        print(f"Connecting to GitHub repository {repo}...")
-        repo_node_id, project_id, status_field_id, status_options = self.client.get_repo_project(
-            owner, repo_name, project_number
-        )
-        
-        self.status_field_id = status_field_id
-        self.status_options = status_options
-        
-        # Update state with project info
-        self.state.set_project_info(repo_node_id, project_id)
-        
-        print(f"Fetching remote project items...")
-        remote_items = self.client.get_project_items(project_id)
-        remote_by_title = {item["title"]: item for item in remote_items}
-        
-        print(f"\nSynchronizing...")
-        
         # Flatten local tasks to (title, status) pairs
         local_flat = {}
+        self.task_ids = {}
+        self.descriptions = {}
         for column, tasks in local_tasks.items():
             for task in tasks:
                 local_flat[task["title"]] = column
-        
-        # Track which remote items we've seen
-        seen_remote = set()
-        
-        # Process local tasks
-        for title, desired_status in local_flat.items():
-            item_id = self.state.get_item_id(title)
-            stored_status = self.state.get_status(title)
-            
-            if not item_id:
-                # New task - create it
-                print(f"  [CREATE] {title} => {desired_status}")
-                item_id = self.client.create_draft_issue(project_id, title)
-                # D7+D12: persist item_id with status=None first. The
-                # confirmed status is only persisted AFTER the status
-                # update mutation succeeds. Prevents the stuck-no-status
-                # idempotency bug where a transient failure between
-                # create_draft_issue and update_item_status leaves state
-                # desynced from GH (state thinks status set; GH has none;
-                # next sync sees stored == desired and skips forever).
-                self.state.update_task(title, item_id, None)
-                self.state.save()
-
-                # Set initial status
-                if desired_status in self.status_options:
-                    self.client.update_item_status(
-                        project_id, item_id, status_field_id,
-                        self.status_options[desired_status]
-                    )
-                    # Confirmed — persist status
-                    self.state.update_task(title, item_id, desired_status)
-                    self.state.save()
-                else:
-                    # No matching Status option on the Project. Item is
-                    # created with no Status; state stays at None so the
-                    # next sync will [UPDATE]-retry. Loud + persistent:
-                    # the user must add the option or remove the kanban
-                    # entry. (Closes the partymix REVIEW-sync gap class
-                    # — audit D11.)
-                    print(
-                        f"  WARNING: '{desired_status}' has no matching "
-                        f"Status option on the GitHub Project; item "
-                        f"created with no Status. Sync will retry next "
-                        f"run.",
-                        file=sys.stderr,
-                    )
-            elif stored_status != desired_status:
-                # Status changed (or first status set after a previous
-                # failed attempt — see D12 pattern above)
-                print(f"  [UPDATE] {title}: {stored_status} => {desired_status}")
-                if desired_status in self.status_options:
-                    self.client.update_item_status(
-                        project_id, item_id, status_field_id,
-                        self.status_options[desired_status]
-                    )
-                    # Confirmed — persist
-                    self.state.update_task(title, item_id, desired_status)
-                    self.state.save()
-                else:
+                if task["task_id"]:
+                    self.task_ids[task["title"]] = task["task_id"]
+                if task["description"]:
+                    self.descriptions[task["title"]] = task["description"]
+
+        # P25: entries synced before P25 are keyed by the full task text
+        # ("X - desc"), which was also their draft's title. Move each to
+        # its task's title, recording that content, so the plan edits the
+        # draft in place instead of archiving it and creating a new one.
+        state_tasks = self.state.state["tasks"]
+        for key in [key for key, entry in state_tasks.items()
+                    if key not in local_flat and " - " in key
+                    and not entry.get("title_hash")]:
+            title = key.split(" - ", 1)[0].strip()
+            if title in local_flat and title not in state_tasks:
+                self.state.rename_task(key, title)
+                self.state.set_task_fields(title, **_content_hashes(key, None))
+
+        # P23: entries synced before their task carried an id adopt it,
+        # so a later rename can be matched.
+        for title, task_id in self.task_ids.items():
+            if title in state_tasks and state_tasks[title].get("task_id") != task_id:
+                self.state.set_task_fields(title, task_id=task_id)
+        return local_flat
+
+    def _is_up_to_date(self, digest: str, force: bool) -> bool:
+        """P15: the last complete sync already pushed exactly this."""
+        return (not force
+                and not self.state.in_flight()
+                and not self._key_adopted
+                and self.state.state.get("last_synced_digest") == digest)
+
+    def _cached_metadata(self, fingerprint: str, local_flat: Dict[str, str],
+                         force: bool) -> Optional[Tuple[str, str, str, Dict]]:
+        """P16: usable cached project metadata, or None to fetch it."""
+        if force:
+            return None
+        cached = self.state.get_project_cache(
+            fingerprint,
+            _env_seconds(PROJECT_CACHE_TTL_ENV, DEFAULT_PROJECT_CACHE_TTL_SEC,
+                         self.env),
+        )
+        # A column the cached option map lacks may be an option added on
+        # GitHub since; re-fetch rather than warn about it until expiry.
+        if cached is not None and set(local_flat.values()) <= set(cached[3]):
+            return cached
+        return None
+
+    def plan(self, repo: str, project_number: Optional[int] = None,
+             force: bool = False, rebuild: bool = False) -> "SyncPlan":
+        """P21: what sync() would do, without contacting GitHub.
+
+        Diffs the board against .kanban.json (Status options from the
+        metadata cache when present) and reports the request estimate
+        under this Syncer's batch size and concurrency. Nothing is saved.
+        P24: a pending rebuild plans against empty state — every task a
+        create that the rebuild scan may adopt instead.
+        """
+        local_flat = self._load_local()
+        rebuild = rebuild or bool(self.state.state.get("needs_rebuild"))
+        digest = _sync_digest(repo, project_number, local_flat,
+                              self.task_ids, self.descriptions)
+        cached = self._cached_metadata(
+            _project_fingerprint(getattr(self.client, "api_url", GITHUB_API),
+                                 repo, project_number),
+            local_flat, force,
+        )
+        plan = build_plan(repo, project_number, local_flat,
+                          StateManager(self.board.file_path, self.env)
+                          if rebuild else self.state,
+                          cached[3] if cached else None, self.batch_size,
+                          self.concurrency, self.task_ids, self.descriptions)
+        plan.up_to_date = not rebuild and self._is_up_to_date(digest, force)
+        plan.metadata_cached = cached is not None
+        plan.resume_scan = not rebuild and bool(self.state.in_flight())
+        plan.rebuild_scan = rebuild
+        return plan
+
+    def print_plan(self, plan: "SyncPlan") -> None:
+        for op in plan.operations:
+            if op.kind == "create":
+                print(f"  [CREATE] {op.title} => {op.status}", file=self.out)
+            elif op.kind == "update":
+                print(f"  [UPDATE] {op.title}: {op.previous_status} => "
+                      f"{op.status}", file=self.out)
+                if not op.status_available:
                     # No matching Status option. Skip the update; state
                     # stays at stored_status. Sync will keep flagging
                     # until the option is added or the kanban entry is
                     # removed.
                     print(
-                        f"  WARNING: '{desired_status}' has no matching "
+                        f"  WARNING: '{op.status}' has no matching "
+                        f"Status option on the GitHub Project; status "
+                        f"not updated. Sync will retry next run.",
+                        file=self.err,
+                    )
+            elif op.kind in ("rename", "edit"):
+                line = (f"  [RENAME] {op.previous_title} => {op.title}"
+                        if op.kind == "rename" else f"  [EDIT] {op.title}")
+                if op.status != op.previous_status:
+                    line += f" ({op.previous_status} => {op.status})"
+                print(line, file=self.out)
+                if op.status != op.previous_status and not op.status_available:
+                    print(
+                        f"  WARNING: '{op.status}' has no matching "
                         f"Status option on the GitHub Project; status "
                         f"not updated. Sync will retry next run.",
-                        file=sys.stderr,
+                        file=self.err,
                     )
+            elif op.kind == "archive":
+                print(f"  [ARCHIVE] {op.title}", file=self.out)
             else:
-                # No change
-                print(f"  [OK] {title}")
-
-            seen_remote.add(title)
-
-        # Archive tasks that were removed from markdown
-        for title in list(self.state.state["tasks"].keys()):
-            if title not in local_flat:
-                item_id = self.state.get_item_id(title)
-                print(f"  [ARCHIVE] {title}")
-                self.client.archive_item(project_id, item_id)
-                self.state.remove_task(title)
-                # D7: persist after each archive so the local state matches
-                # the GH-side archive even if the loop is interrupted.
-                self.state.save()
-
-        # End-of-loop save remains as a defensive flush; a no-op when
-        # per-item saves already covered every mutation, but cheap and
-        # keeps the existing "Sync complete" semantics intact.
-        print(f"\nSaving state...")
+                print(f"  [OK] {op.title}", file=self.out)
+
+    def _adopt_in_flight(self, project_id: str) -> None:
+        """P20: resolve creates a previous run sent but never recorded.
+
+        Streams the project's items until every in-flight op id is
+        found in a draft body: found drafts are adopted into state (with
+        their current remote status), the rest are forgotten so this run
+        creates them afresh.
+        """
+        waiting = {op_id: title for title, op_id in self.state.in_flight().items()}
+        print(f"Resuming interrupted sync: looking for {len(waiting)} "
+              f"in-flight create(s)...", file=self.out)
+        for item in self.client.iter_project_items(project_id):
+            match = _OP_ID_RE.search(item.get("body") or "")
+            title = waiting.pop(match.group(1), None) if match else None
+            if title is not None:
+                print(f"  [ADOPT] {title}", file=self.out)
+                self.state.update_task(title, item["id"], item.get("status"),
+                                       self.task_ids.get(title),
+                                       **_remote_hashes(item))
+            if not waiting:
+                break
+        for title in waiting.values():
+            self.state.clear_in_flight(title)
+        self.state.flush()
+
+    def _draft_body(self, title: str, op_id: Optional[str] = None) -> str:
+        """Draft body for a task: its P25 description, then a create's P20
+        op-id marker and the task's P23 id marker when it has one (P24
+        matches rebuilds by it)."""
+        markers = []
+        if op_id is not None:
+            markers.append(format_op_marker(op_id))
+        if title in self.task_ids:
+            markers.append(format_task_id_marker(self.task_ids[title]))
+        description = self.descriptions.get(title, "")
+        return "\n\n".join(part for part in (description, "\n".join(markers))
+                           if part)
+
+    def _hashes(self, title: str) -> Dict[str, str]:
+        """P25: content hashes of the draft this run pushes for `title`."""
+        return _content_hashes(title, self.descriptions.get(title))
+
+    def _rebuild_state(self, project_id: str, local_flat: Dict[str, str]) -> None:
+        """P24: re-derive the task entries from the project's items.
+
+        For a lost or corrupt .kanban.json: the entries are dropped, then
+        the project's items are streamed — stopping as soon as every
+        board task is matched — and each item whose body carries a board
+        task's id marker, or else whose title equals a board task's, is
+        adopted with its remote status. The plan then only creates what
+        was not found; items matching no task are left alone. An item
+        matched by id under an old title is adopted under that title, so
+        the plan retitles it (P23). P25: adopted items record the hashes
+        of their remote content, so the plan edits any that differ; a
+        draft titled with a task's full pre-P25 text ("X - desc") matches
+        that task too.
+        """
+        for title in list(self.state.state["tasks"]):
+            self.state.remove_task(title)
+        for title in self.state.in_flight():
+            self.state.clear_in_flight(title)
+        by_id = {task_id: title for title, task_id in self.task_ids.items()}
+        by_text = {f"{title} - {description}": title
+                   for title, description in self.descriptions.items()}
+        waiting = set(local_flat)
+        print(f"Rebuilding sync state from the GitHub project "
+              f"({len(waiting)} board task(s))...", file=self.out)
+        adopted = 0
+        items = self.client.iter_project_items(project_id) if waiting else ()
+        for item in items:
+            title = by_id.get(_body_task_id(item.get("body") or ""))
+            key = title
+            if title is None:
+                title = key = by_text.get(item["title"], item["title"])
+            elif item["title"] != title and item["title"] not in local_flat:
+                key = item["title"]
+            if title not in waiting:
+                continue  # a duplicate, or not on the board
+            waiting.discard(title)
+            self.state.update_task(key, item["id"], item.get("status"),
+                                   self.task_ids.get(title),
+                                   **_remote_hashes(item))
+            adopted += 1
+            if not waiting:
+                break
+        self.state.state.pop("needs_rebuild", None)
+        self.state.flush()
+        print(f"  Adopted {adopted} existing item(s); {len(waiting)} task(s) "
+              f"not found on the project.", file=self.out)
+
+    def sync(self, repo: str, project_number: Optional[int] = None,
+             force: bool = False, rebuild: bool = False) -> SyncResult:
+        """Perform the full synchronization; return what it did (P19).
+
+        P15: unless `force`, returns before any GitHub call when the
+        board's sync digest matches the one recorded by the last complete
+        sync (see _sync_digest). `force` re-checks everything — use it
+        after editing or deleting items on the GitHub side.
+
+        P16: project metadata comes from the .kanban.json cache while it
+        is fresh (KANBANGER_PROJECT_CACHE_TTL_SEC) and offers every
+        column on the board; otherwise — or with `force` — it is fetched
+        with get_repo_project and re-cached.
+
+        P24: `rebuild` (and a state reset after corruption) re-derives
+        the task entries from the project's items before planning; see
+        _rebuild_state.
+        """
+        started = time.perf_counter()
+        owner, repo_name = repo.split('/')
+
+        local_flat = self._load_local()
+        rebuild = rebuild or bool(self.state.state.get("needs_rebuild"))
+        digest = _sync_digest(repo, project_number, local_flat,
+                              self.task_ids, self.descriptions)
+        if not rebuild and self._is_up_to_date(digest, force):
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"Up to date: board unchanged since the last sync "
+                  f"({elapsed:.0f} ms, no GitHub calls).", file=self.out)
+            return SyncResult(repo, up_to_date=True, unchanged=len(local_flat),
+                              elapsed_ms=round(elapsed, 1))
+        # Disarm until this run proves GitHub matches the board again, so
+        # an interrupted sync can never leave a stale digest behind.
+        self.state.state.pop("last_synced_digest", None)
+
+        self._check_cancel()
+        print(f"Connecting to GitHub repository {repo}...", file=self.out)
+        fingerprint = _project_fingerprint(
+            getattr(self.client, "api_url", GITHUB_API), repo, project_number
+        )
+        cached = self._cached_metadata(fingerprint, local_flat, force)
+        if cached is not None:
+            print("Using cached project metadata.", file=self.out)
+            repo_node_id, project_id, status_field_id, status_options = cached
+        else:
+            repo_node_id, project_id, status_field_id, status_options = self.client.get_repo_project(
+                owner, repo_name, project_number
+            )
+            self.state.set_project_cache(
+                fingerprint, repo_node_id, project_id, status_field_id,
+                status_options,
+            )
+        
+        self.status_field_id = status_field_id
+        self.status_options = status_options
+        
+        # Update state with project info
+        self.state.set_project_info(repo_node_id, project_id)
+
+        # P17: reconciliation works from .kanban.json alone, so the
+        # project's items are not paginated here. Modes that do need the
+        # remote side stream them via client.iter_project_items.
+        # P20: resuming an interrupted run is one of them; P24: so is
+        # rebuilding lost state, which adopts in-flight creates too.
+        if rebuild:
+            self._rebuild_state(project_id, local_flat)
+        elif self.state.in_flight():
+            self._adopt_in_flight(project_id)
+
+        self._check_cancel()
+        print(f"\nSynchronizing...", file=self.out)
+        
+        # P12/P13: plan first, then hand the whole plan to _execute, which
+        # sends it as aliased mutation batches on a bounded worker pool
+        # instead of one sequential round-trip per operation. P21: the
+        # plan is the same typed SyncPlan a dry run reports.
+        plan = build_plan(repo, project_number, local_flat, self.state,
+                          self.status_options, self.batch_size,
+                          self.concurrency, self.task_ids, self.descriptions)
+        self.print_plan(plan)
+
+        try:
+            failures = self._execute(project_id, status_field_id, plan)
+        except (GitHubAPIError, SyncCancelled):
+            # P18: compact what landed (and non-task edits such as a
+            # dropped project cache) before surfacing the failure.
+            self.state.save()
+            raise
+
+        if failures:
+            self.state.save()
+            raise GitHubAPIError(
+                f"{len(failures)} GitHub operation(s) failed; state saved "
+                f"for everything that succeeded, re-run sync to retry:\n"
+                + "\n".join(f"  - {failure}" for failure in failures)
+            )
+
+        # P15: only a sync that left every task at its desired status
+        # (no failures, no missing Status options awaiting retry) may
+        # arm the no-op fast path for the next run.
+        tasks_state = self.state.state["tasks"]
+        if set(tasks_state) == set(local_flat) and all(
+                tasks_state[title].get("status") == column
+                for title, column in local_flat.items()):
+            self.state.state["last_synced_digest"] = digest
+        else:
+            self.state.state.pop("last_synced_digest", None)
+
+        # P18: the single full rewrite of the run — compacts the batch
+        # journal into .kanban.json and persists the non-task fields.
+        print(f"\nSaving state...", file=self.out)
         self.state.save()
-        print(f"Sync complete!")
+        print(f"Sync complete!", file=self.out)
+        self._report_latency()
+        return SyncResult(
+            repo, created=len(plan.creates), updated=len(plan.updates),
+            archived=len(plan.archives), unchanged=len(plan.of_kind("noop")),
+            renamed=len(plan.renames), edited=len(plan.edits),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+    def _report_latency(self) -> None:
+        """P11: one-line GitHub API latency summary for the run.
+
+        P14: plus the rate-limit cost the run consumed.
+        """
+        self._report_rate_limit()
+        summary = self.client.latency_summary()
+        if summary["requests"]:
+            print(
+                f"GitHub API: {summary['requests']} requests, "
+                f"total {summary['total_ms']:.0f} ms, "
+                f"mean {summary['mean_ms']:.1f} ms, "
+                f"p50 {summary['p50_ms']:.1f} ms, "
+                f"p95 {summary['p95_ms']:.1f} ms, "
+                f"max {summary['max_ms']:.1f} ms",
+                file=self.out,
+            )
+
+    def _report_rate_limit(self) -> None:
+        limiter = getattr(self.client, "limiter", None)
+        if limiter is None:
+            return
+        summary = limiter.summary()
+        if summary["remaining"] is None and not summary["retries"]:
+            return
+        parts = [f"query cost {summary['query_cost']}"]
+        if summary["points_used"] is not None:
+            parts.append(f"~{summary['points_used']} points used")
+        if summary["remaining"] is not None:
+            parts.append(f"{summary['remaining']} remaining")
+        if summary["reset_at"]:
+            parts.append("resets " + datetime.fromtimestamp(
+                summary["reset_at"]).strftime("%H:%M:%S"))
+        if summary["retries"]:
+            parts.append(f"{summary['retries']} throttled retr"
+                         f"{'y' if summary['retries'] == 1 else 'ies'}")
+        if summary["throttled_sec"]:
+            parts.append(f"paced {summary['throttled_sec']:.1f}s")
+        print("GitHub rate limit: " + ", ".join(parts), file=self.out)
+
+
+def _load_dotenv() -> None:
+    """Load the CLI's .env file, if any, into os.environ.
+
+    P19: called from main() rather than at import, so importing this
+    module in-process (the MCP server's sync engine) never rewrites the
+    server's environment with whatever .env its CWD happens to hold.
+    """
+    # override=True: the project's `.env` is the authoritative target for
+    # this sync run. Without it, a shell-level export (e.g. a stale
+    # GITHUB_REPO=owner/other-project from another workspace's profile
+    # script) silently shadows the `.env` value and routes the sync to
+    # the wrong project — items get written into another repo's Project
+    # instead of the intended one, with no error surfaced.
+    # find_dotenv(usecwd=True): the default `find_dotenv()` walks upward
+    # from the *caller module's file location* (i.e. this file's
+    # directory), not from the user's CWD. When kanban-sync is invoked
+    # from a target project, that lookup can latch onto a rogue
+    # parent-of-source-directory `.env` (e.g. ~/Desktop/AI/.env) and the
+    # target project's `.env` is never considered. usecwd=True makes the
+    # search start at os.getcwd() so the CWD-closest `.env` wins.
+    try:
+        from dotenv import load_dotenv, find_dotenv
+        load_dotenv(find_dotenv(usecwd=True), override=True)
+    except ImportError:
+        pass  # python-dotenv not installed, skip
+
+
+def run_sync(kanban_file: str, repo: str, project_number: Optional[int] = None,
+             *, token: Optional[str] = None,
+             client: Optional[GitHubClient] = None,
+             dry_run: bool = False, force: bool = False,
+             batch_size: Optional[int] = None,
+             concurrency: Optional[int] = None,
+             cancel: Optional[threading.Event] = None,
+             out=None, err=None, json_plan: bool = False,
+             rebuild_state: bool = False, env=None) -> SyncResult:
+    """Sync `kanban_file` to `repo`'s project: the CLI's work as a call (P19).
+
+    Uses `client` when given (e.g. a warm github_client_for() client),
+    else a fresh GitHubClient for `token`, closed afterwards. `out`,
+    `err` and `cancel` are passed to Syncer. Raises the typed
+    KanbangerError subclasses on failure.
+
+    P21: `dry_run` plans without any GitHub call or state write and
+    returns the SyncPlan on the result; it is printed to `out` as
+    readable lines, or as JSON alone with `json_plan` (progress then
+    goes to `err`).
+
+    P24: `rebuild_state` re-derives .kanban.json's task entries from the
+    project's items before syncing (Syncer._rebuild_state).
+
+    `env` is the mapping the KANBANGER_* / GITHUB_* tuning knobs are read
+    from (None: os.environ); an owned client is built from it too.
+    """
+    if not repo:
+        raise ConfigurationError(
+            "--repo or GITHUB_REPO environment variable required"
+        )
+    if not os.path.exists(kanban_file):
+        raise ConfigurationError(f"File not found: {kanban_file}")
+
+    board = LocalBoard(kanban_file)
+
+    if dry_run:
+        planner = Syncer(board, StateManager(kanban_file, env), client,
+                         batch_size=batch_size, concurrency=concurrency,
+                         out=(err if err is not None else sys.stderr)
+                         if json_plan else out,
+                         err=err, env=env)
+        plan = planner.plan(repo, project_number, force=force,
+                            rebuild=rebuild_state)
+        if json_plan:
+            print(json.dumps(plan.to_dict(), indent=2), file=out)
+        else:
+            print("\nPlan:", file=out)
+            if plan.up_to_date:
+                print("  Up to date: board unchanged since the last sync.",
+                      file=out)
+            else:
+                if plan.rebuild_scan:
+                    print("  Rebuild: state is first re-derived from the "
+                          "project's items; creates that match an existing "
+                          "item are adopted instead.", file=out)
+                planner.print_plan(plan)
+            estimate = plan.estimate()
+            print(
+                f"\nEstimate: {estimate['requests']} GitHub request(s) "
+                f"({estimate['mutation_requests']} mutation, "
+                f"{estimate['query_requests']} query) carrying "
+                f"{estimate['mutations']} mutation(s) in "
+                f"{estimate['rounds']} round(s); ~{estimate['primary_points']} "
+                f"primary / ~{estimate['secondary_points']} secondary "
+                f"rate-limit points.",
+                file=out,
+            )
+        return SyncResult(repo, dry_run=True, plan=plan)
+
+    if concurrency is None:
+        concurrency = _env_int(SYNC_CONCURRENCY_ENV, DEFAULT_SYNC_CONCURRENCY,
+                               env)
+    owned = client is None
+    if owned:
+        if not token:
+            raise ConfigurationError("GITHUB_TOKEN environment variable not set")
+        client = GitHubClient(token, pool_size=concurrency, env=env)
+    else:
+        client.reset_stats()
+    client.out, client.err = out, err
+    try:
+        syncer = Syncer(board, StateManager(kanban_file, env), client,
+                        batch_size=batch_size, concurrency=concurrency,
+                        cancel=cancel, out=out, err=err, env=env)
+        return syncer.sync(repo, project_number, force=force,
+                           rebuild=rebuild_state)
+    finally:
+        client.out = client.err = None
+        if owned:
+            client.close()
 
 
 def main():
@@ -724,12 +2528,28 @@ def main():
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
     
+    _load_dotenv()
+
     parser = argparse.ArgumentParser(description='Sync markdown kanban to GitHub Projects')
     parser.add_argument('kanban_file', help='Path to the markdown kanban file')
     parser.add_argument('--repo', help='GitHub repo (owner/name)', default=os.environ.get('GITHUB_REPO') or None)
     parser.add_argument('--project', type=int, help='GitHub Project number (optional if only one project linked)',
                         default=os.environ.get('GITHUB_PROJECT_NUMBER') or None)
-    parser.add_argument('--dry-run', action='store_true', help='Parse only, no sync')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Show the sync plan and its cost estimate; no GitHub calls')
+    parser.add_argument('--json', action='store_true',
+                        help='With --dry-run, print the plan as JSON')
+    parser.add_argument('--force', action='store_true',
+                        help='Sync even if the board is unchanged since the last sync')
+    parser.add_argument('--rebuild-state', action='store_true',
+                        help='Re-derive .kanban.json from the GitHub project '
+                             '(lost or corrupt state) before syncing')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help=f'Mutations per GitHub request (default: '
+                             f'{SYNC_BATCH_SIZE_ENV} or {DEFAULT_SYNC_BATCH_SIZE})')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help=f'GitHub requests in flight at once (default: '
+                             f'{SYNC_CONCURRENCY_ENV} or {DEFAULT_SYNC_CONCURRENCY})')
     
     args = parser.parse_args()
     
@@ -737,38 +2557,11 @@ def main():
     if args.project and isinstance(args.project, str):
         args.project = int(args.project) if args.project.isdigit() else None
 
-    # Fail-fast on missing repo BEFORE any work, including --dry-run.
-    if not args.repo:
-        raise ConfigurationError(
-            "--repo or GITHUB_REPO environment variable required"
-        )
-
-    if not os.path.exists(args.kanban_file):
-        raise ConfigurationError(f"File not found: {args.kanban_file}")
-
-    # Initialize components
-    board = LocalBoard(args.kanban_file)
-
-    if args.dry_run:
-        print(f"Parsing {args.kanban_file}...")
-        tasks = board.parse()
-        print("\nParsed tasks:")
-        for column, items in tasks.items():
-            print(f"\n{column}:")
-            for item in items:
-                status = "[x]" if item.get('done') else "[ ]"
-                print(f"  {status} {item['title']}")
-        return
-
-    token = os.environ.get('GITHUB_TOKEN')
-    if not token:
-        raise ConfigurationError("GITHUB_TOKEN environment variable not set")
-    
-    state = StateManager(args.kanban_file)
-    client = GitHubClient(token)
-    syncer = Syncer(board, state, client)
-    
-    syncer.sync(args.repo, args.project)
+    run_sync(args.kanban_file, args.repo, args.project,
+             token=os.environ.get('GITHUB_TOKEN'), dry_run=args.dry_run,
+             force=args.force, batch_size=args.batch_size,
+             concurrency=args.concurrency, json_plan=args.json,
+             rebuild_state=args.rebuild_state)
 
 
 if __name__ == "__main__":
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from typing import Callable
 
 import pytest
 
+from sync_kanban import GitHubAPIError, ProjectNotFoundError
+
 
 # --- registration-capturing stub ----------------------------------
 # kanbanger.tools / resources / prompts register their callables
@@ -97,6 +101,168 @@ def kanban_workspace(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return tmp_path
 
 
+@pytest.fixture
+def write_board(tmp_path: Path) -> Callable:
+    """Write `tmp_path/_kanban.md` and return its path as a str.
+
+    Takes either the raw markdown body or a list of titles, which
+    become open tasks under a single `## TODO` column. Calling it
+    again rewrites the same board, which is how sync tests simulate
+    an edit between runs.
+    """
+    def write(board) -> str:
+        if not isinstance(board, str):
+            board = "## TODO\n" + "".join(f"*   [ ] {t}\n" for t in board)
+        path = tmp_path / "_kanban.md"
+        path.write_text(board, encoding="utf-8")
+        return str(path)
+    return write
+
+
+# --- GitHub stand-in for sync tests --------------------------------
+# Sync tests drive Syncer / run_sync against this in-memory project
+# rather than the network. It implements the slice of GitHubClient the
+# engine calls and records what it was asked to do; the knobs inject
+# the failures individual tests need. scripts/fake_github.py is the
+# HTTP-level equivalent for end-to-end runs of the CLI.
+
+
+class _FakeGitHub:
+    """In-memory GitHub project that records every call.
+
+    Counters and recordings:
+      calls           every metadata, item and mutation request
+      metadata_calls  get_repo_project lookups
+      scanned         items streamed by iter_project_items
+      sent            (kind, values) of every mutation, in order
+      batches         the op kinds of each mutate_batch call
+      log             (kind, item_id) of every mutation that landed
+      lookups         item ids passed to get_draft_issue_ids
+      creates         drafts created (each is appended to `items`)
+
+    Failure knobs:
+      fail_titles     ops with one of these titles fail with "boom"
+      fail_kind       a batch starting with this kind raises
+      status_error    status ops fail with this message
+      reject          creates fail as GitHub validation errors
+      lose_reply      create batches land, then raise (lost reply)
+      missing_project get_repo_project raises ProjectNotFoundError
+      drafts=False    no item resolves to a draft issue
+    """
+
+    def __init__(self, options=("Todo", "InProgress", "Done"), items=(),
+                 drafts=True, fail_titles=(), fail_kind=None,
+                 status_error=None, reject=False, lose_reply=False,
+                 missing_project=False, delay=0.0):
+        self.options = options
+        self.items = [dict(item) for item in items]
+        self.drafts = drafts
+        self.fail_titles = set(fail_titles)
+        self.fail_kind = fail_kind
+        self.status_error = status_error
+        self.reject = reject
+        self.lose_reply = lose_reply
+        self.missing_project = missing_project
+        self.delay = delay
+        self.calls = 0
+        self.metadata_calls = 0
+        self.scanned = 0
+        self.creates = 0
+        self.next_id = 0
+        self.resets = 0
+        self.sent = []
+        self.batches = []
+        self.log = []
+        self.lookups = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.out = None
+        self.err = None
+
+    @property
+    def kinds(self):
+        return [kind for kind, _ in self.sent]
+
+    @property
+    def bodies(self):
+        return [values["body"] for kind, values in self.sent
+                if kind == "create"]
+
+    def reset_stats(self):
+        self.resets += 1
+
+    def latency_summary(self):
+        return {"requests": 0}
+
+    def get_repo_project(self, owner, repo, number):
+        self.calls += 1
+        self.metadata_calls += 1
+        if self.missing_project:
+            raise ProjectNotFoundError(f"Project #{number} not found")
+        return "R", "P", "F", {c: f"opt-{c}" for c in self.options}
+
+    def get_project_items(self, project_id):
+        self.calls += 1
+        return list(self.items)
+
+    def iter_project_items(self, project_id):
+        for item in list(self.items):
+            self.scanned += 1
+            yield item
+
+    def get_draft_issue_ids(self, item_ids):
+        self.lookups.append(list(item_ids))
+        return {i: f"DI-{i}" for i in item_ids} if self.drafts else {}
+
+    def mutate_batch(self, ops):
+        with self.lock:
+            self.calls += 1
+            self.sent.extend(ops)
+            self.batches.append([kind for kind, _ in ops])
+            if ops[0][0] == self.fail_kind:
+                raise GitHubAPIError("GitHub API request timed out")
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            outcomes = [self._apply(kind, values) for kind, values in ops]
+            self.in_flight -= 1
+        if self.lose_reply and ops[0][0] == "create":
+            raise GitHubAPIError("GitHub API request timed out")
+        return outcomes
+
+    def _apply(self, kind, values):
+        if values.get("title") in self.fail_titles:
+            return None, "boom"
+        if kind == "status" and self.status_error:
+            return None, self.status_error
+        if kind == "create":
+            if self.reject:
+                return None, "title is too long"
+            self.creates += 1
+            item_id = self._new_id()
+            self.items.append({"id": item_id, "title": values["title"],
+                               "body": values["body"], "status": None})
+        else:
+            item_id = values.get("itemId") or values.get("draftIssueId")
+        self.log.append((kind, item_id))
+        return item_id, None
+
+    def _new_id(self):
+        taken = {item["id"] for item in self.items}
+        while True:
+            self.next_id += 1
+            if f"I{self.next_id}" not in taken:
+                return f"I{self.next_id}"
+
+
+@pytest.fixture
+def fake_github() -> type:
+    """The `_FakeGitHub` class; call it with the knobs a test needs."""
+    return _FakeGitHub
+
+
 @pytest.fixture
 def registered_tools(kanban_workspace: Path) -> dict[str, Callable]:
     """Import kanbanger.tools and return the registered tool map.
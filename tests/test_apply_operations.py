@@ -0,0 +1,165 @@
+"""Tests for apply_operations (P4 - batched, all-or-nothing board mutations)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+def _read_board(workspace):
+    return (workspace / "_kanban.md").read_text(encoding="utf-8")
+
+
+def test_batch_applies_in_order_with_single_write(
+    registered_tools, kanban_workspace, monkeypatch
+):
+    import kanban_io
+
+    writes = []
+    real_write = kanban_io.atomic_write_text
+    monkeypatch.setattr(
+        kanban_io, "atomic_write_text",
+        lambda path, content: (writes.append(path), real_write(path, content)),
+    )
+
+    result = json.loads(registered_tools["apply_operations"]([
+        {"op": "add_task", "title": "A", "column": "TODO"},
+        {"op": "add_task", "title": "B", "column": "TODO", "description": "d"},
+        {"op": "move_task", "title": "A", "from_column": "TODO",
+         "to_column": "DOING"},
+        {"op": "propose_done", "title": "A"},
+    ]))
+
+    assert result["success"] is True
+    assert result["applied"] == 4
+    assert [r["op"] for r in result["results"]] == [
+        "add_task", "add_task", "move_task", "propose_done",
+    ]
+    assert all(r["success"] for r in result["results"])
+    assert len(writes) == 1
+
+    board = _read_board(kanban_workspace)
+    assert "## TODO\n\n*   [ ] B - d\n\n## DOING" in board
+    assert "## REVIEW\n*   [ ] A" in board
+
+
+def test_batch_matches_sequential_single_op_calls(tmp_path, monkeypatch):
+    """The batch produces the same bytes as the equivalent tool calls."""
+    from tests.conftest import _FIVE_COLUMN_BOARD, _StubMCPServer
+    from kanbanger.tools import register_tools
+
+    stub = _StubMCPServer()
+    register_tools(stub)
+    tools = stub.tools
+    ops = [
+        {"op": "add_task", "title": "A", "column": "DOING"},
+        {"op": "add_task", "title": "B", "column": "DOING"},
+        {"op": "propose_done", "title": "A"},
+        {"op": "reject_review", "title": "A", "reason": "nope"},
+        {"op": "delete_task", "title": "B", "column": "DOING"},
+    ]
+
+    sequential = tmp_path / "seq"
+    batched = tmp_path / "batch"
+    for ws in (sequential, batched):
+        ws.mkdir()
+        (ws / "_kanban.md").write_text(_FIVE_COLUMN_BOARD, encoding="utf-8")
+
+    monkeypatch.setenv("KANBANGER_WORKSPACE", str(sequential))
+    for op in ops:
+        args = {k: v for k, v in op.items() if k != "op"}
+        tools[op["op"]](**args)
+
+    monkeypatch.setenv("KANBANGER_WORKSPACE", str(batched))
+    assert json.loads(tools["apply_operations"](ops))["success"] is True
+
+    assert _read_board(batched) == _read_board(sequential)
+
+
+def test_failing_op_rolls_back_whole_batch(registered_tools, kanban_workspace):
+    before = _read_board(kanban_workspace)
+
+    result = json.loads(registered_tools["apply_operations"]([
+        {"op": "add_task", "title": "A", "column": "DOING"},
+        {"op": "move_task", "title": "A", "from_column": "DOING",
+         "to_column": "DONE"},
+    ]))
+
+    assert result["success"] is False
+    assert result["error_code"] == "gate_violation"
+    assert result["context"]["failed_index"] == 1
+    first, failed = result["context"]["results"]
+    assert first["success"] is True
+    assert failed["success"] is False
+    assert failed["error_code"] == "gate_violation"
+    assert _read_board(kanban_workspace) == before
+
+
+@pytest.mark.parametrize("ops, missing, unexpected", [
+    ([{"op": "add_task"}], ["title"], []),
+    ([{"op": "delete_task", "title": "A", "column": "TODO", "x": 1}], [], ["x"]),
+])
+def test_bad_arguments_rejected_before_io(registered_tools, kanban_workspace,
+                                          ops, missing, unexpected):
+    result = json.loads(registered_tools["apply_operations"](ops))
+
+    assert result["error_code"] == "invalid_operation"
+    assert result["context"]["missing"] == missing
+    assert result["context"]["unexpected"] == unexpected
+
+
+@pytest.mark.parametrize("op, wrong_type", [
+    ({"op": "add_task", "title": 123}, ["title"]),
+    ({"op": "add_task", "title": ["A"]}, ["title"]),
+    ({"op": "add_task", "title": "A", "description": 5}, ["description"]),
+    ({"op": "move_task", "title": "A", "from_column": None,
+      "to_column": "DOING"}, ["from_column"]),
+])
+def test_non_string_arguments_rejected(registered_tools, kanban_workspace,
+                                       op, wrong_type):
+    before = _read_board(kanban_workspace)
+
+    result = json.loads(registered_tools["apply_operations"]([op]))
+
+    assert result["error_code"] == "invalid_operation"
+    assert result["context"]["wrong_type"] == wrong_type
+    assert _read_board(kanban_workspace) == before
+
+
+def test_none_optional_argument_uses_default(registered_tools,
+                                             kanban_workspace):
+    result = json.loads(registered_tools["apply_operations"]([
+        {"op": "add_task", "title": "A", "column": None, "description": None},
+    ]))
+
+    assert result["success"] is True
+    assert "*   [ ] A\n" in _read_board(kanban_workspace)
+
+
+def test_unknown_op_rejected(registered_tools, kanban_workspace):
+    result = json.loads(registered_tools["apply_operations"]([{"op": "nuke"}]))
+
+    assert result["error_code"] == "invalid_operation"
+    assert "add_task" in result["context"]["valid_ops"]
+
+
+def test_empty_batch_is_a_no_op(registered_tools, kanban_workspace):
+    before = _read_board(kanban_workspace)
+
+    result = json.loads(registered_tools["apply_operations"]([]))
+
+    assert result == {"success": True, "applied": 0, "results": []}
+    assert _read_board(kanban_workspace) == before
+
+
+def test_python_api_takes_explicit_workspace(kanban_workspace, monkeypatch):
+    from kanbanger.tools import apply_operations
+
+    monkeypatch.delenv("KANBANGER_WORKSPACE")
+    result = json.loads(apply_operations(
+        [{"op": "add_task", "title": "A"}], workspace=str(kanban_workspace),
+    ))
+
+    assert result["success"] is True
+    assert "*   [ ] A" in _read_board(kanban_workspace)
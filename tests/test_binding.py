@@ -559,6 +559,64 @@ def test_add_task_from_nested_cwd_writes_ancestor_board(
     assert not (nested / "_kanban.md").exists()
 
 
+def test_current_binding_is_memoized_until_board_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, no_workspace_env
+):
+    """P10: the walk runs once; a replaced board keeps the workspace and
+    re-reads the key; a removed board forces a full re-resolve."""
+    from kanbanger import binding as binding_mod
+
+    proj = tmp_path / "proj"
+    nested = proj / "a" / "b"
+    nested.mkdir(parents=True)
+    first_key = _write_keyed_board(proj)
+    monkeypatch.chdir(nested)
+    binding_mod.invalidate_binding_cache()
+
+    walks = []
+    real_find = binding_mod.find_board_dir
+    monkeypatch.setattr(binding_mod, "find_board_dir",
+                        lambda start: walks.append(start) or real_find(start))
+
+    first = binding_mod.current_binding()
+    assert binding_mod.current_binding() is first
+    assert first.board_key == first_key
+    assert len(walks) == 1
+
+    # Atomic replace: new inode, same place -> key re-read, no new walk.
+    new_key = mint_board_key()
+    tmp = proj / "_kanban.md.new"
+    tmp.write_text(insert_board_key(FIVE_COL, new_key), encoding="utf-8")
+    tmp.replace(proj / "_kanban.md")
+    assert binding_mod.current_binding().board_key == new_key
+    assert len(walks) == 1
+
+    # Board gone -> full re-resolve (falls back to the start dir).
+    (proj / "_kanban.md").unlink()
+    assert binding_mod.current_binding().workspace == str(nested.resolve())
+    assert len(walks) == 2
+
+
+def test_current_binding_follows_env_pin_and_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from kanbanger.binding import current_binding
+
+    one, two = tmp_path / "one", tmp_path / "two"
+    for d in (one, two):
+        d.mkdir()
+        _write_keyed_board(d)
+
+    monkeypatch.setenv("KANBANGER_WORKSPACE", str(one))
+    assert current_binding().workspace == str(one.resolve())
+    monkeypatch.setenv("KANBANGER_WORKSPACE", str(two))
+    assert current_binding().workspace == str(two.resolve())
+
+    monkeypatch.delenv("KANBANGER_WORKSPACE")
+    monkeypatch.chdir(one)
+    assert current_binding().workspace == str(one.resolve())
+
+
 # ---------------------------------------------------------------------------
 # 3. Sync-state pairing: the copied-board guard
 # ---------------------------------------------------------------------------
@@ -0,0 +1,214 @@
+"""Tests for kanban_io.load_board (P1 cache) and the Board model (P2)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import kanban_io
+
+
+def test_repeated_load_is_served_from_cache(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+
+    first = kanban_io.load_board(board)
+    second = kanban_io.load_board(board)
+
+    assert first is second
+    assert first.columns == ["BACKLOG", "TODO", "DOING", "REVIEW", "DONE"]
+    assert "\n".join(first.lines) == first.text
+
+
+def test_external_edit_is_detected_via_stat_key(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+    before = kanban_io.load_board(board)
+
+    board.write_text(before.text + "\n## ICEBOX\n", encoding="utf-8")
+    after = kanban_io.load_board(board)
+
+    assert after is not before
+    assert "ICEBOX" in after.columns
+
+
+def test_same_size_edit_with_new_mtime_is_detected(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+    before = kanban_io.load_board(board)
+
+    board.write_text(before.text.replace("TODO", "TADA"), encoding="utf-8")
+    st = os.stat(board)
+    os.utime(board, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    after = kanban_io.load_board(board)
+
+    assert "TADA" in after.columns
+
+
+def test_atomic_write_text_invalidates_entry(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+    before = kanban_io.load_board(board)
+
+    kanban_io.atomic_write_text(str(board), before.text + "\n## ICEBOX\n")
+    after = kanban_io.load_board(board)
+
+    assert "ICEBOX" in after.columns
+
+
+def test_discover_columns_reads_through_cache(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+    snapshot = kanban_io.load_board(board)
+
+    assert kanban_io.discover_columns(str(kanban_workspace)) == snapshot.columns
+
+
+def test_missing_board_raises_and_drops_entry(kanban_workspace):
+    board = kanban_workspace / "_kanban.md"
+    kanban_io.load_board(board)
+    board.unlink()
+
+    try:
+        kanban_io.load_board(board)
+    except FileNotFoundError:
+        pass
+    else:
+        raise AssertionError("expected FileNotFoundError")
+    assert kanban_io.discover_columns(str(kanban_workspace)) == []
+
+
+def test_cached_board_is_frozen(kanban_workspace):
+    board = kanban_io.load_board(kanban_workspace / "_kanban.md")
+
+    try:
+        board.insert_task("TODO", "*   [ ] nope")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("cached Board must reject edits")
+    board.copy().insert_task("TODO", "*   [ ] fine")
+
+
+# --- Board model (P2) ---------------------------------------------------
+
+
+_MESSY = (
+    "# Board\r\n"
+    "* not a task (above first header)\n"
+    "## TODO\n"
+    "*   [ ] A - first\n"
+    "  * [x] B\n"
+    "- dash note\n"
+    "\n"
+    "## DOING\n"
+    "*   [ ] C\n"
+    "## TODO\n"
+    "*   [ ] D\n"
+    "   "
+)
+
+
+def test_parse_serialize_round_trip_is_byte_identical():
+    board = kanban_io.Board.parse(_MESSY)
+
+    assert board.serialize() == _MESSY
+    assert board.copy().serialize() == _MESSY
+
+
+def test_parse_records_columns_sections_and_tasks():
+    board = kanban_io.Board.parse(_MESSY)
+
+    assert board.columns == ["TODO", "DOING"]
+    assert [s.name for s in board.sections] == ["TODO", "DOING", "TODO"]
+    assert [(t.column, t.title, t.description) for t in board.tasks] == [
+        ("TODO", "A", "first"),
+        ("TODO", "B", None),
+        ("DOING", "C", None),
+        ("TODO", "D", None),
+    ]
+    for record in board.tasks:
+        assert record.title in board.lines[record.line]
+    # section_tasks scopes to the FIRST section of that name.
+    assert [t.title for t in board.section_tasks("TODO")] == ["A", "B"]
+
+
+def _assert_consistent(board):
+    """Every span / record / title-index entry agrees with a fresh parse."""
+    fresh = kanban_io.Board(board.lines)
+    assert board.columns == fresh.columns
+    assert board.sections == fresh.sections
+    assert board.tasks == fresh.tasks
+    assert board._by_title == fresh._by_title
+
+
+def test_edits_keep_spans_and_records_in_step():
+    board = kanban_io.Board.parse(_MESSY)
+
+    board.insert_task("DOING", "*   [ ] E")
+    _assert_consistent(board)
+    board.append_task("TODO", "*   [ ] F")
+    _assert_consistent(board)
+    board.remove_task(board.find("C"))
+    _assert_consistent(board)
+    board.insert_line(0, "preamble")
+    _assert_consistent(board)
+    board.pop_line(len(board.lines) - 1)
+    _assert_consistent(board)
+
+    assert [t.title for t in board.section_tasks("TODO")] == ["A", "B", "F"]
+    assert [t.title for t in board.section_tasks("DOING")] == ["E"]
+
+
+def test_insert_line_refuses_headers():
+    board = kanban_io.Board.parse(_MESSY)
+
+    try:
+        board.insert_line(1, "## NEW")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+# --- title index (P3) ---------------------------------------------------
+
+
+def test_title_index_tracks_duplicates_across_edits():
+    board = kanban_io.Board.parse(_MESSY)
+
+    board.insert_task("DOING", "*   [ ] D")
+    _assert_consistent(board)
+    # Document order: the DOING copy now precedes the second TODO section.
+    assert board.find("D").column == "DOING"
+    assert board.find_in_column("TODO", "D") is None  # first TODO section only
+
+    board.remove_task(board.find("D"))
+    _assert_consistent(board)
+    assert board.find("D").column == "TODO"
+    assert board.find("missing") is None
+
+
+def test_title_index_survives_copy_independently():
+    board = kanban_io.Board.parse(_MESSY)
+    clone = board.copy()
+
+    clone.remove_task(clone.find("A"))
+
+    assert clone.find("A") is None
+    assert board.find("A").line == 3
+    _assert_consistent(board)
+    _assert_consistent(clone)
+
+
+def test_copy_carries_the_index_without_rebuilding(monkeypatch):
+    board = kanban_io.Board.parse(_MESSY)
+    monkeypatch.setattr(kanban_io.Board, "_build_index",
+                        lambda self: pytest.fail("index rebuilt"))
+
+    clone = board.copy()
+    clone.insert_task("TODO", "*   [ ] Z")
+    clone.remove_task(clone.find("A"))
+
+    assert clone.find("Z").column == "TODO" and clone.find("A") is None
+    assert board.find("A") is not None and board.find("Z") is None
+    assert clone.find_in_column("TODO", "Z") is clone.find("Z")
+    monkeypatch.undo()
+    _assert_consistent(clone)
+    _assert_consistent(board)
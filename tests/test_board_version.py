@@ -0,0 +1,76 @@
+"""Tests for board version tokens and if_version mutations (P9)."""
+
+from __future__ import annotations
+
+import json
+
+import kanban_io
+
+
+def _listed(tools):
+    return json.loads(tools["list_tasks"](include_version=True))
+
+
+def test_version_tracks_content():
+    board = kanban_io.Board.parse("## TODO\n*   [ ] A\n")
+    clone = board.copy()
+    assert clone.version == board.version
+
+    clone.insert_task("TODO", "*   [ ] B")
+    assert clone.version != board.version
+    clone.remove_task(clone.find("B"))
+    assert clone.version == board.version
+
+
+def test_list_tasks_and_stats_report_same_version(registered_tools,
+                                                  kanban_workspace):
+    from tests.conftest import _StubMCPServer
+    from kanbanger.resources import register_resources
+
+    stub = _StubMCPServer()
+    register_resources(stub)
+    listed = _listed(registered_tools)
+    stats = json.loads(stub.resources["kanban_statistics"]())
+
+    assert listed["version"] == stats["version"]
+    assert set(listed["tasks"]) == {"BACKLOG", "TODO", "DOING", "REVIEW", "DONE"}
+    filtered = json.loads(registered_tools["list_tasks"](
+        "TODO", include_version=True,
+    ))
+    assert filtered == {"version": listed["version"], "tasks": {"TODO": []}}
+
+
+def test_matching_version_applies(registered_tools, kanban_workspace):
+    version = _listed(registered_tools)["version"]
+
+    result = registered_tools["add_task"](title="A", if_version=version)
+
+    assert result.startswith("Successfully")
+    assert _listed(registered_tools)["version"] != version
+
+
+def test_stale_version_conflicts_and_writes_nothing(registered_tools,
+                                                    kanban_workspace):
+    stale = _listed(registered_tools)["version"]
+    registered_tools["add_task"](title="A")
+    before = (kanban_workspace / "_kanban.md").read_text(encoding="utf-8")
+
+    result = json.loads(registered_tools["move_task"](
+        "A", "TODO", "DOING", if_version=stale,
+    ))
+
+    assert result["error_code"] == "version_conflict"
+    assert result["context"]["expected_version"] == stale
+    assert result["context"]["current_version"] == _listed(
+        registered_tools)["version"]
+    assert (kanban_workspace / "_kanban.md").read_text(encoding="utf-8") == before
+
+
+def test_apply_operations_honours_if_version(registered_tools,
+                                             kanban_workspace):
+    result = json.loads(registered_tools["apply_operations"](
+        [{"op": "add_task", "title": "A"}], if_version="0" * 16,
+    ))
+
+    assert result["error_code"] == "version_conflict"
+    assert _listed(registered_tools)["tasks"]["TODO"] == []
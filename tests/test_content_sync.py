@@ -0,0 +1,80 @@
+"""Tests for syncing task descriptions as draft bodies, by content hash (P25)."""
+
+from __future__ import annotations
+
+import json
+
+from sync_kanban import LocalBoard, StateManager, Syncer
+
+
+def _sync(path, client, force=False):
+    return Syncer(LocalBoard(path), StateManager(path), client).sync(
+        "o/r", force=force)
+
+
+def _tasks(tmp_path):
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    return state["tasks"]
+
+
+def test_description_is_the_draft_body(tmp_path, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] Ship it - after review\n")
+    client = fake_github()
+
+    _sync(path, client)
+
+    kind, values = client.sent[0]
+    assert (kind, values["title"]) == ("create", "Ship it")
+    assert values["body"].startswith("after review\n\n<!-- kanbanger:op-id:")
+    entry = _tasks(tmp_path)["Ship it"]
+    assert entry["title_hash"] and entry["body_hash"]
+
+
+def test_description_edit_costs_one_mutation(write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] Ship it - after review\n")
+    client = fake_github()
+    _sync(path, client)
+
+    write_board("## DOING\n*   [ ] Ship it - after QA\n")
+    client.sent.clear()
+    result = _sync(path, client)
+
+    assert (result.edited, result.created, result.archived) == (1, 0, 0)
+    assert client.kinds == ["title", "status"]
+    assert client.sent[0][1] == {"draftIssueId": "DI-I1", "title": "Ship it",
+                                 "body": "after QA"}
+
+    client.sent.clear()
+    assert _sync(path, client, force=True).unchanged == 1
+    assert client.sent == []
+
+
+def test_legacy_state_is_migrated_in_place(tmp_path, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] Ship it - soon\n*   [ ] Plain\n")
+    (tmp_path / ".kanban.json").write_text(json.dumps({"tasks": {
+        "Ship it - soon": {"item_id": "I1", "status": "Todo"},
+        "Plain": {"item_id": "I2", "status": "Todo"},
+    }}), encoding="utf-8")
+    client = fake_github()
+
+    result = _sync(path, client)
+
+    assert (result.edited, result.created, result.archived) == (1, 0, 0)
+    assert client.sent == [("title", {"draftIssueId": "DI-I1",
+                                      "title": "Ship it", "body": "soon"})]
+    tasks = _tasks(tmp_path)
+    assert set(tasks) == {"Ship it", "Plain"}
+    assert tasks["Ship it"]["item_id"] == "I1"
+
+
+def test_plan_reports_edits(tmp_path, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] Ship it - soon\n")
+    (tmp_path / ".kanban.json").write_text(json.dumps({"tasks": {
+        "Ship it": {"item_id": "I1", "status": "Todo", "draft_id": "DI-1"},
+    }}), encoding="utf-8")
+
+    plan = Syncer(LocalBoard(path), StateManager(path),
+                  fake_github()).plan("o/r")
+
+    assert [op.kind for op in plan.operations] == ["edit"]
+    assert plan.estimate()["mutations"] == 1
@@ -0,0 +1,117 @@
+"""Tests for atomic_write_text durability modes (P6)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import kanban_io
+
+
+@pytest.fixture
+def syncs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync"))
+    monkeypatch.setattr(os, "fdatasync", lambda fd: calls.append("fdatasync"),
+                        raising=False)
+    monkeypatch.setattr(kanban_io, "_fsync_dir",
+                        lambda path: calls.append("dir"))
+    return calls
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("strict", ["fsync", "dir"]),
+    ("default", ["fsync"]),
+    ("fdatasync", ["fdatasync"]),
+    ("relaxed", []),
+])
+def test_modes_issue_expected_syncs(tmp_path, syncs, mode, expected):
+    path = tmp_path / "board.md"
+
+    kanban_io.atomic_write_text(str(path), "hello", durability=mode)
+
+    assert syncs == expected
+    assert path.read_text(encoding="utf-8") == "hello"
+
+
+def test_resolution_order(tmp_path, monkeypatch):
+    path = str(tmp_path / "board.md")
+    monkeypatch.setenv("KANBANGER_DURABILITY", "relaxed")
+    assert kanban_io.resolve_durability(path) == "relaxed"
+
+    kanban_io.set_workspace_durability(str(tmp_path), "strict")
+    try:
+        assert kanban_io.resolve_durability(path) == "strict"
+        assert kanban_io.resolve_durability(path, "fdatasync") == "fdatasync"
+    finally:
+        kanban_io.set_workspace_durability(str(tmp_path), None)
+
+    monkeypatch.setenv("KANBANGER_DURABILITY", "bogus")
+    assert kanban_io.resolve_durability(path) == "default"
+
+
+def test_unknown_explicit_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        kanban_io.atomic_write_text(str(tmp_path / "x"), "", durability="yolo")
+    with pytest.raises(ValueError):
+        kanban_io.set_workspace_durability(str(tmp_path), "yolo")
+    assert os.listdir(tmp_path) == []
+
+
+def test_json_writer_passes_mode_through(tmp_path, syncs):
+    kanban_io.atomic_write_json(str(tmp_path / "s.json"), {"a": 1},
+                                durability="relaxed")
+
+    assert syncs == []
+
+
+def test_workspace_env_selects_the_mode(registered_tools, kanban_workspace,
+                                        syncs, monkeypatch):
+    monkeypatch.setenv("KANBANGER_DURABILITY", "relaxed")
+    env_file = kanban_workspace / ".env"
+    env_file.write_text("KANBANGER_DURABILITY=strict\n", encoding="utf-8")
+    try:
+        registered_tools["add_task"]("A")
+        assert syncs == ["fsync", "dir"]
+
+        syncs.clear()
+        env_file.write_text("# durability unset\n", encoding="utf-8")
+        registered_tools["add_task"]("B")
+        assert syncs == []  # back to the process env: relaxed
+    finally:
+        kanban_io.set_workspace_durability(str(kanban_workspace), None)
+
+
+def test_env_is_checked_on_binding_revalidation_only(registered_tools,
+                                                      kanban_workspace,
+                                                      monkeypatch):
+    from kanbanger import tools
+
+    workspace = str(kanban_workspace)
+    (kanban_workspace / ".env").write_text("KANBANGER_DURABILITY=strict\n",
+                                           encoding="utf-8")
+    seen_at_pin = []
+    real_pin = kanban_io.set_workspace_durability
+
+    def pin(ws, mode):
+        seen_at_pin.append(tools._DURABILITY_ENV_SEEN.get(ws))
+        real_pin(ws, mode)
+
+    monkeypatch.setattr(tools, "set_workspace_durability", pin)
+    try:
+        tools.get_workspace()
+        assert kanban_io.resolve_durability(workspace + "/x") == "strict"
+        assert seen_at_pin == [None]  # recorded only after the pin
+
+        # Same memoized binding: no stat, so the edit is not seen yet.
+        (kanban_workspace / ".env").write_text(
+            "KANBANGER_DURABILITY=relaxed\n", encoding="utf-8")
+        tools.get_workspace()
+        assert kanban_io.resolve_durability(workspace + "/x") == "strict"
+
+        registered_tools["add_task"]("A")  # replaces the board
+        tools.get_workspace()
+        assert kanban_io.resolve_durability(workspace + "/x") == "relaxed"
+    finally:
+        kanban_io.set_workspace_durability(workspace, None)
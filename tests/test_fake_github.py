@@ -0,0 +1,139 @@
+"""End-to-end sync through the real GitHubClient against scripts/fake_github.py.
+
+fake_github.py lives in scripts/, outside the importable package, so it's
+loaded by file path via importlib rather than `import`.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from sync_kanban import GitHubClient, LocalBoard, RateLimiter, StateManager, Syncer
+
+FAKE_GITHUB_PATH = Path(__file__).resolve().parent.parent / "scripts" / "fake_github.py"
+
+
+@pytest.fixture(scope="module")
+def fake_github():
+    spec = importlib.util.spec_from_file_location("fake_github", FAKE_GITHUB_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def server(fake_github):
+    server = fake_github.start_fake_github(seed=0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server):
+    with GitHubClient("tok", api_url=server.url,
+                      limiter=RateLimiter(rate=1000, burst=1000)) as client:
+        yield client
+
+
+def _board(tmp_path, column, titles):
+    path = tmp_path / "_kanban.md"
+    path.write_text(f"## {column}\n" + "".join(f"*   [ ] {t}\n" for t in titles),
+                    encoding="utf-8")
+    return str(path)
+
+
+def _sync(path, client):
+    return Syncer(LocalBoard(path), StateManager(path), client,
+                  batch_size=10, concurrency=2).sync("o/r", 1)
+
+
+def test_sync_round_trip(tmp_path, server, client):
+    path = _board(tmp_path, "TODO", [f"T{n}" for n in range(25)])
+    assert _sync(path, client).created == 25
+
+    _board(tmp_path, "DOING", [f"T{n}" for n in range(20)])
+    result = _sync(path, client)
+
+    assert (result.updated, result.archived) == (20, 5)
+    items = {i["title"]: i["status"] for i in client.iter_project_items("PVT_fake")}
+    assert items == {f"T{n}": "InProgress" for n in range(20)}
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert len(state["tasks"]) == 20
+
+
+def test_items_are_paginated(server, client):
+    for n in range(250):
+        server.project.add_item(f"T{n}")
+    server.reset_stats()
+
+    titles = [item["title"] for item in client.iter_project_items("PVT_fake")]
+
+    assert titles == [f"T{n}" for n in range(250)]
+    assert server.stats()["requests"] == 3
+
+
+def test_alias_errors_stay_per_field(server, client):
+    outcomes = client.mutate_batch([
+        ("create", {"projectId": "PVT_fake", "title": "A"}),
+        ("archive", {"projectId": "PVT_fake", "itemId": "PVTI_missing"}),
+    ])
+
+    assert outcomes[0] == ("PVTI_1", None)
+    assert outcomes[1][0] is None and "Could not resolve" in outcomes[1][1]
+
+
+def test_throttled_requests_are_retried(server, client):
+    server.throttle_rate = 0.5
+    server.random = random.Random(7)  # throttles the first two attempts
+
+    _, project_id, _, options = client.get_repo_project("o", "r", 1)
+
+    assert project_id == "PVT_fake" and "Done" in options
+    assert server.stats()["requests"] == 3
+
+
+def test_marked_task_is_renamed_in_place(tmp_path, server, client):
+    marker = " <!-- kanbanger:task-id: a1b2c3d4e5f6 -->"
+    path = _board(tmp_path, "TODO", ["Old" + marker])
+    _sync(path, client)
+
+    _board(tmp_path, "TODO", ["New" + marker])
+    result = _sync(path, client)
+
+    assert (result.renamed, result.created, result.archived) == (1, 0, 0)
+    assert [i["title"] for i in client.iter_project_items("PVT_fake")] == ["New"]
+
+
+def test_lost_state_is_rebuilt_in_a_few_reads(tmp_path, server, client):
+    titles = [f"T{n}" for n in range(250)]
+    path = _board(tmp_path, "TODO", titles)
+    _sync(path, client)
+    (tmp_path / ".kanban.json").unlink()
+    server.reset_stats()
+
+    result = Syncer(LocalBoard(path), StateManager(path), client,
+                    batch_size=10, concurrency=2).sync("o/r", 1, rebuild=True)
+
+    assert (result.created, result.unchanged) == (0, 250)
+    assert server.stats()["mutations"] == 0
+    assert server.stats()["requests"] == 4  # project metadata + 3 item pages
+
+
+def test_description_edit_updates_the_draft_body(tmp_path, server, client):
+    path = _board(tmp_path, "TODO", ["Ship it - after review"])
+    _sync(path, client)
+
+    _board(tmp_path, "TODO", ["Ship it - after QA"])
+    server.reset_stats()
+    result = _sync(path, client)
+
+    assert (result.edited, result.created) == (1, 0)
+    assert server.stats()["mutations"] == 1
+    [item] = client.iter_project_items("PVT_fake")
+    assert (item["title"], item["body"]) == ("Ship it", "after QA")
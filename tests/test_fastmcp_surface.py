@@ -7,7 +7,7 @@ is the complementary proof that `create_server()` actually wires the full
 surface onto a real FastMCP instance — the part the stub cannot verify.
 
 Acceptance gate for the port: a real FastMCP server exposing exactly
-11 tools, 4 resources, and 5 prompts, by name. If the native SDK's
+12 tools, 5 resources, and 5 prompts, by name. If the native SDK's
 decorator API ever drifts, this fails loudly instead of silently
 dropping a capability.
 """
@@ -31,6 +31,7 @@ EXPECTED_TOOLS = {
     "propose_done",
     "approve_done",
     "reject_review",
+    "apply_operations",
     "setup_project",
     "doctor",
 }
@@ -40,6 +41,7 @@ EXPECTED_RESOURCES = {
     "kanban://stats",
     "kanban://sync-status",
     "kanban://config",
+    "kanban://lock-stats",
 }
 
 EXPECTED_PROMPTS = {
@@ -0,0 +1,125 @@
+"""Tests for sync_kanban.GitHubClient's pooled session (P11).
+
+Runs against a throwaway local HTTP/1.1 server standing in for the
+GraphQL endpoint; nothing touches the network.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sync_kanban import GitHubAPIError, GitHubClient, RateLimiter
+
+
+def _open_limiter():
+    """A private, unthrottled limiter.
+
+    Without one the client takes the process-wide limiter for "tok",
+    whose budget file in the temp dir is shared with other tests and
+    with real runs on this machine.
+    """
+    return RateLimiter(rate=1000, burst=1000, reserve=0)
+
+
+class _GraphQLStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    delay = 0.0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.peers.add(self.client_address)
+        self.server.auth.append(self.headers.get("Authorization"))
+        time.sleep(self.delay)
+        payload = json.dumps({"data": {"echo": body["variables"]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    def start(delay=0.0):
+        handler = type("Handler", (_GraphQLStub,), {"delay": delay})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.peers, server.auth = set(), []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}/graphql"
+
+    servers: list = []
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_reuse_one_connection(stub_server):
+    server, url = stub_server()
+
+    with GitHubClient("tok", api_url=url,
+                      limiter=_open_limiter()) as client:
+        for n in range(5):
+            assert client._query("q", {"n": n}) == {"data": {"echo": {"n": n}}}
+
+    assert len(server.peers) == 1
+    assert server.auth == ["Bearer tok"] * 5
+    summary = client.latency_summary()
+    assert summary["requests"] == 5
+    assert summary["max_ms"] >= summary["p50_ms"] > 0
+
+
+def test_read_timeout_raises_typed_error(stub_server, monkeypatch):
+    _, url = stub_server(delay=0.5)
+    monkeypatch.setenv("KANBANGER_HTTP_READ_TIMEOUT_SEC", "0.1")
+
+    with GitHubClient("tok", api_url=url,
+                      limiter=_open_limiter()) as client:
+        assert client.timeout[1] == 0.1
+        with pytest.raises(GitHubAPIError, match="timed out"):
+            client._query("q", {})
+    assert len(client.latencies) == 1
+
+
+def test_unreachable_endpoint_raises_typed_error():
+    with GitHubClient("tok", api_url="http://127.0.0.1:9/graphql",
+                      connect_timeout=0.5, limiter=_open_limiter()) as client:
+        with pytest.raises(GitHubAPIError, match="reach"):
+            client._query("q", {})
+
+
+def test_empty_summary():
+    client = GitHubClient("tok", limiter=_open_limiter())
+    assert client.latency_summary() == {"requests": 0}
+
+
+def test_iter_project_items_fetches_pages_on_demand(monkeypatch):
+    client = GitHubClient("tok", limiter=_open_limiter())
+    cursors = []
+
+    def page(query, variables):
+        cursors.append(variables["cursor"])
+        n = len(cursors)
+        return {"data": {"node": {"items": {
+            "pageInfo": {"hasNextPage": n < 3, "endCursor": f"c{n}"},
+            "nodes": [{"id": f"I{n}", "content": {"title": f"T{n}"},
+                       "fieldValues": {"nodes": []}}],
+        }}}}
+
+    monkeypatch.setattr(client, "_query", page)
+    items = client.iter_project_items("P")
+
+    assert next(items)["title"] == "T1"
+    assert cursors == [None]
+    assert [item["id"] for item in items] == ["I2", "I3"]
+    assert cursors == [None, "c1", "c2"]
+    client.close()
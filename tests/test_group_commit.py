@@ -0,0 +1,89 @@
+"""Tests for kanban_io.GroupCommitter (P5 - coalesced concurrent writes)."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import kanban_io
+
+
+def test_concurrent_mutations_share_writes(kanban_workspace):
+    committer = kanban_io.GroupCommitter(str(kanban_workspace), window_sec=0.05)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def worker(n):
+        def apply(board):
+            board.insert_task("TODO", f"*   [ ] T{n}")
+            return n
+        barrier.wait()
+        results[n] = committer.submit(apply)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {n: n for n in range(8)}
+    assert 1 <= committer.commits < 8
+    board = kanban_io.load_board(kanban_workspace / "_kanban.md")
+    assert sorted(t.title for t in board.section_tasks("TODO")) == [
+        f"T{n}" for n in range(8)
+    ]
+
+
+def test_failure_result_writes_nothing(kanban_workspace):
+    committer = kanban_io.GroupCommitter(str(kanban_workspace))
+    before = (kanban_workspace / "_kanban.md").read_text(encoding="utf-8")
+
+    assert committer.submit(lambda board: "error") == "error"
+    assert committer.commits == 0
+    assert (kanban_workspace / "_kanban.md").read_text(encoding="utf-8") == before
+
+
+def test_raising_mutation_does_not_leak_into_group(kanban_workspace):
+    committer = kanban_io.GroupCommitter(str(kanban_workspace))
+
+    def good(board):
+        board.insert_task("TODO", "*   [ ] kept")
+
+    def bad(board):
+        board.insert_task("TODO", "*   [ ] half")
+        raise ValueError("boom")
+
+    # Drive one group by hand: both mutations land in the same batch.
+    from concurrent.futures import Future
+    futures = [Future(), Future()]
+    committer._commit([(good, futures[0]), (bad, futures[1])])
+
+    assert futures[0].result() is None
+    assert isinstance(futures[1].exception(), ValueError)
+    text = (kanban_workspace / "_kanban.md").read_text(encoding="utf-8")
+    assert "kept" in text and "half" not in text
+
+
+def test_missing_board_fails_every_caller(tmp_path):
+    committer = kanban_io.GroupCommitter(str(tmp_path))
+
+    try:
+        committer.submit(lambda board: None)
+    except kanban_io.BoardReadError:
+        pass
+    else:
+        raise AssertionError("expected BoardReadError")
+
+
+def test_tools_route_through_workspace_committer(registered_tools,
+                                                 kanban_workspace):
+    committer = kanban_io.group_committer(str(kanban_workspace))
+    before = committer.commits
+
+    registered_tools["add_task"](title="A", column="TODO")
+    json.loads(registered_tools["apply_operations"]([
+        {"op": "add_task", "title": "B"},
+    ]))
+
+    assert committer is kanban_io.group_committer(str(kanban_workspace))
+    assert committer.commits == before + 2
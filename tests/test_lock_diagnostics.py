@@ -0,0 +1,120 @@
+"""Tests for lock timeouts, holder records and lock stats (P8)."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+
+import pytest
+
+import kanban_io
+
+posix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="holder records are POSIX-only"
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats():
+    kanban_io.reset_lock_stats()
+    yield
+    kanban_io.reset_lock_stats()
+
+
+def _hold_lock(workspace, **kwargs):
+    """Hold kanban_lock on a thread until the returned event is set."""
+    acquired, release = threading.Event(), threading.Event()
+
+    def holder():
+        with kanban_io.kanban_lock(workspace, **kwargs):
+            acquired.set()
+            release.wait(5)
+
+    t = threading.Thread(target=holder, daemon=True)
+    t.start()
+    assert acquired.wait(1)
+    return release, t
+
+
+@posix_only
+def test_holder_record_written_and_cleared(tmp_path):
+    release, t = _hold_lock(str(tmp_path), operation="unit_test")
+
+    holder = kanban_io.lock_holder(str(tmp_path))
+    release.set()
+    t.join()
+
+    assert holder["operation"] == "unit_test"
+    assert isinstance(holder["pid"], int)
+    assert holder["acquired_at"]
+    assert kanban_io.lock_holder(str(tmp_path)) is None
+
+
+@posix_only
+def test_timeout_raises_with_holder(tmp_path):
+    release, t = _hold_lock(str(tmp_path), operation="slow_sync")
+    try:
+        with pytest.raises(kanban_io.LockTimeoutError) as info:
+            with kanban_io.kanban_lock(str(tmp_path), timeout=0.05):
+                pass
+    finally:
+        release.set()
+        t.join()
+
+    assert info.value.holder["operation"] == "slow_sync"
+    assert "slow_sync" in str(info.value)
+    assert kanban_io.lock_stats()["exclusive"]["timeouts"] == 1
+
+
+def test_env_timeout_applies(tmp_path, monkeypatch):
+    monkeypatch.setenv("KANBANGER_LOCK_TIMEOUT_SEC", "0.05")
+    release, t = _hold_lock(str(tmp_path))
+    try:
+        with pytest.raises(kanban_io.LockTimeoutError):
+            with kanban_io.kanban_lock(str(tmp_path)):
+                pass
+    finally:
+        release.set()
+        t.join()
+
+
+def test_stats_record_wait_and_hold(tmp_path):
+    with kanban_io.kanban_lock(str(tmp_path)):
+        pass
+    with kanban_io.kanban_lock(str(tmp_path), shared=True):
+        pass
+
+    stats = kanban_io.lock_stats()
+    assert stats["exclusive"]["wait"]["count"] == 1
+    assert stats["exclusive"]["hold"]["count"] == 1
+    assert sum(stats["shared"]["hold"]["buckets"].values()) == 1
+
+
+def test_tool_maps_timeout_to_error_code(registered_tools, kanban_workspace,
+                                         monkeypatch):
+    release, t = _hold_lock(str(kanban_workspace), operation="other")
+    monkeypatch.setenv("KANBANGER_LOCK_TIMEOUT_SEC", "0.05")
+    try:
+        result = json.loads(registered_tools["add_task"](title="A"))
+    finally:
+        release.set()
+        t.join()
+
+    assert result["error_code"] == "lock_timeout"
+    assert result["context"]["timeout_sec"] == 0.05
+
+
+def test_lock_stats_resource(kanban_workspace):
+    from tests.conftest import _StubMCPServer
+    from kanbanger.resources import register_resources
+
+    stub = _StubMCPServer()
+    register_resources(stub)
+    with kanban_io.kanban_lock(str(kanban_workspace)):
+        pass
+
+    payload = json.loads(stub.resources["kanban_lock_statistics"]())
+
+    assert payload["holder"] is None
+    assert payload["modes"]["exclusive"]["wait"]["count"] == 1
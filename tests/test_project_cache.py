@@ -0,0 +1,102 @@
+"""Tests for the cached project metadata in .kanban.json (P16)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from sync_kanban import GitHubAPIError, LocalBoard, StateManager, Syncer
+
+
+def _sync(path, client, **kwargs):
+    Syncer(LocalBoard(path), StateManager(path), client).sync("o/r", **kwargs)
+
+
+def _state(tmp_path):
+    return json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+
+
+def test_metadata_is_cached_across_syncs(tmp_path, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    client = fake_github()
+    _sync(path, client)
+    write_board("## DOING\n*   [ ] A\n")
+    _sync(path, client)
+
+    assert client.metadata_calls == 1
+    cache = _state(tmp_path)["project_cache"]
+    assert cache["status_field_id"] == "F"
+    assert cache["status_options"]["InProgress"] == "opt-InProgress"
+
+
+def test_expired_cache_is_refetched(tmp_path, monkeypatch, write_board,
+                                    fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    client = fake_github()
+    _sync(path, client)
+    state = _state(tmp_path)
+    state["project_cache"]["fetched_at"] -= 120
+    (tmp_path / ".kanban.json").write_text(json.dumps(state), encoding="utf-8")
+    monkeypatch.setenv("KANBANGER_PROJECT_CACHE_TTL_SEC", "60")
+    write_board("## DOING\n*   [ ] A\n")
+
+    _sync(path, client)
+
+    assert client.metadata_calls == 2
+
+
+def test_other_target_or_force_refetches(write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    client = fake_github()
+    _sync(path, client)
+
+    Syncer(LocalBoard(path), StateManager(path), client).sync("o/other")
+    assert client.metadata_calls == 2
+    _sync(path, client, force=True)
+    assert client.metadata_calls == 3
+
+
+def test_column_missing_from_cached_options_refetches(tmp_path, write_board,
+                                                      fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    _sync(path, fake_github())
+    write_board("## REVIEW\n*   [ ] A\n")
+
+    client = fake_github(options=("Todo", "Review"))
+    _sync(path, client)
+
+    assert client.metadata_calls == 1
+    assert _state(tmp_path)["tasks"]["A"]["status"] == "Review"
+
+
+@pytest.mark.parametrize("status_error", [
+    "The single select option Id does not belong to the field",
+    "Could not resolve to a node with the global id of 'PVTSSF_gone'",
+])
+def test_stale_id_error_invalidates_cache(tmp_path, status_error, write_board,
+                                          fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    _sync(path, fake_github())
+    write_board("## DOING\n*   [ ] A\n")
+
+    client = fake_github(status_error=status_error)
+    with pytest.raises(GitHubAPIError):
+        _sync(path, client)
+
+    assert client.metadata_calls == 0
+    assert "project_cache" not in _state(tmp_path)
+
+
+def test_unrelated_field_error_keeps_cache(tmp_path, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    _sync(path, fake_github())
+    write_board("## DOING\n*   [ ] A\n")
+
+    client = fake_github(
+        status_error="Field 'value' is missing required arguments: text",
+    )
+    with pytest.raises(GitHubAPIError):
+        _sync(path, client)
+
+    assert "project_cache" in _state(tmp_path)
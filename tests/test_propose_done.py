@@ -70,12 +70,12 @@ def test_propose_done_kanban_not_found(registered_tools, kanban_workspace):
 def test_propose_done_write_failed(registered_tools, kanban_workspace,
                                    monkeypatch):
     _seed_doing_task(kanban_workspace, "Task A")
-    import kanbanger.tools as tools_mod
+    import kanban_io
 
     def _boom(*_args, **_kwargs):
         raise OSError("disk full (simulated)")
 
-    monkeypatch.setattr(tools_mod, "atomic_write_text", _boom)
+    monkeypatch.setattr(kanban_io, "atomic_write_text", _boom)
     propose_done = registered_tools["propose_done"]
 
     result = json.loads(propose_done("Task A"))
@@ -0,0 +1,213 @@
+"""Tests for the GitHub rate-limit scheduler (P14).
+
+GitHubClient runs against a local HTTP stub that replays canned
+status codes and X-RateLimit / Retry-After headers; the limiter's sleep
+is captured instead of taken, so nothing here actually waits.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sync_kanban import (GitHubAPIError, GitHubClient, RateLimiter,
+                         rate_limiter_for)
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        status, headers, body = self.server.script.pop(0)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, str(value))
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def replay():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ReplayHandler)
+    server.script = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/graphql"
+    server.shutdown()
+    server.server_close()
+
+
+def _limiter(sleeps, **kwargs):
+    kwargs.setdefault("rate", 1000.0)
+    kwargs.setdefault("burst", 1000)
+    kwargs.setdefault("reserve", 0)
+    kwargs.setdefault("max_wait", 60.0)
+    return RateLimiter(sleep=sleeps.append, **kwargs)
+
+
+OK = (200, {}, {"data": {"ok": True}})
+
+
+def test_retry_after_is_honoured(replay, capsys):
+    server, url = replay
+    server.script = [(429, {"Retry-After": "7"}, {"message": "slow down"}), OK]
+    sleeps, err = [], io.StringIO()
+
+    with GitHubClient("tok", api_url=url, limiter=_limiter(sleeps)) as client:
+        client.err = err
+        assert client._query("q", {}) == {"data": {"ok": True}}
+
+    assert len(sleeps) == 1 and 6 < sleeps[0] <= 7
+    assert client.limiter.summary()["retries"] == 1
+    assert "Rate limited by GitHub" in err.getvalue()
+    assert capsys.readouterr().err == ""
+
+
+def test_secondary_limit_403_retried_but_plain_403_is_not(replay):
+    server, url = replay
+    server.script = [
+        (403, {}, {"message": "You have exceeded a secondary rate limit"}),
+        OK,
+        (403, {}, {"message": "Resource not accessible by integration"}),
+    ]
+    sleeps = []
+
+    with GitHubClient("tok", api_url=url, limiter=_limiter(sleeps)) as client:
+        client._query("q", {})
+        assert sleeps and sleeps[0] == pytest.approx(1.0, abs=0.1)
+        with pytest.raises(GitHubAPIError, match="status 403"):
+            client._query("q", {})
+
+    assert client.limiter.summary()["retries"] == 1
+
+
+def test_exhausted_budget_waits_for_reset(replay):
+    server, url = replay
+    reset = int(time.time()) + 5
+    server.script = [
+        (200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": reset},
+         {"data": {}}),
+        OK,
+    ]
+    sleeps = []
+
+    with GitHubClient("tok", api_url=url,
+                      limiter=_limiter(sleeps, reserve=10)) as client:
+        client._query("q", {})
+        client._query("q", {})
+
+    assert len(sleeps) == 1 and 3 < sleeps[0] <= 5
+
+
+def test_wait_beyond_max_raises(replay):
+    server, url = replay
+    server.script = [
+        (200, {"X-RateLimit-Remaining": "0",
+               "X-RateLimit-Reset": int(time.time()) + 3600}, {"data": {}}),
+    ]
+    sleeps = []
+
+    with GitHubClient("tok", api_url=url, limiter=_limiter(sleeps)) as client:
+        client._query("q", {})
+        with pytest.raises(GitHubAPIError, match="rate limit"):
+            client._query("q", {})
+    assert sleeps == []
+
+
+def test_token_bucket_paces_bursts():
+    sleeps = []
+    limiter = _limiter(sleeps, rate=10.0, burst=1)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(0.1, abs=0.02)
+    assert sleeps[1] == pytest.approx(0.2, abs=0.02)
+
+
+def test_query_cost_and_points_reported(replay):
+    server, url = replay
+    server.script = [
+        (200, {}, {"data": {"rateLimit": {
+            "cost": 2, "remaining": 4990, "resetAt": "2030-01-01T00:00:00Z"}}}),
+        (200, {}, {"data": {"rateLimit": {
+            "cost": 3, "remaining": 4987, "resetAt": "2030-01-01T00:00:00Z"}}}),
+    ]
+
+    with GitHubClient("tok", api_url=url, limiter=_limiter([])) as client:
+        client._query("q", {})
+        client._query("q", {})
+
+    summary = client.limiter.summary()
+    assert summary["query_cost"] == 5
+    assert summary["points_used"] == 3
+    assert summary["remaining"] == 4987
+
+
+def test_backoff_is_shared_between_limiters(tmp_path):
+    shared = str(tmp_path / "budget.json")
+    sleeps_a, sleeps_b = [], []
+    a = _limiter(sleeps_a, shared_path=shared)
+    b = _limiter(sleeps_b, shared_path=shared)
+
+    a.backoff(4.0)
+    b.acquire()
+
+    assert len(sleeps_b) == 1 and 3 < sleeps_b[0] <= 4
+
+
+@pytest.mark.parametrize("content", [
+    "[1, 2]",
+    '{"pause_until": "soon"}',
+    '{"pause_until": Infinity}',
+    '{"remaining": 5, "reset_at": "tomorrow"}',
+    '{"remaining": "5", "reset_at": 9999999999}',
+])
+def test_malformed_shared_file_is_ignored(tmp_path, content):
+    shared = tmp_path / "budget.json"
+    shared.write_text(content, encoding="utf-8")
+    sleeps = []
+    limiter = _limiter(sleeps, shared_path=str(shared))
+
+    limiter.acquire()
+
+    assert sleeps == [] and limiter.remaining is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership")
+def test_shared_file_of_another_user_is_ignored(tmp_path, monkeypatch):
+    shared = tmp_path / "budget.json"
+    shared.write_text(json.dumps({"pause_until": time.time() + 10 ** 6}),
+                      encoding="utf-8")
+    sleeps = []
+    limiter = _limiter(sleeps, shared_path=str(shared))
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(shared).st_uid + 1)
+
+    limiter.acquire()
+
+    assert sleeps == []
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_shared_file_is_per_user_and_private(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    limiter = rate_limiter_for(f"token-{tmp_path.name}")
+
+    limiter.backoff(1.0)
+
+    assert f"-{os.getuid()}-" in os.path.basename(limiter.shared_path)
+    assert os.stat(limiter.shared_path).st_mode & 0o777 == 0o600
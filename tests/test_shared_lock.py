@@ -0,0 +1,68 @@
+"""Tests for shared reader locks (P7)."""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+import pytest
+
+import kanban_io
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="msvcrt has no shared lock mode"
+)
+
+
+def _holds_within(fn, timeout=1.0) -> bool:
+    """Run fn on a thread; True if it finished within `timeout`."""
+    done = threading.Event()
+    t = threading.Thread(target=lambda: (fn(), done.set()), daemon=True)
+    t.start()
+    return done.wait(timeout)
+
+
+def test_readers_share_the_lock(kanban_workspace):
+    ws = str(kanban_workspace)
+    with kanban_io.kanban_lock(ws, shared=True):
+        assert _holds_within(
+            lambda: kanban_io.read_board(kanban_workspace / "_kanban.md")
+        )
+
+
+def test_writer_excludes_readers(kanban_workspace):
+    ws = str(kanban_workspace)
+    entered = threading.Event()
+
+    def reader():
+        with kanban_io.kanban_lock(ws, shared=True):
+            entered.set()
+
+    with kanban_io.kanban_lock(ws):
+        t = threading.Thread(target=reader, daemon=True)
+        t.start()
+        assert not entered.wait(0.2)
+    assert entered.wait(1.0)
+    t.join()
+
+
+def test_reader_excludes_writer(kanban_workspace):
+    ws = str(kanban_workspace)
+    entered = threading.Event()
+
+    def writer():
+        with kanban_io.kanban_lock(ws):
+            entered.set()
+
+    with kanban_io.kanban_lock(ws, shared=True):
+        t = threading.Thread(target=writer, daemon=True)
+        t.start()
+        assert not entered.wait(0.2)
+    assert entered.wait(1.0)
+    t.join()
+
+
+def test_read_board_of_missing_workspace_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        kanban_io.read_board(tmp_path / "nope" / "_kanban.md")
+    assert not (tmp_path / "nope").exists()
@@ -0,0 +1,94 @@
+"""Tests for the append-only sync state journal (P18)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import sync_kanban
+from sync_kanban import GitHubAPIError, LocalBoard, StateManager, Syncer
+
+
+def test_sync_rewrites_state_once(tmp_path, monkeypatch, write_board,
+                                  fake_github):
+    path = write_board([f"T{n}" for n in range(6)])
+    writes = []
+    real_write = sync_kanban.atomic_write_json
+    monkeypatch.setattr(sync_kanban, "atomic_write_json",
+                        lambda *a, **kw: (writes.append(a[0]), real_write(*a, **kw)))
+
+    Syncer(LocalBoard(path), StateManager(path), fake_github(), batch_size=2,
+           concurrency=1).sync("o/r")
+
+    assert len(writes) == 1
+    assert not (tmp_path / ".kanban.json.log").exists()
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert {t["status"] for t in state["tasks"].values()} == {"Todo"}
+
+
+def test_interrupted_sync_is_replayed_on_load(tmp_path, monkeypatch,
+                                              write_board, fake_github):
+    path = write_board(["A", "B"])
+    # Simulate a crash: journal appends happen, the final rewrite does not.
+    monkeypatch.setattr(StateManager, "save", lambda self: None)
+    Syncer(LocalBoard(path), StateManager(path), fake_github(),
+           concurrency=1).sync("o/r")
+    monkeypatch.undo()
+
+    journal = tmp_path / ".kanban.json.log"
+    assert journal.exists() and not (tmp_path / ".kanban.json").exists()
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"op":"set","title":"C"')  # torn final append
+
+    state = StateManager(path).load()
+
+    assert set(state["tasks"]) == {"A", "B"}
+    assert state["tasks"]["A"]["status"] == "Todo"
+
+
+def test_replay_applies_removals(tmp_path, write_board):
+    path = write_board([])
+    (tmp_path / ".kanban.json").write_text(json.dumps({
+        "schema_version": 1, "last_synced_digest": "x",
+        "tasks": {"A": {"item_id": "I1", "status": "Todo"}},
+    }), encoding="utf-8")
+    (tmp_path / ".kanban.json.log").write_text(
+        '{"op":"remove","title":"A"}\n'
+        '{"op":"set","title":"B","item_id":"I2","status":null}\n',
+        encoding="utf-8",
+    )
+
+    state = StateManager(path).load()
+
+    assert state["tasks"] == {"B": {"item_id": "I2", "status": None}}
+    assert "last_synced_digest" not in state
+
+
+def test_journal_compacts_past_threshold(tmp_path, monkeypatch, write_board):
+    path = write_board([])
+    monkeypatch.setenv("KANBANGER_STATE_JOURNAL_MAX_BYTES", "100")
+    manager = StateManager(path)
+    manager.load()
+
+    manager.update_task("A", "I1", None)
+    manager.flush()
+    assert (tmp_path / ".kanban.json.log").exists()
+    manager.update_task("A", "I1", "Todo")
+    manager.flush()
+
+    assert not (tmp_path / ".kanban.json.log").exists()
+    assert StateManager(path).load()["tasks"]["A"]["status"] == "Todo"
+
+
+def test_failed_sync_compacts_before_raising(tmp_path, write_board,
+                                             fake_github):
+    path = write_board(["A"])
+
+    with pytest.raises(GitHubAPIError):
+        Syncer(LocalBoard(path), StateManager(path),
+               fake_github(fail_kind="status"), concurrency=1).sync("o/r")
+
+    assert not (tmp_path / ".kanban.json.log").exists()
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert state["tasks"]["A"].items() >= {"item_id": "I1", "status": None}.items()
@@ -0,0 +1,104 @@
+"""Tests for rebuilding lost / corrupt sync state from the project (P24)."""
+
+from __future__ import annotations
+
+import io
+import json
+
+from sync_kanban import LocalBoard, StateManager, Syncer, run_sync
+
+MARKER = "<!-- kanbanger:task-id: a1b2c3d4e5f6 -->"
+
+
+def _item(item_id, title, status="Todo", body=""):
+    return {"id": item_id, "title": title, "body": body, "status": status}
+
+
+def _tasks(tmp_path):
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert "needs_rebuild" not in state
+    return state["tasks"]
+
+
+def test_corrupt_state_is_rebuilt_not_duplicated(tmp_path, capsys, write_board,
+                                                 fake_github):
+    path = write_board("## TODO\n*   [ ] A\n*   [ ] B\n## DOING\n*   [ ] C\n")
+    (tmp_path / ".kanban.json").write_text("{not json", encoding="utf-8")
+    client = fake_github(items=[_item("I1", "A"), _item("I2", "C"),
+                             _item("I9", "Unrelated")])
+
+    result = Syncer(LocalBoard(path), StateManager(path), client).sync("o/r")
+
+    assert (result.created, result.updated, result.archived) == (1, 1, 0)
+    assert sorted(client.kinds) == ["create", "status", "status"]
+    tasks = _tasks(tmp_path)
+    assert tasks["A"]["item_id"] == "I1"
+    assert tasks["C"].items() >= {"item_id": "I2", "status": "InProgress"}.items()
+    assert "Rebuilding sync state" in capsys.readouterr().out
+
+
+def test_rebuild_replaces_existing_entries_and_stops_early(tmp_path,
+                                                           write_board,
+                                                           fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    (tmp_path / ".kanban.json").write_text(json.dumps({"tasks": {
+        "A": {"item_id": "stale", "status": "Done"},
+        "Gone": {"item_id": "I7", "status": "Todo"},
+    }}), encoding="utf-8")
+    client = fake_github(items=[_item("I1", "A"), _item("I2", "Other")])
+
+    run_sync(path, "o/r", client=client, rebuild_state=True, out=io.StringIO())
+
+    tasks = _tasks(tmp_path)
+    assert set(tasks) == {"A"}
+    assert tasks["A"].items() >= {"item_id": "I1", "status": "Todo"}.items()
+    assert client.kinds == []
+    assert client.scanned == 1
+
+
+def test_rebuild_matches_task_id_across_a_rename(tmp_path, write_board,
+                                                 fake_github):
+    path = write_board(f"## TODO\n*   [ ] New title {MARKER}\n")
+    client = fake_github(items=[_item("I1", "Old title", body=MARKER)])
+
+    result = run_sync(path, "o/r", client=client, rebuild_state=True,
+                      out=io.StringIO())
+
+    assert (result.renamed, result.created) == (1, 0)
+    assert client.kinds == ["title"]
+    assert _tasks(tmp_path)["New title"]["item_id"] == "I1"
+
+
+def test_created_drafts_carry_the_task_id(write_board, fake_github):
+    path = write_board(f"## TODO\n*   [ ] Keyed {MARKER}\n")
+    client = fake_github()
+
+    run_sync(path, "o/r", client=client, out=io.StringIO())
+
+    assert MARKER in client.bodies[0] and "kanbanger:op-id" in client.bodies[0]
+
+
+def test_dry_run_reports_a_pending_rebuild(tmp_path, write_board):
+    path = write_board("## TODO\n*   [ ] A\n")
+    (tmp_path / ".kanban.json").write_text("{not json", encoding="utf-8")
+    out = io.StringIO()
+
+    plan = run_sync(path, "o/r", dry_run=True, out=out, err=io.StringIO()).plan
+
+    assert plan.rebuild_scan and [op.kind for op in plan.operations] == ["create"]
+    assert plan.estimate()["query_requests"] == 2
+    assert "Rebuild:" in out.getvalue()
+
+
+def test_rebuild_matches_drafts_titled_with_the_full_task_text(tmp_path,
+                                                               write_board,
+                                                               fake_github):
+    path = write_board("## TODO\n*   [ ] Ship it - soon\n")
+    client = fake_github(items=[_item("I1", "Ship it - soon")])
+
+    result = run_sync(path, "o/r", client=client, rebuild_state=True,
+                      out=io.StringIO())
+
+    assert (result.edited, result.created) == (1, 0)
+    assert client.kinds == ["title"]
+    assert _tasks(tmp_path)["Ship it"]["item_id"] == "I1"
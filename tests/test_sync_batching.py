@@ -0,0 +1,184 @@
+"""Tests for aliased mutation batching in sync_kanban (P12)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import sync_kanban
+from sync_kanban import (
+    GitHubAPIError,
+    GitHubClient,
+    LocalBoard,
+    RateLimiter,
+    StateManager,
+    Syncer,
+)
+
+
+class _RecordingClient(GitHubClient):
+    """GitHubClient whose transport is a canned-response function."""
+
+    def __init__(self, respond):
+        super().__init__("tok", limiter=RateLimiter(rate=1000, burst=1000,
+                                                    reserve=0))
+        self.respond = respond
+        self.documents = []
+
+    def _post(self, query, variables):
+        self.documents.append((query, variables))
+        return self.respond(query, variables)
+
+
+def test_mutate_batch_builds_aliased_document_and_maps_results():
+    def respond(query, variables):
+        return {"data": {
+            "m0": {"projectItem": {"id": "I0"}},
+            "m1": {"projectV2Item": {"id": "I1"}},
+            "m2": {"item": {"id": "I2"}},
+        }}
+
+    client = _RecordingClient(respond)
+    outcomes = client.mutate_batch([
+        ("create", {"projectId": "P", "title": "A"}),
+        ("status", {"projectId": "P", "itemId": "I1", "fieldId": "F",
+                    "optionId": "O"}),
+        ("archive", {"projectId": "P", "itemId": "I2"}),
+    ])
+
+    assert outcomes == [("I0", None), ("I1", None), ("I2", None)]
+    (document, variables), = client.documents
+    assert "m0: addProjectV2DraftIssue(input: {projectId: $m0_projectId" in document
+    assert "value: {singleSelectOptionId: $m1_optionId}" in document
+    assert "m2: archiveProjectV2Item" in document
+    assert variables["m0_title"] == "A" and variables["m0_body"] is None
+
+
+def test_mutate_batch_reports_errors_per_alias():
+    def respond(query, variables):
+        return {
+            "data": {"m0": None, "m1": {"item": {"id": "I1"}}},
+            "errors": [{"path": ["m0"], "message": "not allowed"}],
+        }
+
+    client = _RecordingClient(respond)
+    outcomes = client.mutate_batch([
+        ("archive", {"projectId": "P", "itemId": "I0"}),
+        ("archive", {"projectId": "P", "itemId": "I1"}),
+    ])
+
+    assert outcomes == [(None, "not allowed"), ("I1", None)]
+
+
+def test_mutate_batch_raises_on_document_level_error():
+    client = _RecordingClient(
+        lambda q, v: {"errors": [{"message": "Parse error"}]}
+    )
+
+    with pytest.raises(GitHubAPIError, match="Parse error"):
+        client.mutate_batch([("archive", {"projectId": "P", "itemId": "I"})])
+
+
+def test_sync_creates_in_batches(tmp_path, write_board, fake_github):
+    path = write_board([f"T{n}" for n in range(7)])
+    client = fake_github()
+
+    Syncer(LocalBoard(path), StateManager(path), client, batch_size=3,
+           concurrency=1).sync("o/r")
+
+    assert client.batches == [["create"] * 3, ["create"] * 3, ["create"],
+                              ["status"] * 3, ["status"] * 3, ["status"]]
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert {t["status"] for t in state["tasks"].values()} == {"Todo"}
+
+
+def test_sync_archives_in_one_batch_and_reports_partial_failures(tmp_path,
+                                                                 write_board,
+                                                                 fake_github):
+    path = write_board(["Keep", "Gone1", "Gone2"])
+    client = fake_github()
+    Syncer(LocalBoard(path), StateManager(path), client).sync("o/r")
+
+    write_board(["Keep", "New"])
+    client = fake_github(fail_titles={"New"})
+    with pytest.raises(GitHubAPIError, match="create 'New': boom"):
+        Syncer(LocalBoard(path), StateManager(path), client,
+               concurrency=1).sync("o/r")
+
+    assert client.batches == [["create"], ["archive", "archive"]]
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert set(state["tasks"]) == {"Keep"}
+
+
+def test_batch_size_from_env(monkeypatch, write_board):
+    monkeypatch.setenv(sync_kanban.SYNC_BATCH_SIZE_ENV, "7")
+    path = write_board([])
+
+    assert Syncer(LocalBoard(path), StateManager(path), None).batch_size == 7
+
+
+@pytest.mark.parametrize("message", [
+    "2 GitHub operation(s) failed; state saved for everything that succeeded",
+    "GitHub API request timed out (connect/read timeouts 10s/30s)",
+    "Could not reach GitHub API: refused",
+    "GitHub rate limit: points budget at 3 (reserve 50); next request "
+    "allowed in 900s",
+])
+def test_new_sync_failures_classify_as_github_api(message):
+    from kanbanger.tools import ERROR_GITHUB_API, _classify_sync_stderr
+
+    assert _classify_sync_stderr(f"Error: {message}\n") == ERROR_GITHUB_API
+
+
+def test_independent_batches_run_concurrently(tmp_path, write_board,
+                                              fake_github):
+    path = write_board(["Keep"] + [f"Gone{n}" for n in range(4)])
+    Syncer(LocalBoard(path), StateManager(path), fake_github()).sync("o/r")
+    write_board(["Keep"] + [f"New{n}" for n in range(4)])
+
+    client = fake_github(delay=0.05)
+    Syncer(LocalBoard(path), StateManager(path), client, batch_size=1,
+           concurrency=8).sync("o/r")
+
+    assert client.max_in_flight >= 4
+    # Every created item's status update follows its create.
+    created = [item for kind, item in client.log if kind == "create"]
+    for item in created:
+        assert client.log.index(("create", item)) < client.log.index(
+            ("status", item))
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert set(state["tasks"]) == {"Keep"} | {f"New{n}" for n in range(4)}
+    assert {t["status"] for t in state["tasks"].values()} == {"Todo"}
+
+
+def test_document_level_error_stops_new_work_and_reraises(tmp_path,
+                                                          write_board,
+                                                          fake_github):
+    path = write_board(["A", "B"])
+
+    class _Failing(fake_github):
+        def mutate_batch(self, ops):
+            if ops[0][1].get("title") == "B":
+                raise GitHubAPIError("GitHub API returned status 502: bad")
+            return super().mutate_batch(ops)
+
+    client = _Failing()
+    with pytest.raises(GitHubAPIError, match="502"):
+        Syncer(LocalBoard(path), StateManager(path), client, batch_size=1,
+               concurrency=2).sync("o/r")
+
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert set(state["tasks"]) == {"A"}
+
+
+def test_sync_does_not_paginate_remote_items(monkeypatch, write_board,
+                                             fake_github):
+    path = write_board(["A"])
+    client = fake_github()
+    monkeypatch.setattr(client, "get_project_items",
+                        lambda project_id: pytest.fail("remote items fetched"))
+
+    Syncer(LocalBoard(path), StateManager(path), client).sync("o/r")
+
+    assert client.batches
@@ -0,0 +1,194 @@
+"""Tests for the in-process sync engine behind sync_to_github (P19)."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+import sync_kanban
+from kanbanger import tools
+from sync_kanban import LocalBoard, StateManager, SyncCancelled, Syncer
+
+
+@pytest.fixture
+def engine(kanban_workspace, fake_github, monkeypatch):
+    for name in ("GITHUB_PROJECT_NUMBER", "KANBANGER_SYNC_MODE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("GITHUB_TOKEN", "tok")
+    monkeypatch.setenv("GITHUB_REPO", "o/r")
+    client = fake_github(options=("Backlog", "Todo", "InProgress", "Review",
+                                  "Done"))
+    monkeypatch.setattr(sync_kanban, "github_client_for", lambda token, **kwargs: client)
+    return client
+
+
+def _state(workspace):
+    return json.loads((workspace / ".kanban.json").read_text(encoding="utf-8"))
+
+
+def test_sync_runs_in_process_on_warm_client(engine, kanban_workspace,
+                                             registered_tools, write_board):
+    write_board(["A", "B"])
+
+    first = registered_tools["sync_to_github"]()
+    second = registered_tools["sync_to_github"]()
+
+    assert first.startswith("Sync complete:")
+    assert "[CREATE] A => Todo" in first
+    assert "Up to date" in second
+    assert engine.resets == 2
+    assert set(_state(kanban_workspace)["tasks"]) == {"A", "B"}
+
+
+def test_dry_run_needs_no_client(engine, kanban_workspace, registered_tools,
+                                 monkeypatch, write_board):
+    monkeypatch.setattr(sync_kanban, "github_client_for",
+                        lambda token, **kwargs: pytest.fail("client requested"))
+    write_board(["A"])
+
+    result = json.loads(registered_tools["sync_to_github"](dry_run=True))
+
+    assert result["plan"]["counts"]["create"] == 1
+
+
+def test_typed_errors_keep_their_codes(engine, kanban_workspace,
+                                       registered_tools, write_board):
+    engine.missing_project = True
+    write_board(["A"])
+
+    result = json.loads(registered_tools["sync_to_github"]())
+
+    assert result["error_code"] == tools.ERROR_PROJECT_NOT_FOUND
+    assert "Project #None not found" in result["message"]
+
+
+def test_workspace_env_file_supplies_config(engine, kanban_workspace,
+                                            registered_tools, monkeypatch,
+                                            write_board):
+    monkeypatch.delenv("GITHUB_REPO")
+    (kanban_workspace / ".env").write_text("GITHUB_REPO=o/from-env\n",
+                                           encoding="utf-8")
+    write_board(["A"])
+
+    out = registered_tools["sync_to_github"]()
+
+    assert "Connecting to GitHub repository o/from-env" in out
+    assert "GITHUB_REPO" not in os.environ
+
+
+def test_workspace_env_file_supplies_sync_knobs(engine, kanban_workspace,
+                                                registered_tools, monkeypatch,
+                                                write_board):
+    seen = {}
+    monkeypatch.setattr(sync_kanban, "github_client_for",
+                        lambda token, env=None: seen.update(env=env) or engine)
+    in_process = tools._sync_in_process
+    monkeypatch.setattr(
+        tools, "_sync_in_process",
+        lambda *a: seen.update(timeout=a[4]) or in_process(*a))
+    (kanban_workspace / ".env").write_text(
+        "KANBANGER_SYNC_BATCH_SIZE=2\nKANBANGER_HTTP_READ_TIMEOUT_SEC=5\n"
+        "KANBANGER_SYNC_TIMEOUT_SEC=7\n",
+        encoding="utf-8")
+    write_board(["A", "B", "C"])
+
+    registered_tools["sync_to_github"]()
+
+    # Three creates, then their three status updates.
+    assert [len(batch) for batch in engine.batches] == [2, 1, 2, 1]
+    assert seen["env"]["KANBANGER_HTTP_READ_TIMEOUT_SEC"] == "5"
+    assert seen["timeout"] == 7
+    assert "KANBANGER_SYNC_BATCH_SIZE" not in os.environ
+
+
+def test_warm_client_follows_each_runs_env(monkeypatch):
+    monkeypatch.setattr(sync_kanban, "_CLIENTS", {})
+    monkeypatch.setattr(sync_kanban, "_LIMITERS", {})
+    client = sync_kanban.github_client_for(
+        "tok", env={"KANBANGER_HTTP_READ_TIMEOUT_SEC": "5",
+                    "KANBANGER_GITHUB_MAX_RPS": "2"})
+    try:
+        assert (client.timeout[1], client.limiter.rate) == (5.0, 2.0)
+        sync_kanban.github_client_for(
+            "tok", env={"KANBANGER_HTTP_READ_TIMEOUT_SEC": "9"})
+        assert client.timeout[1] == 9.0
+        assert client.limiter.rate == sync_kanban.DEFAULT_MAX_RPS
+    finally:
+        client.close()
+
+
+def test_board_lock_timeout_is_a_typed_error(engine, kanban_workspace,
+                                             registered_tools, monkeypatch,
+                                             write_board):
+    def locked(path):
+        raise tools.LockTimeoutError(str(kanban_workspace), 0.5)
+
+    monkeypatch.setattr(sync_kanban, "read_board", locked)
+    write_board(["A"])
+
+    result = json.loads(registered_tools["sync_to_github"]())
+
+    assert result["error_code"] == tools.ERROR_LOCK_TIMEOUT
+
+
+def test_timeout_cancels_and_keeps_landed_state(engine, kanban_workspace,
+                                                registered_tools, monkeypatch,
+                                                write_board):
+    engine.delay = 0.2
+    monkeypatch.setenv("KANBANGER_SYNC_TIMEOUT_SEC", "1")
+    monkeypatch.setenv("KANBANGER_SYNC_BATCH_SIZE", "1")
+    monkeypatch.setenv("KANBANGER_SYNC_CONCURRENCY", "1")
+    write_board([f"T{n}" for n in range(20)])
+
+    result = json.loads(registered_tools["sync_to_github"]())
+
+    assert result["error_code"] == tools.ERROR_SYNC_TIMEOUT
+    assert tools._SYNC_ENGINE_LOCK.acquire(timeout=5)
+    tools._SYNC_ENGINE_LOCK.release()
+    assert 0 < len(_state(kanban_workspace)["tasks"]) < 20
+
+
+def test_cancelled_syncer_stops_before_github(write_board, fake_github):
+    path = write_board(["A"])
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(SyncCancelled):
+        Syncer(LocalBoard(path), StateManager(path),
+               fake_github(missing_project=True), cancel=cancel).sync("o/r")
+
+
+@pytest.mark.parametrize("from_env_file", [False, True])
+def test_subprocess_mode_is_kept(engine, kanban_workspace, registered_tools,
+                                 monkeypatch, write_board, from_env_file):
+    if from_env_file:
+        (kanban_workspace / ".env").write_text(
+            "KANBANGER_SYNC_MODE=subprocess\n", encoding="utf-8")
+    else:
+        monkeypatch.setenv("KANBANGER_SYNC_MODE", "subprocess")
+    # The child runs from the workspace; make the source tree importable.
+    monkeypatch.setenv("PYTHONPATH", str(Path(sync_kanban.__file__).parent))
+    monkeypatch.setattr(tools, "_sync_in_process",
+                        lambda *a: pytest.fail("ran in process"))
+    write_board(["A"])
+
+    result = json.loads(registered_tools["sync_to_github"](dry_run=True))
+
+    assert result["dry_run"] is True
+    assert result["plan"]["operations"][0]["title"] == "A"
+
+
+def test_github_client_for_is_shared_per_token(monkeypatch):
+    monkeypatch.setattr(sync_kanban, "_CLIENTS", {})
+    monkeypatch.setattr(sync_kanban, "_LIMITERS", {})
+    client = sync_kanban.github_client_for("tok")
+    try:
+        assert sync_kanban.github_client_for("tok") is client
+        assert sync_kanban.github_client_for("other") is not client
+    finally:
+        for shared in sync_kanban._CLIENTS.values():
+            shared.close()
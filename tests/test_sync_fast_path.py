@@ -0,0 +1,68 @@
+"""Tests for the unchanged-board sync fast path (P15)."""
+
+from __future__ import annotations
+
+import json
+
+from sync_kanban import LocalBoard, StateManager, Syncer
+
+
+def _sync(path, client, **kwargs):
+    Syncer(LocalBoard(path), StateManager(path), client).sync("o/r", **kwargs)
+
+
+def test_unchanged_board_skips_github(capsys, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    _sync(path, fake_github())
+
+    client = fake_github()
+    _sync(path, client)
+
+    assert client.calls == 0
+    assert "Up to date" in capsys.readouterr().out
+
+
+def test_layout_only_edit_is_still_a_no_op(write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n*   [ ] B\n")
+    _sync(path, fake_github())
+    write_board("# Board\n\n## TODO\n\n*   [ ] B\n*   [ ] A\n")
+
+    client = fake_github()
+    _sync(path, client)
+
+    assert client.calls == 0
+
+
+def test_changes_target_or_force_hit_github(write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    _sync(path, fake_github())
+
+    moved = fake_github()
+    write_board("## DOING\n*   [ ] A\n")
+    _sync(path, moved)
+    assert moved.calls > 0
+
+    other_project = fake_github()
+    _sync(path, other_project, project_number=2)
+    assert other_project.calls > 0
+
+    forced = fake_github()
+    _sync(path, forced, project_number=2, force=True)
+    assert forced.calls > 0
+
+
+def test_incomplete_sync_does_not_arm_fast_path(tmp_path, write_board,
+                                                fake_github):
+    path = write_board("## TODO\n*   [ ] A\n*   [ ] B\n")
+    try:
+        _sync(path, fake_github(fail_titles={"B"}))
+    except Exception:
+        pass
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert "last_synced_digest" not in state
+
+    # Missing Status option: item created without status -> not armed.
+    write_board("## REVIEW\n*   [ ] C\n")
+    _sync(path, fake_github())
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    assert "last_synced_digest" not in state
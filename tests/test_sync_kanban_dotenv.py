@@ -129,9 +129,9 @@ def test_dotenv_find_usecwd_beats_rogue_parent_env(tmp_path: Path):
     Strategy: spawn a subprocess whose CWD is a child tempdir
     containing `.env` (the "target project"), with the actual
     `sync_kanban` source dir copied beneath a rogue ancestor `.env`.
-    Import sync_kanban (which triggers its module-load `.env`
-    discovery code path) and read back the key. The CWD `.env` must
-    win. This fails on the pre-patch code (which called
+    Import sync_kanban, run its CLI `.env` discovery (`_load_dotenv`,
+    called first thing in main() since P19 moved it off import) and
+    read back the key. The CWD `.env` must win. This fails on the pre-patch code (which called
     `load_dotenv(override=True)` without `find_dotenv(usecwd=True)`)
     and passes after.
     """
@@ -176,9 +176,9 @@ def test_dotenv_find_usecwd_beats_rogue_parent_env(tmp_path: Path):
         "KANBANGER_CWD_TEST=tempdir_value\n", encoding="utf-8"
     )
 
-    # Probe imports the sandboxed sync_kanban and prints the resulting
-    # env var. Importing sync_kanban triggers its module-load `.env`
-    # discovery — that's the code path under test.
+    # Probe imports the sandboxed sync_kanban, runs its `.env`
+    # discovery and prints the resulting env var — that's the code
+    # path under test.
     #
     # CRITICAL: the probe must be a real .py file, not a `-c` string.
     # python-dotenv's find_dotenv() treats `-c` invocations as
@@ -193,7 +193,9 @@ def test_dotenv_find_usecwd_beats_rogue_parent_env(tmp_path: Path):
             """
             import os, sys
             sys.path.insert(0, r"{src}")
-            import sync_kanban  # noqa: F401  (import has the side effect)
+            import sync_kanban
+            assert "KANBANGER_CWD_TEST" not in os.environ  # import is inert
+            sync_kanban._load_dotenv()
             print(os.environ.get("KANBANGER_CWD_TEST", "<unset>"))
             """
         ).lstrip().format(src=str(sandboxed_src)),
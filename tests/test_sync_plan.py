@@ -0,0 +1,104 @@
+"""Tests for the sync planner and cost-estimating dry run (P21)."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import sync_kanban
+from sync_kanban import (
+    LocalBoard,
+    StateManager,
+    Syncer,
+    build_plan,
+    run_sync,
+)
+
+
+def _state(path, tasks):
+    manager = StateManager(path)
+    manager.load()
+    for title, (item_id, status) in tasks.items():
+        manager.update_task(title, item_id, status)
+    return manager
+
+
+def test_plan_diffs_board_against_state(write_board):
+    path = write_board("## TODO\n*   [ ] A\n*   [ ] B\n## DONE\n*   [x] C\n")
+    state = _state(path, {"B": ("IB", "Todo"), "C": ("IC", "Todo"),
+                          "Gone": ("IG", "Done")})
+    local = {"A": "Todo", "B": "Todo", "C": "Done"}
+
+    plan = build_plan("o/r", None, local, state, {"Todo": "t"}, 25, 4)
+
+    assert [(op.kind, op.title) for op in plan.operations] == [
+        ("create", "A"), ("noop", "B"), ("update", "C"), ("archive", "Gone")]
+    update = plan.updates[0]
+    assert (update.previous_status, update.status, update.item_id) == \
+        ("Todo", "Done", "IC")
+    assert update.status_available is False
+
+
+def test_estimate_matches_executed_batches(write_board, fake_github):
+    titles = [f"T{n}" for n in range(7)]
+    path = write_board("## TODO\n" + "".join(f"*   [ ] {t}\n" for t in titles))
+    client = fake_github()
+
+    plan = Syncer(LocalBoard(path), StateManager(path), client, batch_size=3,
+                  concurrency=2).plan("o/r")
+    Syncer(LocalBoard(path), StateManager(path), client, batch_size=3,
+           concurrency=1).sync("o/r")
+
+    estimate = plan.estimate()
+    assert estimate["mutation_requests"] == len(client.batches) == 6
+    assert estimate["query_requests"] == 1
+    assert estimate["mutations"] == 14
+    assert estimate["rounds"] == 3
+    assert estimate["secondary_points"] == 1 + 6 * 5
+
+
+def test_dry_run_uses_cached_metadata_and_writes_nothing(tmp_path, write_board,
+                                                         fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    Syncer(LocalBoard(path), StateManager(path), fake_github()).sync("o/r")
+    before = (tmp_path / ".kanban.json").read_bytes()
+    write_board("## DONE\n*   [x] A\n*   [ ] B\n")
+    out = io.StringIO()
+
+    result = run_sync(path, "o/r", dry_run=True, out=out, json_plan=True,
+                      err=io.StringIO())
+
+    plan = json.loads(out.getvalue())
+    assert plan["metadata_cached"] is True
+    assert plan["counts"] == {"create": 1, "update": 1, "rename": 0,
+                              "edit": 0, "archive": 0, "noop": 0}
+    assert plan["estimate"]["query_requests"] == 0
+    assert result.plan.to_dict() == plan
+    assert (tmp_path / ".kanban.json").read_bytes() == before
+
+
+def test_dry_run_of_synced_board_costs_nothing(write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    Syncer(LocalBoard(path), StateManager(path), fake_github()).sync("o/r")
+    out = io.StringIO()
+
+    result = run_sync(path, "o/r", dry_run=True, out=out)
+
+    assert result.plan.up_to_date
+    assert result.plan.estimate()["requests"] == 0
+    assert "Up to date" in out.getvalue()
+    assert "Estimate: 0 GitHub request(s)" in out.getvalue()
+
+
+def test_executor_skips_unavailable_status(capsys, write_board, fake_github):
+    path = write_board("## TODO\n*   [ ] A\n")
+    client = fake_github()
+    sync = Syncer(LocalBoard(path), StateManager(path), client, concurrency=1)
+    sync.sync("o/r")
+    write_board("## REVIEW\n*   [ ] A\n")
+    client.batches.clear()
+    sync_kanban.Syncer(LocalBoard(path), StateManager(path), client).sync(
+        "o/r", force=True)
+
+    assert client.batches == []
+    assert "no matching Status option" in capsys.readouterr().err
@@ -0,0 +1,102 @@
+"""Tests for checkpointed, resumable sync runs (P20)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from sync_kanban import GitHubAPIError, LocalBoard, StateManager, Syncer
+
+
+def _sync(path, client):
+    Syncer(LocalBoard(path), StateManager(path), client,
+           concurrency=1).sync("o/r")
+
+
+def _state(tmp_path):
+    return json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+
+
+def test_lost_create_is_adopted_not_duplicated(tmp_path, capsys, write_board,
+                                               fake_github):
+    path = write_board(["A", "B"])
+    remote = fake_github(lose_reply=True)
+    with pytest.raises(GitHubAPIError):
+        _sync(path, remote)
+    assert set(_state(tmp_path)["in_flight"]) == {"A", "B"}
+
+    remote.lose_reply = False
+    _sync(path, remote)
+
+    assert remote.creates == 2
+    state = _state(tmp_path)
+    assert "in_flight" not in state
+    assert state["tasks"]["A"].items() >= {"item_id": "I1", "status": "Todo"}.items()
+    assert "[ADOPT] B" in capsys.readouterr().out
+
+
+def test_create_body_carries_op_marker(write_board, fake_github):
+    path = write_board(["A"])
+    remote = fake_github()
+
+    _sync(path, remote)
+
+    assert remote.items[0]["body"].startswith("<!-- kanbanger:op-id: ")
+
+
+def test_missing_in_flight_create_is_recreated(tmp_path, write_board,
+                                               fake_github):
+    path = write_board(["A"])
+    state = StateManager(path)
+    state.load()
+    state.mark_in_flight("A", "0" * 32)
+    state.save()
+    remote = fake_github(items=[
+        {"id": f"OLD{n}", "title": f"Old {n}", "body": "", "status": "Done"}
+        for n in range(3)])
+
+    _sync(path, remote)
+
+    assert remote.creates == 1
+    assert remote.scanned == 3
+    assert _state(tmp_path)["tasks"]["A"]["item_id"] == "I1"
+
+
+def test_scan_stops_once_everything_is_found(write_board, fake_github):
+    path = write_board(["A"])
+    remote = fake_github(lose_reply=True)
+    with pytest.raises(GitHubAPIError):
+        _sync(path, remote)
+    remote.items += [{"id": f"X{n}", "title": "x", "body": "", "status": None}
+                     for n in range(50)]
+    remote.lose_reply = False
+
+    _sync(path, remote)
+
+    assert remote.scanned == 1
+
+
+def test_rejected_create_is_not_left_in_flight(tmp_path, write_board,
+                                               fake_github):
+    path = write_board(["A"])
+
+    with pytest.raises(GitHubAPIError):
+        _sync(path, fake_github(reject=True))
+
+    assert "in_flight" not in _state(tmp_path)
+
+
+def test_intent_records_replay_from_journal(tmp_path, write_board):
+    path = write_board([])
+    (tmp_path / ".kanban.json.log").write_text(
+        '{"op":"intent","title":"A","op_id":"' + "a" * 32 + '"}\n'
+        '{"op":"intent","title":"B","op_id":"' + "b" * 32 + '"}\n'
+        '{"op":"set","title":"B","item_id":"I2","status":null}\n',
+        encoding="utf-8",
+    )
+
+    manager = StateManager(path)
+    manager.load()
+
+    assert manager.in_flight() == {"A": "a" * 32}
@@ -0,0 +1,134 @@
+"""Tests for opt-in task-id markers and rename-in-place sync (P23)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from kanban_io import Board, format_task_id_marker, split_task_id
+from sync_kanban import LocalBoard, StateManager, Syncer
+
+MARKER = format_task_id_marker("a1b2c3d4e5f6")
+
+
+def _sync(path, client):
+    return Syncer(LocalBoard(path), StateManager(path), client).sync("o/r")
+
+
+def _tasks(tmp_path):
+    state = json.loads((tmp_path / ".kanban.json").read_text(encoding="utf-8"))
+    return state["tasks"]
+
+
+def test_parser_strips_marker():
+    board = Board.parse(f"## TODO\n*   [ ] Ship it - soon {MARKER}\n")
+
+    record = board.tasks[0]
+    assert (record.title, record.description, record.task_id) == \
+        ("Ship it", "soon", "a1b2c3d4e5f6")
+    assert split_task_id("*   [ ] Plain") == ("*   [ ] Plain", None)
+
+
+def test_board_copy_keeps_task_ids():
+    board = Board.parse(f"## TODO\n*   [ ] Keyed {MARKER}\n*   [ ] Plain\n")
+
+    clone = board.copy()
+
+    assert [record.task_id for record in clone.tasks] == ["a1b2c3d4e5f6", None]
+    assert clone.find("Keyed").task_id == "a1b2c3d4e5f6"
+
+
+def test_add_task_mints_ids_only_when_enabled(kanban_workspace, registered_tools,
+                                              monkeypatch):
+    registered_tools["add_task"]("Plain")
+    monkeypatch.setenv("KANBANGER_TASK_IDS", "1")
+    registered_tools["add_task"]("Keyed", description="details")
+    registered_tools["move_task"]("Keyed", "TODO", "DOING")
+
+    board = Board.parse((kanban_workspace / "_kanban.md").read_text(encoding="utf-8"))
+    ids = {record.title: record.task_id for record in board.tasks}
+    assert ids["Plain"] is None
+    assert len(ids["Keyed"]) == 12
+    assert board.find("Keyed").column == "DOING"
+
+
+def test_add_task_rejects_pasted_marker(kanban_workspace, registered_tools):
+    result = json.loads(registered_tools["add_task"]("Spoof", description=MARKER))
+
+    assert result["error_code"] == "invalid_title"
+
+
+def test_rename_updates_title_in_place(tmp_path, write_board, fake_github):
+    path = write_board(f"## TODO\n*   [ ] Old name {MARKER}\n")
+    client = fake_github()
+    _sync(path, client)
+    item_id = _tasks(tmp_path)["Old name"]["item_id"]
+
+    write_board(f"## DOING\n*   [ ] New name - more {MARKER}\n")
+    client.sent.clear()
+    result = _sync(path, client)
+
+    assert (result.renamed, result.created, result.archived) == (1, 0, 0)
+    assert client.kinds == ["title", "status"]
+    tasks = _tasks(tmp_path)
+    assert set(tasks) == {"New name"}
+    assert tasks["New name"].items() >= {
+        "item_id": item_id, "status": "InProgress",
+        "task_id": "a1b2c3d4e5f6", "draft_id": f"DI-{item_id}",
+    }.items()
+
+    write_board(f"## DOING\n*   [ ] Third name {MARKER}\n")
+    _sync(path, client)
+    assert client.lookups == [[item_id]]  # draft id cached after the first
+
+
+def test_entries_synced_before_markers_adopt_ids(tmp_path, write_board,
+                                                 fake_github):
+    path = write_board("## TODO\n*   [ ] Legacy\n")
+    client = fake_github()
+    _sync(path, client)
+
+    write_board(f"## TODO\n*   [ ] Legacy {MARKER}\n")
+    assert _sync(path, client).up_to_date is False
+    assert _tasks(tmp_path)["Legacy"]["task_id"] == "a1b2c3d4e5f6"
+
+    write_board(f"## TODO\n*   [ ] Renamed {MARKER}\n")
+    client.sent.clear()
+    _sync(path, client)
+    assert client.kinds == ["title"]
+
+
+def test_non_draft_item_is_rekeyed_with_warning(tmp_path, capsys, write_board,
+                                                fake_github):
+    path = write_board(f"## TODO\n*   [ ] Old {MARKER}\n")
+    client = fake_github(drafts=False)
+    _sync(path, client)
+
+    write_board(f"## TODO\n*   [ ] New {MARKER}\n")
+    client.sent.clear()
+    _sync(path, client)
+
+    assert client.kinds == []
+    assert set(_tasks(tmp_path)) == {"New"}
+    assert "no longer a draft issue" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("draft_id, lookups", [(None, 1), ("DI-1", 0)])
+def test_plan_estimates_renames(tmp_path, draft_id, lookups, write_board,
+                                fake_github):
+    path = write_board(f"## TODO\n*   [ ] New {MARKER}\n")
+    entry = {"item_id": "I1", "status": "Todo", "task_id": "a1b2c3d4e5f6"}
+    if draft_id:
+        entry["draft_id"] = draft_id
+    (tmp_path / ".kanban.json").write_text(json.dumps({"tasks": {"Old": entry}}),
+                                           encoding="utf-8")
+
+    plan = Syncer(LocalBoard(path), StateManager(path),
+                  fake_github()).plan("o/r")
+
+    assert [(op.kind, op.previous_title) for op in plan.operations] == \
+        [("rename", "Old")]
+    estimate = plan.estimate()
+    assert estimate["mutations"] == 1
+    assert estimate["query_requests"] == 1 + lookups  # metadata + lookup